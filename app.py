@@ -8,25 +8,248 @@ Provides REST API endpoints for:
 - Rules of thumb evaluation
 """
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory
 from flask_cors import CORS
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
+import hashlib
 import os
 
-from stock_screener import StockScreener
-from stock_screener.strategies import (
-    ValueStrategy,
-    GrowthStrategy,
-    DividendStrategy,
-    QualityStrategy,
-    MomentumStrategy,
-    GARPStrategy,
-    SCREENING_PROFILES
-)
+# orjson has no PyPy support (it needs CPython internals), so the PyPy
+# image runs on the stdlib encoder instead; everything funnels through
+# _dumps so the call sites don't care which one is present
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    def _dumps(payload):
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+else:
+    import json as _json
+
+    def _np_default(obj):
+        # Mirror OPT_SERIALIZE_NUMPY: numpy scalars unbox via .item()
+        if hasattr(obj, 'item'):
+            return obj.item()
+        raise TypeError(
+            f"Object of type {type(obj).__name__} is not JSON serializable"
+        )
+
+    def _dumps(payload):
+        return _json.dumps(payload, default=_np_default).encode()
 
 app = Flask(__name__, static_folder='static')
 CORS(app)  # Enable CORS for all routes
 
-screener = StockScreener()
+# The screener pulls in yfinance+pandas+numpy, a multi-second import on a
+# cold worker. Everything heavy is created lazily on first use so static
+# endpoints serve immediately after boot.
+
+
+@functools.cache
+def get_screener():
+    """Create the shared StockScreener (imports yfinance/pandas lazily)"""
+    from stock_screener import StockScreener
+    return StockScreener()
+
+
+@functools.cache
+def get_strategy_map():
+    """Import and map the strategy classes on first /api/screen hit"""
+    from stock_screener.strategies import (
+        ValueStrategy,
+        GrowthStrategy,
+        DividendStrategy,
+        QualityStrategy,
+        MomentumStrategy,
+        GARPStrategy
+    )
+    return {
+        'value': ValueStrategy,
+        'growth': GrowthStrategy,
+        'dividend': DividendStrategy,
+        'quality': QualityStrategy,
+        'momentum': MomentumStrategy,
+        'garp': GARPStrategy
+    }
+
+
+@functools.cache
+def get_cache():
+    """
+    Create the shared FileCache.
+
+    Analyses include the live price, so keep the TTL short; override via
+    env for deployments that only care about daily fundamentals.
+    """
+    from stock_screener.cache import FileCache
+    return FileCache(
+        cache_dir=os.environ.get('CACHE_DIR', '.cache'),
+        default_ttl=float(os.environ.get('CACHE_TTL', 900))
+    )
+
+
+@functools.cache
+def _analyze_fn():
+    return get_cache().memoize('analyze')(get_screener().analyze_stock)
+
+
+@functools.cache
+def _evaluate_fn():
+    return get_cache().memoize('evaluate')(
+        get_screener().get_rules_of_thumb_evaluation
+    )
+
+
+def cached_analyze(symbol):
+    return _analyze_fn()(symbol)
+
+
+def cached_evaluate(symbol):
+    return _evaluate_fn()(symbol)
+
+
+def validate_symbol(symbol):
+    from stock_screener.symbols import validate_symbol as _validate
+    return _validate(symbol)
+
+
+def mark_symbol_invalid(symbol):
+    from stock_screener.symbols import mark_symbol_invalid as _mark
+    _mark(symbol)
+
+
+def is_symbol_not_found(error):
+    """True when a ValueError marks a definitive unknown-symbol lookup"""
+    from stock_screener.symbols import SymbolNotFoundError
+    return isinstance(error, SymbolNotFoundError)
+
+
+def json_response(payload, status=200):
+    """
+    Serialize a response payload with the fastest encoder available.
+
+    orjson is several times faster than the stdlib encoder on numeric
+    records, and OPT_SERIALIZE_NUMPY handles numpy scalars from pandas
+    without boxing them into Python floats first; without orjson the
+    stdlib encoder unboxes them through a default hook.
+    """
+    return Response(
+        _dumps(payload),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+STRATEGY_NAMES = ['value', 'growth', 'dividend', 'quality', 'momentum', 'garp']
+
+
+RULES_OF_THUMB = {
+    'pe_ratio': {
+        'name': 'P/E Ratio',
+        'rule': '15-20 is reasonable',
+        'low': '<15 may indicate undervaluation',
+        'high': '>25 may indicate overvaluation',
+        'tip': 'Compare to peers and industry average'
+    },
+    'debt_to_equity': {
+        'name': 'Debt-to-Equity',
+        'rule': '<1 is safer',
+        'moderate': '1-2 is moderate',
+        'high': '>2 is high risk',
+        'tip': 'Check cash flow to ensure debt can be serviced'
+    },
+    'current_ratio': {
+        'name': 'Current Ratio',
+        'rule': '2:1 is healthy',
+        'low': '<1 indicates liquidity issues',
+        'high': '>3 may indicate inefficient asset use',
+        'tip': 'Too high might suggest inefficient operations'
+    },
+    'roe': {
+        'name': 'Return on Equity',
+        'rule': '15%+ is good',
+        'excellent': '>20% is excellent',
+        'poor': '<10% is concerning',
+        'tip': 'Compare to industry peers'
+    },
+    'payout_ratio': {
+        'name': 'Dividend Payout Ratio',
+        'rule': '<60% is sustainable',
+        'high': '>80% may limit growth',
+        'tip': 'High payout leaves less for reinvestment'
+    },
+    'pb_ratio': {
+        'name': 'P/B Ratio',
+        'rule': '<1 may indicate undervaluation',
+        'fair': '1-3 is fair value',
+        'tip': 'Better metric for asset-heavy industries'
+    },
+    'free_cash_flow': {
+        'name': 'Free Cash Flow',
+        'rule': 'Should be positive and growing',
+        'tip': 'More reliable than earnings in some cases'
+    },
+    'revenue_growth': {
+        'name': 'Revenue Growth',
+        'rule': 'Look for consistent growth over 5-10 years',
+        'tip': 'Sudden jumps may indicate inconsistent performance'
+    },
+    'eps_growth': {
+        'name': 'EPS Growth',
+        'rule': 'Should grow in tandem with revenue',
+        'tip': 'Ensure growth is not just from cost-cutting'
+    }
+}
+
+POPULAR_STOCKS = {
+    'tech_giants': ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA'],
+    'dividend_aristocrats': ['JNJ', 'PG', 'KO', 'PEP', 'MCD', 'WMT'],
+    'financials': ['JPM', 'BAC', 'WFC', 'GS', 'MS', 'V', 'MA'],
+    'healthcare': ['UNH', 'JNJ', 'PFE', 'MRK', 'ABBV', 'LLY'],
+    'energy': ['XOM', 'CVX', 'COP', 'SLB', 'EOG'],
+    'consumer': ['AMZN', 'HD', 'NKE', 'SBUX', 'TGT', 'COST']
+}
+
+# These endpoints are fully static, so serialize them once (at import, or
+# for profiles on first hit since it imports the strategies module) and
+# hand the cached bytes straight to the socket on every request.
+_RULES_JSON = _dumps({'success': True, 'data': RULES_OF_THUMB})
+_POPULAR_JSON = _dumps({'success': True, 'data': POPULAR_STOCKS})
+
+
+def static_json_response(body: bytes):
+    """
+    Serve a pre-serialized static payload with ETag revalidation.
+
+    Browsers and CDNs resend the ETag via If-None-Match, letting repeat
+    hits short-circuit to an empty 304 instead of re-transferring the
+    body.
+    """
+    etag = hashlib.sha1(body).hexdigest()
+    if request.headers.get('If-None-Match') == etag:
+        return Response(status=304, headers={'ETag': etag})
+    return Response(
+        body,
+        mimetype='application/json',
+        headers={'ETag': etag, 'Cache-Control': 'public, max-age=86400'}
+    )
+
+
+@functools.cache
+def _profiles_json():
+    from stock_screener.strategies import SCREENING_PROFILES
+    return _dumps({
+        'success': True,
+        'data': {
+            'strategies': STRATEGY_NAMES,
+            'profiles': SCREENING_PROFILES
+        }
+    })
 
 
 # Serve static files
@@ -48,12 +271,28 @@ def analyze_stock(symbol):
     
     Returns comprehensive analysis including all metrics and signals.
     """
+    rejection = validate_symbol(symbol)
+    if rejection:
+        return jsonify({
+            'success': False,
+            'error': rejection
+        }), 404
+
     try:
-        analysis = screener.analyze_stock(symbol.upper())
+        analysis = cached_analyze(symbol.upper())
         return jsonify({
             'success': True,
             'data': analysis
         })
+    except ValueError as e:
+        # Only a definitive not-found goes into the negative cache;
+        # transient fetch errors must stay retryable
+        if is_symbol_not_found(e):
+            mark_symbol_invalid(symbol)
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 404
     except Exception as e:
         return jsonify({
             'success': False,
@@ -68,12 +307,28 @@ def evaluate_stock(symbol):
     
     Returns detailed evaluation with scores and recommendations.
     """
+    rejection = validate_symbol(symbol)
+    if rejection:
+        return jsonify({
+            'success': False,
+            'error': rejection
+        }), 404
+
     try:
-        evaluation = screener.get_rules_of_thumb_evaluation(symbol.upper())
+        evaluation = cached_evaluate(symbol.upper())
         return jsonify({
             'success': True,
             'data': evaluation
         })
+    except ValueError as e:
+        # Only a definitive not-found goes into the negative cache;
+        # transient fetch errors must stay retryable
+        if is_symbol_not_found(e):
+            mark_symbol_invalid(symbol)
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 404
     except Exception as e:
         return jsonify({
             'success': False,
@@ -103,20 +358,60 @@ def batch_analyze():
                 'error': 'No symbols provided'
             }), 400
         
-        df = screener.batch_analyze(symbols, metrics)
+        df = get_screener().batch_analyze(symbols, metrics)
         results = df.to_dict('records') if not df.empty else []
         
-        return jsonify({
+        return json_response({
             'success': True,
             'data': results,
             'count': len(results)
         })
     except Exception as e:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
+        }, status=400)
+
+
+@app.route('/api/batch/stream', methods=['POST'])
+def batch_analyze_stream():
+    """
+    Analyze multiple stocks, streaming one NDJSON record per symbol.
+
+    Records are yielded as soon as each fetch completes, so the client
+    sees the first result after one round-trip instead of waiting for
+    the whole batch to finish.
+
+    Request body:
+    {
+        "symbols": ["AAPL", "MSFT", "GOOGL"]
+    }
+    """
+    data = request.get_json()
+    symbols = data.get('symbols', []) if data else []
+
+    if not symbols:
+        return jsonify({
+            'success': False,
+            'error': 'No symbols provided'
         }), 400
 
+    def generate():
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = {executor.submit(cached_analyze, symbol.upper()): symbol
+                       for symbol in symbols}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    record = future.result()
+                    yield _dumps(record) + b'\n'
+                except Exception as e:
+                    yield _dumps(
+                        {'symbol': symbol.upper(), 'error': str(e)}
+                    ) + b'\n'
+
+    return Response(generate(), mimetype='application/x-ndjson')
+
 
 @app.route('/api/screen', methods=['POST'])
 def screen_stocks():
@@ -146,15 +441,7 @@ def screen_stocks():
             }), 400
         
         # Get strategy
-        strategy_map = {
-            'value': ValueStrategy,
-            'growth': GrowthStrategy,
-            'dividend': DividendStrategy,
-            'quality': QualityStrategy,
-            'momentum': MomentumStrategy,
-            'garp': GARPStrategy
-        }
-        
+        strategy_map = get_strategy_map()
         if strategy_name in strategy_map:
             strategy = strategy_map[strategy_name](custom_criteria)
         elif custom_criteria:
@@ -165,20 +452,20 @@ def screen_stocks():
                 'error': f'Unknown strategy: {strategy_name}'
             }), 400
         
-        df = screener.screen_stocks(symbols, strategy=strategy, criteria=custom_criteria)
+        df = get_screener().screen_stocks(symbols, strategy=strategy, criteria=custom_criteria)
         results = df.to_dict('records') if not df.empty else []
         
-        return jsonify({
+        return json_response({
             'success': True,
             'data': results,
             'count': len(results),
             'strategy': strategy_name
         })
     except Exception as e:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
-        }), 400
+        }, status=400)
 
 
 @app.route('/api/profiles')
@@ -186,13 +473,7 @@ def get_profiles():
     """
     Get available screening profiles.
     """
-    return jsonify({
-        'success': True,
-        'data': {
-            'strategies': ['value', 'growth', 'dividend', 'quality', 'momentum', 'garp'],
-            'profiles': SCREENING_PROFILES
-        }
-    })
+    return static_json_response(_profiles_json())
 
 
 @app.route('/api/rules-of-thumb')
@@ -200,68 +481,7 @@ def get_rules_of_thumb():
     """
     Get all rules of thumb for reference.
     """
-    rules = {
-        'pe_ratio': {
-            'name': 'P/E Ratio',
-            'rule': '15-20 is reasonable',
-            'low': '<15 may indicate undervaluation',
-            'high': '>25 may indicate overvaluation',
-            'tip': 'Compare to peers and industry average'
-        },
-        'debt_to_equity': {
-            'name': 'Debt-to-Equity',
-            'rule': '<1 is safer',
-            'moderate': '1-2 is moderate',
-            'high': '>2 is high risk',
-            'tip': 'Check cash flow to ensure debt can be serviced'
-        },
-        'current_ratio': {
-            'name': 'Current Ratio',
-            'rule': '2:1 is healthy',
-            'low': '<1 indicates liquidity issues',
-            'high': '>3 may indicate inefficient asset use',
-            'tip': 'Too high might suggest inefficient operations'
-        },
-        'roe': {
-            'name': 'Return on Equity',
-            'rule': '15%+ is good',
-            'excellent': '>20% is excellent',
-            'poor': '<10% is concerning',
-            'tip': 'Compare to industry peers'
-        },
-        'payout_ratio': {
-            'name': 'Dividend Payout Ratio',
-            'rule': '<60% is sustainable',
-            'high': '>80% may limit growth',
-            'tip': 'High payout leaves less for reinvestment'
-        },
-        'pb_ratio': {
-            'name': 'P/B Ratio',
-            'rule': '<1 may indicate undervaluation',
-            'fair': '1-3 is fair value',
-            'tip': 'Better metric for asset-heavy industries'
-        },
-        'free_cash_flow': {
-            'name': 'Free Cash Flow',
-            'rule': 'Should be positive and growing',
-            'tip': 'More reliable than earnings in some cases'
-        },
-        'revenue_growth': {
-            'name': 'Revenue Growth',
-            'rule': 'Look for consistent growth over 5-10 years',
-            'tip': 'Sudden jumps may indicate inconsistent performance'
-        },
-        'eps_growth': {
-            'name': 'EPS Growth',
-            'rule': 'Should grow in tandem with revenue',
-            'tip': 'Ensure growth is not just from cost-cutting'
-        }
-    }
-    
-    return jsonify({
-        'success': True,
-        'data': rules
-    })
+    return static_json_response(_RULES_JSON)
 
 
 @app.route('/api/popular-stocks')
@@ -269,21 +489,11 @@ def get_popular_stocks():
     """
     Get a list of popular stocks for quick screening.
     """
-    stocks = {
-        'tech_giants': ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'NVDA'],
-        'dividend_aristocrats': ['JNJ', 'PG', 'KO', 'PEP', 'MCD', 'WMT'],
-        'financials': ['JPM', 'BAC', 'WFC', 'GS', 'MS', 'V', 'MA'],
-        'healthcare': ['UNH', 'JNJ', 'PFE', 'MRK', 'ABBV', 'LLY'],
-        'energy': ['XOM', 'CVX', 'COP', 'SLB', 'EOG'],
-        'consumer': ['AMZN', 'HD', 'NKE', 'SBUX', 'TGT', 'COST']
-    }
-    
-    return jsonify({
-        'success': True,
-        'data': stocks
-    })
-
+    return static_json_response(_POPULAR_JSON)
 
 if __name__ == '__main__':
+    # Local development only. In production run under gunicorn with
+    # threaded workers (see Procfile) so concurrent API calls don't
+    # serialize behind Werkzeug's dev server.
     port = int(os.environ.get('PORT', 5000))
-    app.run(debug=False, host='0.0.0.0', port=port)
+    app.run(debug=False, host='0.0.0.0', port=port, threaded=True)
@@ -13,16 +13,31 @@ This module demonstrates all features of the stock screener including:
 """
 
 from stock_screener import StockScreener, ScreeningStrategy
+from stock_screener.data_provider import top_k
 from stock_screener.strategies import (
     ValueStrategy,
     GrowthStrategy,
     DividendStrategy,
     QualityStrategy
 )
+import concurrent.futures
+import functools
 import pandas as pd
 from datetime import datetime
 
 
+@functools.cache
+def get_screener() -> StockScreener:
+    """
+    Return the shared StockScreener instance.
+
+    Sharing one screener across examples means overlapping tickers
+    (JNJ, PG, KO, ... appear in several examples) are fetched once and
+    served from the provider cache afterwards.
+    """
+    return StockScreener()
+
+
 # ============================================================================
 # EXAMPLE 1: BASIC STOCK ANALYSIS
 # ============================================================================
@@ -37,7 +52,7 @@ def example_basic_analysis():
     print("="*70)
     
     # Initialize the screener
-    screener = StockScreener()
+    screener = get_screener()
     
     # Analyze a single stock
     symbol = "AAPL"
@@ -81,7 +96,7 @@ def example_value_investing():
     print("EXAMPLE 2: VALUE INVESTING STRATEGY")
     print("="*70)
     
-    screener = StockScreener()
+    screener = get_screener()
     
     # Define value investing criteria
     value_criteria = {
@@ -133,7 +148,7 @@ def example_growth_investing():
     print("EXAMPLE 3: GROWTH INVESTING STRATEGY")
     print("="*70)
     
-    screener = StockScreener()
+    screener = get_screener()
     
     # Define growth investing criteria
     growth_criteria = {
@@ -184,7 +199,7 @@ def example_dividend_investing():
     print("EXAMPLE 4: DIVIDEND INVESTING STRATEGY")
     print("="*70)
     
-    screener = StockScreener()
+    screener = get_screener()
     
     # Define dividend investing criteria
     dividend_criteria = {
@@ -236,7 +251,7 @@ def example_quality_investing():
     print("EXAMPLE 5: QUALITY INVESTING STRATEGY")
     print("="*70)
     
-    screener = StockScreener()
+    screener = get_screener()
     
     # Define quality investing criteria
     quality_criteria = {
@@ -281,7 +296,7 @@ def example_batch_screening():
     print("EXAMPLE 6: BATCH SCREENING")
     print("="*70)
     
-    screener = StockScreener()
+    screener = get_screener()
     
     # Large portfolio of stocks
     stocks = [
@@ -300,15 +315,15 @@ def example_batch_screening():
     
     print(f"\nScanned {len(results)} stocks successfully.")
     print(f"\nTop 10 stocks by P/E ratio (lowest first):")
-    top_pe = results.nsmallest(10, 'pe_ratio')[['symbol', 'current_price', 'pe_ratio']]
+    top_pe = top_k(results, 'pe_ratio', 10, largest=False)[['symbol', 'current_price', 'pe_ratio']]
     print(top_pe.to_string())
     
     print(f"\nTop 10 stocks by dividend yield (highest first):")
-    top_div = results.nlargest(10, 'dividend_yield')[['symbol', 'dividend_yield']]
+    top_div = top_k(results, 'dividend_yield', 10)[['symbol', 'dividend_yield']]
     print(top_div.to_string())
     
     print(f"\nTop 10 stocks by ROE (highest first):")
-    top_roe = results.nlargest(10, 'roe')[['symbol', 'roe']]
+    top_roe = top_k(results, 'roe', 10)[['symbol', 'roe']]
     print(top_roe.to_string())
     
     return results
@@ -327,7 +342,7 @@ def example_custom_strategy():
     print("EXAMPLE 7: CUSTOM SCREENING STRATEGY")
     print("="*70)
     
-    screener = StockScreener()
+    screener = get_screener()
     
     # Define a custom strategy combining multiple criteria
     # Strategy: "Dividend Growth" - High yield with growing earnings
@@ -376,7 +391,7 @@ def example_comprehensive_reporting():
     print("EXAMPLE 8: COMPREHENSIVE METRICS REPORTING")
     print("="*70)
     
-    screener = StockScreener()
+    screener = get_screener()
     
     # Select stocks for detailed analysis
     stocks = ['AAPL', 'MSFT', 'JNJ', 'V', 'MA']
@@ -468,7 +483,7 @@ def example_comparative_analysis():
     print("EXAMPLE 9: COMPARATIVE ANALYSIS")
     print("="*70)
     
-    screener = StockScreener()
+    screener = get_screener()
     
     # Compare tech giants
     tech_stocks = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META']
@@ -508,7 +523,7 @@ def example_portfolio_analysis():
     print("EXAMPLE 10: PORTFOLIO ANALYSIS & OPTIMIZATION")
     print("="*70)
     
-    screener = StockScreener()
+    screener = get_screener()
     
     # Example portfolio
     portfolio = {
@@ -571,24 +586,28 @@ def example_portfolio_analysis():
 
 def run_all_examples():
     """
-    Runs all examples in sequence.
+    Runs all examples concurrently.
+
+    The examples are dominated by network I/O to Yahoo Finance, so running
+    them in a small thread pool takes roughly as long as the slowest single
+    example instead of the sum of all three.
     """
     print("\n" + "="*70)
     print("STOCK SCREENER - COMPREHENSIVE USAGE EXAMPLES")
     print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("="*70)
-    
+
     try:
         # Run selected examples for verification
-        import time
-        print("Running Example 1...")
-        example_basic_analysis()
-        time.sleep(2)
-        print("Running Example 2...")
-        example_value_investing()
-        time.sleep(2)
-        print("Running Example 3...")
-        example_growth_investing()
+        examples = (
+            example_basic_analysis,
+            example_value_investing,
+            example_growth_investing,
+        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(fn) for fn in examples]
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
         # example_dividend_investing()
         # example_quality_investing()
         # example_batch_screening()
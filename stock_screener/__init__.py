@@ -2,36 +2,50 @@
 Stock Screener Package
 
 A comprehensive Python-based stock screening tool for fundamental analysis.
+
+Submodules are imported lazily (PEP 562): importing the package costs
+almost nothing, and pandas/numpy/yfinance only load when a name that
+needs them is first accessed.
 """
 
-from .core import (
-    StockData,
-    ScreeningResult,
-    ScreeningStrategy,
-    MetricsCalculator,
-    StockAnalyzer,
-    ScreeningEngine,
-    StrategyBuilder,
-    batch_screen
-)
-from .data_provider import DataProvider, StockScreener
-from .strategies import ValueStrategy, GrowthStrategy, DividendStrategy, QualityStrategy
-
-__all__ = [
-    'StockData',
-    'ScreeningResult',
-    'ScreeningStrategy',
-    'MetricsCalculator',
-    'StockAnalyzer',
-    'ScreeningEngine',
-    'StrategyBuilder',
-    'batch_screen',
-    'DataProvider',
-    'StockScreener',
-    'ValueStrategy',
-    'GrowthStrategy',
-    'DividendStrategy',
-    'QualityStrategy'
-]
+import importlib
+
+# name -> (submodule, attribute); resolved on first attribute access
+_LAZY = {
+    'StockData': ('.core', 'StockData'),
+    'Signal': ('.core', 'Signal'),
+    'ScreeningResult': ('.core', 'ScreeningResult'),
+    'ScreeningStrategy': ('.core', 'ScreeningStrategy'),
+    'MetricsCalculator': ('.core', 'MetricsCalculator'),
+    'StockAnalyzer': ('.core', 'StockAnalyzer'),
+    'ScreeningEngine': ('.core', 'ScreeningEngine'),
+    'StrategyBuilder': ('.core', 'StrategyBuilder'),
+    'batch_screen': ('.core', 'batch_screen'),
+    'DataProvider': ('.data_provider', 'DataProvider'),
+    'StockScreener': ('.data_provider', 'StockScreener'),
+    'ValueStrategy': ('.strategies', 'ValueStrategy'),
+    'GrowthStrategy': ('.strategies', 'GrowthStrategy'),
+    'DividendStrategy': ('.strategies', 'DividendStrategy'),
+    'QualityStrategy': ('.strategies', 'QualityStrategy'),
+}
+
+__all__ = list(_LAZY)
 
 __version__ = '1.0.0'
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    obj = getattr(importlib.import_module(module_name, __name__), attr)
+    # Cache on the module so subsequent lookups skip this hook
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(list(globals()) + list(_LAZY)))
@@ -0,0 +1,469 @@
+"""
+Compiled Screening Kernels
+
+Fuses the full per-stock pipeline -- metric ratios, the analyzer's
+quality/valuation/momentum scores, and all six strategy ladders -- into
+one Numba-compiled loop over the SoA arrays. Each stock's data is
+touched exactly once while it is cache-resident, instead of once per
+vectorized pass.
+
+Signals cannot be Python list appends inside a nopython kernel, so each
+strategy packs its signals into an integer bitmask; decode_signals turns
+a mask back into the usual name list at the boundary.
+
+Falls back to plain Python automatically when numba is not installed
+(same pattern as _scoring).
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ._scoring import njit, prange, NUMBA_AVAILABLE
+
+# Signal names per strategy column, in bit order. Column order follows
+# ScreeningStrategy declaration order:
+# value, growth, dividend, momentum, quality, contrarian
+N_STRATEGIES = 6
+
+STRATEGY_SIGNALS = (
+    ('VERY_LOW_PE', 'LOW_PE', 'LOW_PB', 'LOW_PS', 'DECENT_ROE'),
+    ('VERY_HIGH_REVENUE_GROWTH', 'HIGH_REVENUE_GROWTH',
+     'VERY_HIGH_EARNINGS_GROWTH', 'HIGH_EARNINGS_GROWTH', 'GOOD_PEG'),
+    ('VERY_HIGH_YIELD', 'HIGH_YIELD', 'MODERATE_YIELD', 'PAYS_DIVIDEND',
+     'SUSTAINABLE_DIVIDEND'),
+    ('STRONG_MOMENTUM', 'MODERATE_MOMENTUM'),
+    ('HIGH_QUALITY', 'GOOD_QUALITY', 'EXCELLENT_ROE', 'VERY_LOW_DEBT',
+     'STRONG_LIQUIDITY'),
+    ('EXTREMELY_UNDERVALUED', 'SIGNIFICANTLY_UNDERVALUED',
+     'MARKET_UNDERVALUATION', 'HIDDEN_VALUE'),
+)
+
+
+def decode_signals(bits, strategy_column):
+    """
+    Decode a strategy's signal bitmask into its signal name list.
+
+    Args:
+        bits: Integer bitmask produced by score_all
+        strategy_column: Strategy column index (0-5)
+
+    Returns:
+        List of signal names, in the order the scalar code appends them
+    """
+    names = STRATEGY_SIGNALS[strategy_column]
+    return [name for bit, name in enumerate(names) if bits & (1 << bit)]
+
+
+# Per-strategy scalar kernels. Each takes just the flat floats its
+# ladder reads and returns (score, signal bitmask) -- no dict lookups,
+# so they compile under nopython and inline into the fused loop below.
+_STRATEGY_SIGNATURE_5 = 'Tuple((f8, i8))(f8, f8, f8, f8, f8)'
+_STRATEGY_SIGNATURE_4 = 'Tuple((f8, i8))(f8, f8, f8, f8)'
+_STRATEGY_SIGNATURE_3 = 'Tuple((f8, i8))(f8, f8, f8)'
+_STRATEGY_SIGNATURE_6 = 'Tuple((f8, i8))(f8, f8, f8, f8, f8, f8)'
+
+
+@njit(_STRATEGY_SIGNATURE_5, cache=True)
+def screen_value(pe, pb, ps, roe, earnings_growth):
+    """Value ladder on flat floats; returns (score, signal bits)"""
+    s = 0.0
+    b = 0
+    if pe < 10:
+        s += 30
+        b |= 1
+    elif pe < 15:
+        s += 20
+        b |= 2
+    elif pe < 20:
+        s += 10
+    if pb < 1:
+        s += 25
+        b |= 4
+    elif pb < 1.5:
+        s += 15
+    if ps < 1:
+        s += 15
+        b |= 8
+    elif ps < 2:
+        s += 10
+    if roe > 10:
+        s += 20
+        b |= 16
+    if earnings_growth >= 0:
+        s += 10
+    return min(100.0, s), b
+
+
+@njit(_STRATEGY_SIGNATURE_4, cache=True)
+def screen_growth(revenue_growth, earnings_growth, peg, roe):
+    """Growth ladder on flat floats; returns (score, signal bits)"""
+    s = 0.0
+    b = 0
+    if revenue_growth > 30:
+        s += 30
+        b |= 1
+    elif revenue_growth > 20:
+        s += 25
+        b |= 2
+    elif revenue_growth > 10:
+        s += 15
+    if earnings_growth > 30:
+        s += 30
+        b |= 4
+    elif earnings_growth > 20:
+        s += 25
+        b |= 8
+    elif earnings_growth > 10:
+        s += 15
+    if peg < 1:
+        s += 20
+        b |= 16
+    elif peg < 2:
+        s += 10
+    if roe > 15:
+        s += 15
+    return min(100.0, s), b
+
+
+@njit(_STRATEGY_SIGNATURE_5, cache=True)
+def screen_dividend(dividend_yield, dividend_per_share, roe,
+                    debt_to_equity, earnings_growth):
+    """Dividend ladder on flat floats; returns (score, signal bits)"""
+    s = 0.0
+    b = 0
+    if dividend_yield >= 5:
+        s += 30
+        b |= 1
+    elif dividend_yield >= 3:
+        s += 25
+        b |= 2
+    elif dividend_yield >= 2:
+        s += 15
+        b |= 4
+    elif dividend_per_share > 0:
+        s += 5
+        b |= 8
+    if roe > 10:
+        s += 20
+        b |= 16
+    if debt_to_equity < 1:
+        s += 15
+    elif debt_to_equity < 2:
+        s += 10
+    if earnings_growth >= -5:
+        s += 10
+    return min(100.0, s), b
+
+
+@njit(_STRATEGY_SIGNATURE_3, cache=True)
+def screen_momentum(earnings_growth, revenue_growth, momentum_score):
+    """Momentum ladder on flat floats; returns (score, signal bits)"""
+    s = 0.0
+    b = 0
+    if earnings_growth > 25:
+        s += 35
+        b |= 1
+    elif earnings_growth > 15:
+        s += 25
+        b |= 2
+    elif earnings_growth > 5:
+        s += 15
+    if revenue_growth > 20:
+        s += 20
+    if momentum_score > 70:
+        s += 15
+    return min(100.0, s), b
+
+
+@njit(_STRATEGY_SIGNATURE_6, cache=True)
+def screen_quality(quality_score, roe, roa, debt_to_equity,
+                   current_ratio, net_margin):
+    """Quality ladder on flat floats; returns (score, signal bits)"""
+    s = 0.0
+    b = 0
+    if quality_score > 80:
+        s += 30
+        b |= 1
+    elif quality_score > 70:
+        s += 20
+        b |= 2
+    if roe > 20:
+        s += 20
+        b |= 4
+    elif roe > 15:
+        s += 15
+    if roa > 10:
+        s += 15
+    if debt_to_equity < 0.5:
+        s += 20
+        b |= 8
+    elif debt_to_equity < 1:
+        s += 10
+    if current_ratio > 2:
+        s += 10
+        b |= 16
+    if net_margin > 15:
+        s += 10
+    return min(100.0, s), b
+
+
+@njit(_STRATEGY_SIGNATURE_5, cache=True)
+def screen_contrarian(pe, pb, valuation_score, roe, revenue_growth):
+    """Contrarian ladder on flat floats; returns (score, signal bits)"""
+    s = 0.0
+    b = 0
+    if pe < 8:
+        s += 30
+        b |= 1
+    elif pe < 12:
+        s += 20
+        b |= 2
+    if pb < 0.8:
+        s += 20
+    if valuation_score > 70:
+        s += 25
+        b |= 4
+    if roe > 10 and revenue_growth >= 0:
+        s += 20
+        b |= 8
+    return min(100.0, s), b
+
+
+# Explicit signature so the kernel compiles eagerly at import (and the
+# artifact lands in the on-disk cache) instead of JIT-compiling on the
+# first screen request.
+# fastmath is deliberately not used: the ladder semantics rely on IEEE
+# inf sentinels (pe/peg/debt_to_equity), which fastmath may not preserve
+_SCORE_ALL_SIGNATURE = (
+    'Tuple((f8[:, :], i8[:, :]))(' + ', '.join(['f8[:]'] * 14) + ')')
+
+
+@njit(_SCORE_ALL_SIGNATURE, parallel=True, cache=True)
+def score_all(price, eps, revenue, net_income, total_assets,
+              total_liabilities, cash, debt, market_cap,
+              dividend_per_share, book_value_per_share,
+              revenue_growth, earnings_growth, dividend_yield):
+    """
+    Score every stock under all six strategies in one fused pass.
+
+    Args:
+        Fourteen float64 arrays, one per StockDataSoA fundamental field
+
+    Returns:
+        (scores, signal_bits): (N, 6) float64 score matrix and (N, 6)
+        int64 signal bitmask matrix, columns in ScreeningStrategy order
+    """
+    n = price.shape[0]
+    scores = np.zeros((n, N_STRATEGIES))
+    signal_bits = np.zeros((n, N_STRATEGIES), dtype=np.int64)
+
+    for i in prange(n):
+        # --- metric ratios (same guards as MetricsCalculator) ---
+        pe = price[i] / eps[i] if eps[i] > 0 else np.inf
+        pb = (price[i] / book_value_per_share[i]
+              if book_value_per_share[i] > 0 else np.inf)
+        ps = market_cap[i] / revenue[i] if revenue[i] > 0 else np.inf
+        eg = earnings_growth[i]
+        rg = revenue_growth[i]
+        dy = dividend_yield[i]
+        dps = dividend_per_share[i]
+        peg = pe / eg if eg > 0 else np.inf
+
+        equity = total_assets[i] - total_liabilities[i]
+        roe = (net_income[i] / equity) * 100.0 if equity > 0 else 0.0
+        roa = ((net_income[i] / total_assets[i]) * 100.0
+               if total_assets[i] > 0 else 0.0)
+        margin = ((net_income[i] / revenue[i]) * 100.0
+                  if revenue[i] > 0 else 0.0)
+        de = debt[i] / equity if equity > 0 else np.inf
+        cr = (cash[i] / total_liabilities[i]
+              if total_liabilities[i] > 0 else np.inf)
+
+        # --- analyzer scores consumed by the strategy ladders ---
+        quality = 50.0
+        if roe > 20:
+            quality += 20
+        elif roe > 15:
+            quality += 15
+        elif roe > 10:
+            quality += 10
+        if roa > 10:
+            quality += 15
+        elif roa > 5:
+            quality += 10
+        if margin > 20:
+            quality += 15
+        elif margin > 10:
+            quality += 10
+        if de < 0.5:
+            quality += 20
+        elif de < 1:
+            quality += 10
+        elif de > 2:
+            quality -= 15
+        if cr > 2:
+            quality += 10
+        elif cr < 1:
+            quality -= 20
+        quality = min(100.0, max(0.0, quality))
+
+        valuation = 50.0
+        if pe < 10:
+            valuation += 20
+        elif pe < 15:
+            valuation += 15
+        elif pe < 20:
+            valuation += 10
+        elif pe < 30:
+            valuation += 5
+        else:
+            valuation -= 20
+        if pb < 1:
+            valuation += 20
+        elif pb < 1.5:
+            valuation += 10
+        elif pb < 2.5:
+            valuation += 5
+        else:
+            valuation -= 10
+        if ps < 1:
+            valuation += 10
+        elif ps < 2:
+            valuation += 5
+        valuation = min(100.0, max(0.0, valuation))
+
+        momentum = 50.0
+        if rg > 15:
+            momentum += 25
+        if eg > 15:
+            momentum += 25
+        momentum = min(100.0, momentum)
+
+        # --- strategy ladders, one scalar kernel each ---
+        s0, b0 = screen_value(pe, pb, ps, roe, eg)
+        scores[i, 0] = s0
+        signal_bits[i, 0] = b0
+
+        s1, b1 = screen_growth(rg, eg, peg, roe)
+        scores[i, 1] = s1
+        signal_bits[i, 1] = b1
+
+        s2, b2 = screen_dividend(dy, dps, roe, de, eg)
+        scores[i, 2] = s2
+        signal_bits[i, 2] = b2
+
+        s3, b3 = screen_momentum(eg, rg, momentum)
+        scores[i, 3] = s3
+        signal_bits[i, 3] = b3
+
+        s4, b4 = screen_quality(quality, roe, roa, de, cr, margin)
+        scores[i, 4] = s4
+        signal_bits[i, 4] = b4
+
+        s5, b5 = screen_contrarian(pe, pb, valuation, roe, rg)
+        scores[i, 5] = s5
+        signal_bits[i, 5] = b5
+
+    return scores, signal_bits
+
+
+# Comparison opcodes for score_rules; order matches _ATOM_OPS in core
+OP_GE, OP_LE, OP_GT, OP_LT = 0, 1, 2, 3
+
+# Compiled for both float64 and the float32 matrices the screening
+# path feeds it (half the memory traffic per universe)
+_SCORE_RULES_SIGNATURES = [
+    'Tuple((f8[:], i8[:]))(f8[:, :], i8[:], i8[:], f8[:], i8[:], i8)',
+    'Tuple((f8[:], i8[:]))(f4[:, :], i8[:], i8[:], f8[:], i8[:], i8)',
+]
+
+
+@njit(_SCORE_RULES_SIGNATURES, parallel=True, cache=True)
+def score_rules(metrics, features, ops, thresholds, rule_ids, n_rules):
+    """
+    Evaluate a flattened atom-rule program over a metrics matrix.
+
+    Each atom k compares metrics[:, features[k]] against thresholds[k]
+    using opcode ops[k]; a rule matches where all of its atoms (rows
+    with the same rule_ids[k]) match. Comparisons and the per-rule
+    reduction run in one pass per stock, with no intermediate boolean
+    arrays of length N.
+
+    Args:
+        metrics: (N, F) float64 metric matrix, columns in METRIC_NAMES
+            order
+        features: (A,) column index per atom
+        ops: (A,) opcode per atom (OP_GE/OP_LE/OP_GT/OP_LT)
+        thresholds: (A,) comparison constant per atom
+        rule_ids: (A,) owning rule index per atom, ascending
+        n_rules: Total number of rules (max 63)
+
+    Returns:
+        (scores, rule_bits): per-stock score (matched fraction * 100)
+        and per-stock bitmask of matched rules
+    """
+    n = metrics.shape[0]
+    n_atoms = features.shape[0]
+    scores = np.empty(n)
+    rule_bits = np.zeros(n, dtype=np.int64)
+
+    for i in prange(n):
+        matched_rules = np.ones(n_rules, dtype=np.bool_)
+        for k in range(n_atoms):
+            value = metrics[i, features[k]]
+            op = ops[k]
+            if op == OP_GE:
+                hit = value >= thresholds[k]
+            elif op == OP_LE:
+                hit = value <= thresholds[k]
+            elif op == OP_GT:
+                hit = value > thresholds[k]
+            else:
+                hit = value < thresholds[k]
+            if not hit:
+                matched_rules[rule_ids[k]] = False
+        matched = 0
+        bits = 0
+        for j in range(n_rules):
+            if matched_rules[j]:
+                matched += 1
+                bits |= 1 << j
+        scores[i] = matched / n_rules * 100.0
+        rule_bits[i] = bits
+    return scores, rule_bits
+
+
+# Below this universe size the thread-dispatch overhead outweighs any
+# overlap on the fallback path
+_PARALLEL_MIN = 512
+
+
+def score_universe(*columns):
+    """
+    Score a universe, parallelizing whichever way is available.
+
+    With numba installed, score_all is already a prange loop and runs
+    multi-core on its own. Without it, the kernel degrades to a plain
+    Python loop, so large universes are chunked with np.array_split and
+    dispatched to a thread pool; each chunk produces its own output
+    rows, so there are no shared writes to race on.
+
+    Args:
+        columns: Fourteen float64 arrays in score_all argument order
+
+    Returns:
+        Same (scores, signal_bits) pair as score_all
+    """
+    n = columns[0].shape[0]
+    if NUMBA_AVAILABLE or n < _PARALLEL_MIN:
+        return score_all(*columns)
+
+    workers = min(os.cpu_count() or 1, 8)
+    chunks = zip(*(np.array_split(column, workers) for column in columns))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(lambda cols: score_all(*cols), chunks))
+    # array_split preserves order, so stacking restores the universe
+    return (np.vstack([scores for scores, _ in parts]),
+            np.vstack([bits for _, bits in parts]))
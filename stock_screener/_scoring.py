@@ -0,0 +1,271 @@
+"""
+Numeric Scoring Kernels
+
+Pure-numeric scoring functions for the hot evaluation paths. The kernels
+take fixed-order float64 vectors instead of dicts so they compile cleanly
+under Numba; when Numba is not installed they fall back to plain Python
+with identical results.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is unavailable"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+# Fixed slot order for the rules-of-thumb metric vector
+N_RULE_METRICS = 9
+(PE, DE, CR, REV_GROWTH, EPS_GROWTH, ROE, PAYOUT, PB, FCF) = range(N_RULE_METRICS)
+
+
+@njit(cache=True)
+def rules_of_thumb_scores(metrics: np.ndarray) -> np.ndarray:
+    """
+    Score a metric vector against the standard rules-of-thumb ladders.
+
+    Args:
+        metrics: float64 vector of length N_RULE_METRICS, indexed by the
+            module-level slot constants (growth/ROE/payout in percent)
+
+    Returns:
+        float64 vector of per-rule scores, 0-10 each
+    """
+    out = np.empty(N_RULE_METRICS)
+
+    # P/E Ratio: 15-20 is reasonable
+    pe = metrics[PE]
+    if 15.0 <= pe <= 20.0:
+        out[PE] = 10.0
+    elif 10.0 <= pe < 15.0:
+        out[PE] = 8.0
+    elif pe < 30.0:
+        out[PE] = 5.0
+    else:
+        out[PE] = 0.0
+
+    # Debt-to-Equity: <1 is safer
+    de = metrics[DE]
+    if de != 0.0 and de < 1.0:
+        out[DE] = 10.0
+    elif de != 0.0 and de < 2.0:
+        out[DE] = 5.0
+    else:
+        out[DE] = 0.0
+
+    # Current Ratio: 2:1 is healthy
+    cr = metrics[CR]
+    if 1.8 <= cr <= 2.5:
+        out[CR] = 10.0
+    elif 1.5 <= cr <= 3.0:
+        out[CR] = 7.0
+    else:
+        out[CR] = 0.0
+
+    # Revenue Growth: consistent growth
+    rev = metrics[REV_GROWTH]
+    if rev > 10.0:
+        out[REV_GROWTH] = 10.0
+    elif rev > 0.0:
+        out[REV_GROWTH] = 5.0
+    else:
+        out[REV_GROWTH] = 0.0
+
+    # EPS Growth: steady or rising
+    eps = metrics[EPS_GROWTH]
+    if eps > 10.0:
+        out[EPS_GROWTH] = 10.0
+    elif eps > 0.0:
+        out[EPS_GROWTH] = 5.0
+    else:
+        out[EPS_GROWTH] = 0.0
+
+    # ROE: 15%+ is good
+    roe = metrics[ROE]
+    if roe >= 15.0:
+        out[ROE] = 10.0
+    elif roe >= 10.0:
+        out[ROE] = 5.0
+    else:
+        out[ROE] = 0.0
+
+    # Payout Ratio: <60% is sustainable
+    payout = metrics[PAYOUT]
+    if 0.0 < payout < 60.0:
+        out[PAYOUT] = 10.0
+    elif 60.0 <= payout < 80.0:
+        out[PAYOUT] = 5.0
+    else:
+        out[PAYOUT] = 0.0
+
+    # P/B Ratio: <1 suggests undervaluation
+    pb = metrics[PB]
+    if pb != 0.0 and pb < 1.0:
+        out[PB] = 10.0
+    elif pb != 0.0 and pb < 2.0:
+        out[PB] = 7.0
+    else:
+        out[PB] = 3.0
+
+    # Free Cash Flow: positive
+    if metrics[FCF] > 0.0:
+        out[FCF] = 10.0
+    else:
+        out[FCF] = 0.0
+
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def rules_of_thumb_scores_batch(X: np.ndarray) -> np.ndarray:
+    """
+    Score a whole batch of symbols against the rules-of-thumb ladders.
+
+    Rows are scored independently in a prange loop, so with Numba the
+    kernel releases the GIL and spreads large watchlists across cores.
+
+    Args:
+        X: C-contiguous float64 array of shape (n_symbols, N_RULE_METRICS)
+
+    Returns:
+        float64 array of per-rule scores with the same shape as X
+    """
+    out = np.empty_like(X)
+    for i in prange(X.shape[0]):
+        out[i] = rules_of_thumb_scores(X[i])
+    return out
+
+
+@njit(cache=True)
+def filter_bounds(values: np.ndarray, mins: np.ndarray,
+                  maxs: np.ndarray) -> np.ndarray:
+    """
+    Filter rows of a metric table against per-column min/max bounds.
+
+    One branchy comparison loop per row with an early break on the
+    first failed bound, compiled so a 500-stock x 10-criterion screen
+    is a single kernel call instead of thousands of interpreted
+    comparisons. NaN in mins/maxs means "no bound on this side"; NaN
+    metric values fail any bounded column, matching the vectorized
+    predicate semantics.
+
+    Args:
+        values: float64 array of shape (n_stocks, n_criteria)
+        mins: float64 lower bounds, NaN where unbounded
+        maxs: float64 upper bounds, NaN where unbounded
+
+    Returns:
+        Boolean keep-mask of length n_stocks
+    """
+    n, m = values.shape
+    out = np.empty(n, np.bool_)
+    for i in range(n):
+        keep = True
+        for j in range(m):
+            v = values[i, j]
+            if not np.isnan(mins[j]) and not (v >= mins[j]):
+                keep = False
+                break
+            if not np.isnan(maxs[j]) and not (v <= maxs[j]):
+                keep = False
+                break
+        out[i] = keep
+    return out
+
+
+@njit(parallel=True, cache=True)
+def screen_bounds(X: np.ndarray, col_idx: np.ndarray, lo: np.ndarray,
+                  hi: np.ndarray) -> np.ndarray:
+    """
+    Screen a metrics matrix against precompiled (lo, hi) bound rows.
+
+    Fuses the whole filter into one pass: each row is scanned across
+    its bounded columns with an early break on the first violation, so
+    no per-criterion intermediate masks are allocated and rows spread
+    across cores via prange. NaN values fail every bound, matching the
+    vectorized comparison semantics.
+
+    Args:
+        X: float64 array of shape (n_stocks, n_columns)
+        col_idx: int64 column index per bound row
+        lo: float64 lower bounds (-inf when open)
+        hi: float64 upper bounds (inf when open)
+
+    Returns:
+        Boolean keep-mask of length n_stocks
+    """
+    n = X.shape[0]
+    m = col_idx.shape[0]
+    out = np.empty(n, np.bool_)
+    for i in prange(n):
+        ok = True
+        for j in range(m):
+            v = X[i, col_idx[j]]
+            if not (lo[j] <= v <= hi[j]):
+                ok = False
+                break
+        out[i] = ok
+    return out
+
+
+@njit(parallel=True, cache=True)
+def screen_many_bounds(X: np.ndarray, all_col: np.ndarray, all_lo: np.ndarray,
+                       all_hi: np.ndarray, off: np.ndarray) -> np.ndarray:
+    """
+    Screen a metrics matrix against several bound sets in one pass.
+
+    The bound rows of every strategy are packed end to end (CSR style)
+    with off[s]:off[s+1] delimiting strategy s, so X is read once no
+    matter how many strategies run -- the usual per-strategy sweep
+    repeats the memory traffic for every set. Bit s of each output
+    word is set iff strategy s accepts that row; NaN values fail every
+    bound, matching screen_bounds.
+
+    Args:
+        X: float64 array of shape (n_stocks, n_columns)
+        all_col: int64 column index per packed bound row
+        all_lo: float64 lower bounds (-inf when open)
+        all_hi: float64 upper bounds (inf when open)
+        off: int64 offsets of length n_strategies + 1
+
+    Returns:
+        uint64 acceptance bitmask per row (supports up to 64 sets)
+    """
+    n = X.shape[0]
+    n_sets = off.shape[0] - 1
+    out = np.empty(n, np.uint64)
+    for i in prange(n):
+        bits = np.uint64(0)
+        for s in range(n_sets):
+            ok = True
+            for j in range(off[s], off[s + 1]):
+                v = X[i, all_col[j]]
+                if not (all_lo[j] <= v <= all_hi[j]):
+                    ok = False
+                    break
+            if ok:
+                bits |= np.uint64(1) << np.uint64(s)
+        out[i] = bits
+    return out
+
+
+# Trigger compilation at import so the first request doesn't pay the JIT
+# warmup; cache=True persists the compiled kernels across process restarts.
+rules_of_thumb_scores(np.zeros(N_RULE_METRICS))
+rules_of_thumb_scores_batch(np.zeros((1, N_RULE_METRICS)))
+filter_bounds(np.zeros((1, 1)), np.zeros(1), np.zeros(1))
+screen_bounds(np.zeros((1, 1)), np.zeros(1, np.int64), np.zeros(1), np.zeros(1))
+screen_many_bounds(np.zeros((1, 1)), np.zeros(1, np.int64), np.zeros(1),
+                   np.zeros(1), np.zeros(2, np.int64))
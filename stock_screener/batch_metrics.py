@@ -0,0 +1,72 @@
+"""
+Batch Price Metrics
+
+Vectorized price-history statistics over a (days, symbols) close matrix.
+Stacking every symbol's closes into one array turns N per-symbol loops
+into a handful of axis-0 numpy reductions, and beta against the
+benchmark becomes a single BLAS matrix-vector product.
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def compute_price_metrics(closes: np.ndarray,
+                          benchmark: Optional[np.ndarray] = None
+                          ) -> Dict[str, np.ndarray]:
+    """
+    Compute price-derived metrics for all symbols at once.
+
+    Args:
+        closes: (T, N) array of daily close prices, NaN where a symbol
+            has no data for a day
+        benchmark: Optional (T,) array of benchmark closes (e.g. SPY)
+            used for beta
+
+    Returns:
+        Dict of (N,) arrays: '52week_high', '52week_low',
+        '52week_change', 'volatility' (annualized), 'sharpe_ratio',
+        and 'beta' when a benchmark is given
+    """
+    closes = np.asarray(closes, dtype=float)
+    n_days, n_symbols = closes.shape
+    cols = np.arange(n_symbols)
+
+    valid = ~np.isnan(closes)
+    first_idx = valid.argmax(axis=0)
+    last_idx = n_days - 1 - valid[::-1].argmax(axis=0)
+    first = closes[first_idx, cols]
+    last = closes[last_idx, cols]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        returns = np.diff(np.log(closes), axis=0)
+        volatility = np.nanstd(returns, axis=0) * np.sqrt(TRADING_DAYS_PER_YEAR)
+        mean_return = np.nanmean(returns, axis=0) * TRADING_DAYS_PER_YEAR
+        change = np.where(first > 0, last / first - 1, np.nan)
+
+    sharpe = np.divide(mean_return, volatility,
+                       out=np.zeros(n_symbols), where=volatility > 0)
+
+    metrics = {
+        '52week_high': np.nanmax(closes, axis=0),
+        '52week_low': np.nanmin(closes, axis=0),
+        '52week_change': change,
+        'volatility': volatility,
+        'sharpe_ratio': sharpe
+    }
+
+    if benchmark is not None:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            bench_returns = np.diff(np.log(np.asarray(benchmark, dtype=float)))
+        # Demean and zero-fill NaNs so one matmul covers every symbol
+        centered = np.nan_to_num(returns - np.nanmean(returns, axis=0))
+        bench_centered = np.nan_to_num(bench_returns - np.nanmean(bench_returns))
+        denom = bench_centered @ bench_centered
+        if denom > 0:
+            metrics['beta'] = (centered.T @ bench_centered) / denom
+        else:
+            metrics['beta'] = np.ones(n_symbols)
+
+    return metrics
@@ -0,0 +1,146 @@
+"""
+Caching Module
+
+File-backed TTL cache for expensive market-data lookups. Fundamentals change
+at most daily and prices every few minutes, so endpoint results can be reused
+instead of re-fetching from yfinance on every request.
+
+Entries are stored as JSON under `<cache_dir>/<symbol>/<endpoint>_<md5>.json`
+with a `ts` timestamp, and a small in-process layer in front of the disk
+store keeps hot symbols from paying even the file read.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+
+class FileCache:
+    """
+    JSON file cache with per-entry TTL expiry.
+
+    Keys are (symbol, endpoint, params) triples. Values must be
+    JSON-serializable, which holds for all the analysis dictionaries
+    returned by the screener.
+    """
+
+    def __init__(self, cache_dir: str = '.cache', default_ttl: float = 900):
+        """
+        Initialize the FileCache.
+
+        Args:
+            cache_dir: Directory to store cache files under
+            default_ttl: Default time-to-live in seconds for entries
+        """
+        self.cache_dir = cache_dir
+        self.default_ttl = default_ttl
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, symbol: str, endpoint: str, params: Any = None) -> str:
+        digest = hashlib.md5(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"{symbol.upper()}/{endpoint}_{digest}"
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + '.json')
+
+    def get(self, symbol: str, endpoint: str, params: Any = None,
+            ttl: Optional[float] = None) -> Optional[Any]:
+        """
+        Look up a cached value, returning None if missing or expired.
+
+        Args:
+            symbol: Stock ticker symbol
+            endpoint: Logical name of the cached operation
+            params: Extra arguments that affect the result
+            ttl: Time-to-live in seconds (default_ttl if None)
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        key = self._key(symbol, endpoint, params)
+
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is None:
+            try:
+                with open(self._path(key)) as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+
+        if time.time() - entry['ts'] >= ttl:
+            return None
+        return entry['value']
+
+    def set(self, symbol: str, endpoint: str, value: Any,
+            params: Any = None) -> None:
+        """
+        Store a value in both the in-process and on-disk layers.
+
+        Args:
+            symbol: Stock ticker symbol
+            endpoint: Logical name of the cached operation
+            value: JSON-serializable value to cache
+            params: Extra arguments that affect the result
+        """
+        key = self._key(symbol, endpoint, params)
+        entry = {'ts': time.time(), 'value': value}
+
+        with self._lock:
+            self._memory[key] = entry
+
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: could not write cache entry {key}: {e}")
+
+    def memoize(self, endpoint: str, ttl: Optional[float] = None) -> Callable:
+        """
+        Decorator caching a function keyed by its first argument (the symbol).
+
+        Args:
+            endpoint: Logical name used in the cache key
+            ttl: Time-to-live in seconds (default_ttl if None)
+
+        Returns:
+            Decorator wrapping the function with cache lookups
+        """
+        def decorator(func: Callable) -> Callable:
+            @wraps(func)
+            def wrapper(symbol, *args, **kwargs):
+                params = [args, kwargs] if (args or kwargs) else None
+                cached = self.get(symbol, endpoint, params, ttl)
+                if cached is not None:
+                    return cached
+                result = func(symbol, *args, **kwargs)
+                self.set(symbol, endpoint, result, params)
+                return result
+            return wrapper
+        return decorator
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and delete the on-disk store."""
+        with self._lock:
+            self._memory.clear()
+        if not os.path.isdir(self.cache_dir):
+            return
+        for root, _dirs, files in os.walk(self.cache_dir, topdown=False):
+            for name in files:
+                if name.endswith('.json'):
+                    try:
+                        os.remove(os.path.join(root, name))
+                    except OSError:
+                        pass
@@ -8,11 +8,34 @@ This module provides fundamental stock screening and analysis capabilities inclu
 - Custom strategy building framework
 """
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Callable
-from enum import Enum
+from enum import Enum, IntFlag
+import logging
+import math
+import os
 import statistics
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:  # pragma: no cover - numexpr is optional
+    numexpr = None
+    NUMEXPR_AVAILABLE = False
+
+from ._kernels import (
+    NUMBA_AVAILABLE, score_rules, score_universe, decode_signals,
+    screen_value, screen_growth, screen_dividend, screen_momentum,
+    screen_quality, screen_contrarian)
+
+logger = logging.getLogger(__name__)
 
 
 class ScreeningStrategy(Enum):
@@ -25,9 +48,55 @@ class ScreeningStrategy(Enum):
     CONTRARIAN = "contrarian"
 
 
-@dataclass
+# Column index in declaration order, stored on each member so hot paths
+# read an int attribute instead of hashing the member into a dict
+for _index, _strategy in enumerate(ScreeningStrategy):
+    _strategy.index = _index
+del _index, _strategy
+
+
+class Signal(IntFlag):
+    """
+    Analyzer trading signals packed as bit flags.
+
+    A whole signal set is one integer instead of a list of strings,
+    which keeps signal generation compatible with compiled kernels and
+    makes set operations (has-any, has-all) single AND/OR instructions.
+    Bit order matches the order the signals were historically appended.
+    """
+    UNDERVALUED_PE = 1 << 0
+    OVERVALUED_PE = 1 << 1
+    UNDERVALUED_BOOK = 1 << 2
+    OVERVALUED_BOOK = 1 << 3
+    HIGH_ROE = 1 << 4
+    HIGH_ROA = 1 << 5
+    HIGH_MARGIN = 1 << 6
+    HIGH_REVENUE_GROWTH = 1 << 7
+    HIGH_EARNINGS_GROWTH = 1 << 8
+    HIGH_DIVIDEND_YIELD = 1 << 9
+    PAYS_DIVIDEND = 1 << 10
+    STRONG_LIQUIDITY = 1 << 11
+    WEAK_LIQUIDITY = 1 << 12
+    LOW_DEBT = 1 << 13
+    HIGH_DEBT = 1 << 14
+
+    @classmethod
+    def decode(cls, mask: int) -> List[str]:
+        """Decode a bitmask into signal names, in bit order"""
+        return [signal.name for signal in cls if mask & signal]
+
+
+@dataclass(slots=True)
 class StockData:
-    """Data class representing fundamental stock information"""
+    """
+    Data class representing fundamental stock information.
+
+    Unit contract: growth and yield fields are percentages (12 means
+    12%); debt_to_equity and the other balance-sheet ratios are plain
+    ratios (0.25 means debt is a quarter of equity). Providers must
+    convert before constructing, as yfinance reports debtToEquity in
+    percent.
+    """
     symbol: str
     price: float
     eps: float  # Earnings Per Share
@@ -54,9 +123,113 @@ class StockData:
     quick_ratio: Optional[float] = None
     debt_to_assets: Optional[float] = None
     interest_coverage: Optional[float] = None
+    # Shareholder equity, derived once at construction; read by five
+    # metrics and two scoring helpers
+    equity: float = field(init=False)
+
+    def __post_init__(self):
+        self.equity = self.total_assets - self.total_liabilities
 
 
 @dataclass
+class StockDataSoA:
+    """
+    Structure-of-arrays view over a list of StockData objects.
+
+    Each fundamental field is stored as one contiguous float64 array, so
+    metric calculation over N stocks becomes a handful of vectorized
+    array expressions instead of N sets of Python-level attribute
+    lookups and scalar divisions.
+    """
+    symbols: List[str]
+    price: np.ndarray
+    eps: np.ndarray
+    revenue: np.ndarray
+    net_income: np.ndarray
+    total_assets: np.ndarray
+    total_liabilities: np.ndarray
+    cash: np.ndarray
+    debt: np.ndarray
+    market_cap: np.ndarray
+    dividend_per_share: np.ndarray
+    book_value_per_share: np.ndarray
+    revenue_growth: np.ndarray
+    earnings_growth: np.ndarray
+    dividend_yield: np.ndarray
+    # Derived column, computed once at construction
+    equity: np.ndarray = field(init=False)
+
+    _FLOAT_FIELDS = (
+        'price', 'eps', 'revenue', 'net_income', 'total_assets',
+        'total_liabilities', 'cash', 'debt', 'market_cap',
+        'dividend_per_share', 'book_value_per_share', 'revenue_growth',
+        'earnings_growth', 'dividend_yield'
+    )
+
+    @classmethod
+    def from_stocks(cls, stocks: List[StockData]) -> 'StockDataSoA':
+        """Build the SoA layout from a list of StockData objects"""
+        columns = {
+            field: np.array([getattr(stock, field) for stock in stocks],
+                            dtype=np.float64)
+            for field in cls._FLOAT_FIELDS
+        }
+        return cls(symbols=[stock.symbol for stock in stocks], **columns)
+
+    def __post_init__(self):
+        self.equity = self.total_assets - self.total_liabilities
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+
+# All metric names in calculate_all_metrics emission order; one float64
+# field each in the structured batch layout
+METRIC_NAMES = (
+    'pe_ratio', 'pb_ratio', 'peg_ratio', 'price_to_sales',
+    'roe', 'roa', 'net_margin', 'gross_margin', 'operating_margin', 'roic',
+    'asset_turnover', 'equity_multiplier',
+    'current_ratio', 'quick_ratio', 'cash_ratio',
+    'debt_to_equity', 'debt_to_assets', 'equity_ratio', 'interest_coverage',
+    'revenue_growth', 'earnings_growth', 'dividend_yield',
+    'eps', 'book_value_per_share', 'dividend_per_share'
+)
+
+METRICS_DTYPE = np.dtype([(name, 'f8') for name in METRIC_NAMES])
+
+
+class MetricsView(Mapping):
+    """
+    Read-only dict-like view over one record of a METRICS_DTYPE array.
+
+    A batch of N metric sets lives in one structured array (25 packed
+    floats per stock) instead of N 25-key dicts; this view gives each
+    stock's record the mapping interface the rest of the code expects
+    without copying it out.
+    """
+
+    __slots__ = ('_record',)
+
+    def __init__(self, record: np.void):
+        self._record = record
+
+    def __getitem__(self, key: str) -> float:
+        try:
+            return float(self._record[key])
+        except ValueError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        return iter(METRIC_NAMES)
+
+    def __len__(self) -> int:
+        return len(METRIC_NAMES)
+
+    def __repr__(self) -> str:
+        return f'MetricsView({dict(self)!r})'
+
+
+@dataclass(frozen=True, slots=True)
 class ScreeningResult:
     """Data class representing screening results"""
     symbol: str
@@ -80,97 +253,194 @@ class MetricsCalculator:
     - Growth metrics (Revenue Growth, Earnings Growth)
     """
     
-    def __init__(self):
-        """Initialize the MetricsCalculator"""
-        self.calculated_metrics = {}
-    
     def calculate_all_metrics(self, stock: StockData) -> Dict[str, float]:
         """
         Calculate all fundamental metrics for a stock.
-        
+
         Args:
             stock: StockData object containing financial information
-            
+
         Returns:
             Dictionary containing all calculated metrics
         """
+        # Subexpressions shared by several metrics, computed once
+        equity = stock.equity
+        pe_ratio = self._calculate_pe_ratio(stock)
+        margin = self._calculate_net_margin(stock)
+        liquidity = self._calculate_current_ratio(stock)
+
         metrics = {}
-        
+
         # Valuation Metrics
-        metrics['pe_ratio'] = self._calculate_pe_ratio(stock)
+        metrics['pe_ratio'] = pe_ratio
         metrics['pb_ratio'] = self._calculate_pb_ratio(stock)
-        metrics['peg_ratio'] = self._calculate_peg_ratio(stock)
+        metrics['peg_ratio'] = self._calculate_peg_ratio(stock, pe_ratio)
         metrics['price_to_sales'] = self._calculate_price_to_sales(stock)
-        
+
         # Profitability Metrics
-        metrics['roe'] = self._calculate_roe(stock)
+        metrics['roe'] = self._calculate_roe(stock, equity)
         metrics['roa'] = self._calculate_roa(stock)
-        metrics['net_margin'] = self._calculate_net_margin(stock)
-        metrics['gross_margin'] = self._calculate_gross_margin(stock)
-        metrics['operating_margin'] = self._calculate_operating_margin(stock)
+        # Gross and operating margins are the same net-income
+        # approximation as net margin, so compute it once
+        metrics['net_margin'] = margin
+        metrics['gross_margin'] = margin
+        metrics['operating_margin'] = margin
         metrics['roic'] = self._calculate_roic(stock)
-        
+
         # Efficiency Metrics
         metrics['asset_turnover'] = self._calculate_asset_turnover(stock)
-        metrics['equity_multiplier'] = self._calculate_equity_multiplier(stock)
-        
-        # Liquidity Metrics
-        metrics['current_ratio'] = self._calculate_current_ratio(stock)
-        metrics['quick_ratio'] = self._calculate_quick_ratio(stock)
-        metrics['cash_ratio'] = self._calculate_cash_ratio(stock)
-        
+        metrics['equity_multiplier'] = self._calculate_equity_multiplier(stock, equity)
+
+        # Liquidity Metrics (current/quick/cash share the simplified formula)
+        metrics['current_ratio'] = liquidity
+        metrics['quick_ratio'] = liquidity
+        metrics['cash_ratio'] = liquidity
+
         # Solvency Metrics
-        metrics['debt_to_equity'] = self._calculate_debt_to_equity(stock)
+        metrics['debt_to_equity'] = self._calculate_debt_to_equity(stock, equity)
         metrics['debt_to_assets'] = self._calculate_debt_to_assets(stock)
-        metrics['equity_ratio'] = self._calculate_equity_ratio(stock)
+        metrics['equity_ratio'] = self._calculate_equity_ratio(stock, equity)
         metrics['interest_coverage'] = self._calculate_interest_coverage(stock)
-        
+
         # Growth Metrics
         metrics['revenue_growth'] = stock.revenue_growth
         metrics['earnings_growth'] = stock.earnings_growth
         metrics['dividend_yield'] = stock.dividend_yield
-        
+
         # Per-Share Metrics
         metrics['eps'] = stock.eps
         metrics['book_value_per_share'] = stock.book_value_per_share
         metrics['dividend_per_share'] = stock.dividend_per_share
-        
-        self.calculated_metrics = metrics
+
         return metrics
-    
+
+    @staticmethod
+    def calculate_all_metrics_batch(soa: StockDataSoA) -> np.ndarray:
+        """
+        Calculate all fundamental metrics for a batch of stocks at once.
+
+        Mirrors calculate_all_metrics exactly (same keys, same guard
+        semantics) but operates on the SoA arrays, replacing ~25 scalar
+        operations per stock with 25 vectorized array operations total.
+
+        Args:
+            soa: StockDataSoA with one array per fundamental field
+
+        Returns:
+            Structured array of METRICS_DTYPE, one record per stock
+        """
+        n = len(soa)
+
+        def safe_divide(numerator, denominator, valid, fill):
+            """Divide where valid, fill elsewhere (no divide-by-zero)"""
+            out = np.full(n, fill)
+            np.divide(numerator, denominator, out=out, where=valid)
+            return out
+
+        # Common subexpressions shared across metrics
+        equity = soa.equity
+        has_equity = equity > 0
+        has_assets = soa.total_assets > 0
+        has_revenue = soa.revenue > 0
+        has_liabilities = soa.total_liabilities > 0
+
+        # One packed record per stock instead of a 25-key dict each
+        metrics = np.zeros(n, dtype=METRICS_DTYPE)
+
+        # Valuation Metrics
+        pe_ratio = safe_divide(soa.price, soa.eps, soa.eps > 0, np.inf)
+        metrics['pe_ratio'] = pe_ratio
+        metrics['pb_ratio'] = safe_divide(
+            soa.price, soa.book_value_per_share,
+            soa.book_value_per_share > 0, np.inf)
+        metrics['peg_ratio'] = safe_divide(
+            pe_ratio, soa.earnings_growth, soa.earnings_growth > 0, np.inf)
+        metrics['price_to_sales'] = safe_divide(
+            soa.market_cap, soa.revenue, has_revenue, np.inf)
+
+        # Profitability Metrics
+        metrics['roe'] = safe_divide(
+            soa.net_income, equity, has_equity, 0.0) * 100
+        metrics['roa'] = safe_divide(
+            soa.net_income, soa.total_assets, has_assets, 0.0) * 100
+        margin = safe_divide(
+            soa.net_income, soa.revenue, has_revenue, 0.0) * 100
+        metrics['net_margin'] = margin
+        metrics['gross_margin'] = margin
+        metrics['operating_margin'] = margin
+        # Same expression as _calculate_roic (kept unsimplified so the
+        # batch values are bit-identical to the scalar path)
+        invested_capital = soa.total_assets - (
+            soa.total_assets - soa.total_liabilities - soa.cash)
+        metrics['roic'] = safe_divide(
+            soa.net_income, invested_capital, invested_capital > 0, 0.0) * 100
+
+        # Efficiency Metrics
+        metrics['asset_turnover'] = safe_divide(
+            soa.revenue, soa.total_assets, has_assets, 0.0)
+        metrics['equity_multiplier'] = safe_divide(
+            soa.total_assets, equity, has_equity, 0.0)
+
+        # Liquidity Metrics (current/quick/cash share the simplified formula)
+        liquidity = safe_divide(
+            soa.cash, soa.total_liabilities, has_liabilities, np.inf)
+        metrics['current_ratio'] = liquidity
+        metrics['quick_ratio'] = liquidity
+        metrics['cash_ratio'] = liquidity
+
+        # Solvency Metrics
+        metrics['debt_to_equity'] = safe_divide(
+            soa.debt, equity, has_equity, np.inf)
+        metrics['debt_to_assets'] = safe_divide(
+            soa.debt, soa.total_assets, has_assets, 0.0)
+        metrics['equity_ratio'] = safe_divide(
+            equity, soa.total_assets, has_assets, 0.0) * 100
+        metrics['interest_coverage'] = safe_divide(
+            soa.net_income, soa.debt * 0.05, soa.debt > 0, np.inf)
+
+        # Growth Metrics
+        metrics['revenue_growth'] = soa.revenue_growth
+        metrics['earnings_growth'] = soa.earnings_growth
+        metrics['dividend_yield'] = soa.dividend_yield
+
+        # Per-Share Metrics
+        metrics['eps'] = soa.eps
+        metrics['book_value_per_share'] = soa.book_value_per_share
+        metrics['dividend_per_share'] = soa.dividend_per_share
+
+        return metrics
+
     @staticmethod
     def _calculate_pe_ratio(stock: StockData) -> float:
         """Calculate Price-to-Earnings ratio"""
         if stock.eps <= 0:
-            return float('inf')
+            return math.inf
         return stock.price / stock.eps
     
     @staticmethod
     def _calculate_pb_ratio(stock: StockData) -> float:
         """Calculate Price-to-Book ratio"""
         if stock.book_value_per_share <= 0:
-            return float('inf')
+            return math.inf
         return stock.price / stock.book_value_per_share
     
     @staticmethod
-    def _calculate_peg_ratio(stock: StockData) -> float:
+    def _calculate_peg_ratio(stock: StockData, pe_ratio: float) -> float:
         """Calculate PEG ratio (P/E divided by growth rate)"""
-        pe_ratio = stock.price / stock.eps if stock.eps > 0 else float('inf')
         if stock.earnings_growth <= 0:
-            return float('inf')
+            return math.inf
         return pe_ratio / stock.earnings_growth
     
     @staticmethod
     def _calculate_price_to_sales(stock: StockData) -> float:
         """Calculate Price-to-Sales ratio"""
         if stock.revenue <= 0:
-            return float('inf')
+            return math.inf
         return stock.market_cap / stock.revenue
     
     @staticmethod
-    def _calculate_roe(stock: StockData) -> float:
+    def _calculate_roe(stock: StockData, equity: float) -> float:
         """Calculate Return on Equity (%)"""
-        equity = stock.total_assets - stock.total_liabilities
         if equity <= 0:
             return 0
         return (stock.net_income / equity) * 100
@@ -188,20 +458,13 @@ class MetricsCalculator:
         if stock.revenue <= 0:
             return 0
         return (stock.net_income / stock.revenue) * 100
-    
-    @staticmethod
-    def _calculate_gross_margin(stock: StockData) -> float:
-        """Calculate Gross Profit Margin (%) - approximation"""
-        if stock.revenue <= 0:
-            return 0
-        return (stock.net_income / stock.revenue) * 100
-    
-    @staticmethod
-    def _calculate_operating_margin(stock: StockData) -> float:
-        """Calculate Operating Margin (%) - approximation"""
-        if stock.revenue <= 0:
-            return 0
-        return (stock.net_income / stock.revenue) * 100
+
+    # Gross and operating margin are approximated by net margin (no
+    # cost-of-goods or operating-expense data in StockData), so the
+    # former per-metric helpers were byte-identical copies. Kept as
+    # aliases for any external callers.
+    _calculate_gross_margin = _calculate_net_margin
+    _calculate_operating_margin = _calculate_net_margin
     
     @staticmethod
     def _calculate_roic(stock: StockData) -> float:
@@ -219,9 +482,8 @@ class MetricsCalculator:
         return stock.revenue / stock.total_assets
     
     @staticmethod
-    def _calculate_equity_multiplier(stock: StockData) -> float:
+    def _calculate_equity_multiplier(stock: StockData, equity: float) -> float:
         """Calculate Equity Multiplier"""
-        equity = stock.total_assets - stock.total_liabilities
         if equity <= 0:
             return 0
         return stock.total_assets / equity
@@ -230,29 +492,28 @@ class MetricsCalculator:
     def _calculate_current_ratio(stock: StockData) -> float:
         """Calculate Current Ratio (simplified)"""
         if stock.total_liabilities <= 0:
-            return float('inf')
+            return math.inf
         return stock.cash / stock.total_liabilities
     
     @staticmethod
     def _calculate_quick_ratio(stock: StockData) -> float:
         """Calculate Quick Ratio (simplified)"""
         if stock.total_liabilities <= 0:
-            return float('inf')
+            return math.inf
         return stock.cash / stock.total_liabilities
     
     @staticmethod
     def _calculate_cash_ratio(stock: StockData) -> float:
         """Calculate Cash Ratio"""
         if stock.total_liabilities <= 0:
-            return float('inf')
+            return math.inf
         return stock.cash / stock.total_liabilities
     
     @staticmethod
-    def _calculate_debt_to_equity(stock: StockData) -> float:
+    def _calculate_debt_to_equity(stock: StockData, equity: float) -> float:
         """Calculate Debt-to-Equity ratio"""
-        equity = stock.total_assets - stock.total_liabilities
         if equity <= 0:
-            return float('inf')
+            return math.inf
         return stock.debt / equity
     
     @staticmethod
@@ -263,21 +524,20 @@ class MetricsCalculator:
         return stock.debt / stock.total_assets
     
     @staticmethod
-    def _calculate_equity_ratio(stock: StockData) -> float:
+    def _calculate_equity_ratio(stock: StockData, equity: float) -> float:
         """Calculate Equity Ratio"""
         if stock.total_assets <= 0:
             return 0
-        equity = stock.total_assets - stock.total_liabilities
         return (equity / stock.total_assets) * 100
     
     @staticmethod
     def _calculate_interest_coverage(stock: StockData) -> float:
         """Calculate Interest Coverage ratio (simplified)"""
         if stock.debt <= 0:
-            return float('inf')
+            return math.inf
         interest_expense = stock.debt * 0.05  # Assume 5% interest rate
         if interest_expense <= 0:
-            return float('inf')
+            return math.inf
         return stock.net_income / interest_expense
 
 
@@ -292,10 +552,28 @@ class StockAnalyzer:
     - Price momentum analysis
     """
     
+    # Score ladders as lookup tables: for a monotone if/elif chain the
+    # branch taken is just np.searchsorted(bins, value) into the deltas
+    _PE_BINS = np.array([10.0, 15.0, 20.0, 30.0])
+    _PE_DELTAS = np.array([20.0, 15.0, 10.0, 5.0, -20.0])
+    _PB_BINS = np.array([1.0, 1.5, 2.5])
+    _PB_DELTAS = np.array([20.0, 10.0, 5.0, -10.0])
+    _PS_BINS = np.array([1.0, 2.0])
+    _PS_DELTAS = np.array([10.0, 5.0, 0.0])
+    _ROE_BINS = np.array([10.0, 15.0, 20.0])
+    _ROE_DELTAS = np.array([0.0, 10.0, 15.0, 20.0])
+    _ROA_BINS = np.array([5.0, 10.0])
+    _ROA_DELTAS = np.array([0.0, 10.0, 15.0])
+    _MARGIN_BINS = np.array([10.0, 20.0])
+    _MARGIN_DELTAS = np.array([0.0, 10.0, 15.0])
+    _STRENGTH_BINS = np.array([20.0, 40.0, 60.0, 80.0])
+    _STRENGTH_LABELS = np.array(
+        ['VERY_WEAK', 'WEAK', 'MODERATE', 'STRONG', 'VERY_STRONG'])
+
     def __init__(self):
         """Initialize the StockAnalyzer"""
         self.metrics_calculator = MetricsCalculator()
-    
+
     def analyze(self, stock: StockData) -> Dict[str, any]:
         """
         Perform comprehensive analysis on a stock.
@@ -321,55 +599,243 @@ class StockAnalyzer:
         }
         
         return analysis
-    
+
+    def analyze_batch(self, stocks: List[StockData]) -> List[Dict[str, any]]:
+        """
+        Analyze a batch of stocks, computing metrics in one vectorized pass.
+
+        Produces the same per-stock analysis dictionaries as analyze,
+        but the metric math runs once over SoA arrays instead of once
+        per stock.
+
+        Args:
+            stocks: List of StockData objects
+
+        Returns:
+            List of analysis dictionaries, one per stock, in input order
+        """
+        if not stocks:
+            return []
+
+        soa = StockDataSoA.from_stocks(stocks)
+        batch_metrics = self.metrics_calculator.calculate_all_metrics_batch(soa)
+
+        signal_masks = self._generate_signal_masks(soa, batch_metrics)
+        risk_scores = self._calculate_risk_scores(soa, batch_metrics)
+        strengths = self._assess_fundamental_strengths(soa, batch_metrics)
+        valuation_scores = self._calculate_valuation_scores(batch_metrics)
+        quality_scores = self._calculate_quality_scores(batch_metrics)
+        growth_scores = self._calculate_growth_scores(soa, batch_metrics)
+        momentum_scores = self._calculate_momentum_scores(soa)
+
+        analyses = []
+        for i, stock in enumerate(stocks):
+            analyses.append({
+                'symbol': stock.symbol,
+                'metrics': MetricsView(batch_metrics[i]),
+                'signals': Signal(int(signal_masks[i])),
+                'risk_score': float(risk_scores[i]),
+                'fundamental_strength': str(strengths[i]),
+                'valuation_score': float(valuation_scores[i]),
+                'quality_score': float(quality_scores[i]),
+                'growth_score': float(growth_scores[i]),
+                'momentum_score': float(momentum_scores[i])
+            })
+        return analyses
+
     @staticmethod
-    def _generate_signals(stock: StockData, metrics: Dict[str, float]) -> List[str]:
-        """Generate trading signals based on metrics"""
-        signals = []
-        
+    def _generate_signal_masks(soa: StockDataSoA,
+                               metrics: np.ndarray) -> np.ndarray:
+        """
+        Generate Signal bitmasks for a whole batch at once.
+
+        Each signal threshold becomes one C-level comparison across all
+        stocks; the boolean columns are folded straight into int64
+        masks. Mutually exclusive elif pairs in the scalar version
+        (e.g. pe < 15 vs pe > 30) have disjoint conditions here.
+        """
+        pe = metrics['pe_ratio']
+        pb = metrics['pb_ratio']
+        current_ratio = metrics['current_ratio']
+        debt_to_equity = metrics['debt_to_equity']
+        dividend_yield = soa.dividend_yield
+
+        conditions = (
+            (Signal.UNDERVALUED_PE, pe < 15),
+            (Signal.OVERVALUED_PE, pe > 30),
+            (Signal.UNDERVALUED_BOOK, pb < 1),
+            (Signal.OVERVALUED_BOOK, pb > 3),
+            (Signal.HIGH_ROE, metrics['roe'] > 15),
+            (Signal.HIGH_ROA, metrics['roa'] > 10),
+            (Signal.HIGH_MARGIN, metrics['net_margin'] > 20),
+            (Signal.HIGH_REVENUE_GROWTH, soa.revenue_growth > 20),
+            (Signal.HIGH_EARNINGS_GROWTH, soa.earnings_growth > 20),
+            (Signal.HIGH_DIVIDEND_YIELD, dividend_yield > 3),
+            (Signal.PAYS_DIVIDEND, (dividend_yield > 0) & (dividend_yield <= 3)),
+            (Signal.STRONG_LIQUIDITY, current_ratio > 2),
+            (Signal.WEAK_LIQUIDITY, current_ratio < 1),
+            (Signal.LOW_DEBT, debt_to_equity < 0.5),
+            (Signal.HIGH_DEBT, debt_to_equity > 2),
+        )
+
+        masks = np.zeros(len(soa), dtype=np.int64)
+        for flag, condition in conditions:
+            masks |= condition * int(flag)
+        return masks
+
+    @classmethod
+    def _calculate_risk_scores(cls, soa: StockDataSoA,
+                               metrics: np.ndarray) -> np.ndarray:
+        """Vectorized risk scores (0-100, higher = more risky)"""
+        current_ratio = metrics['current_ratio']
+        debt_to_equity = metrics['debt_to_equity']
+        roe = metrics['roe']
+        revenue_growth = soa.revenue_growth
+
+        score = (
+            np.select([current_ratio < 1, current_ratio < 1.5], [25.0, 10.0], 0.0)
+            + np.select([debt_to_equity > 2, debt_to_equity > 1], [25.0, 10.0], 0.0)
+            + np.select([roe < 5, roe < 10], [20.0, 10.0], 0.0)
+            + np.select([revenue_growth < -10, revenue_growth < 0], [15.0, 5.0], 0.0)
+        )
+        return np.clip(score, 0, 100)
+
+    @classmethod
+    def _assess_fundamental_strengths(cls, soa: StockDataSoA,
+                                      metrics: np.ndarray) -> np.ndarray:
+        """Vectorized fundamental strength labels"""
+        roe = metrics['roe']
+        debt_to_equity = metrics['debt_to_equity']
+        current_ratio = metrics['current_ratio']
+        revenue_growth = soa.revenue_growth
+
+        strength = (
+            np.select([roe > 15, roe > 10, roe > 5], [25.0, 15.0, 5.0], 0.0)
+            + np.select([debt_to_equity < 0.5, debt_to_equity < 1,
+                         debt_to_equity < 2], [25.0, 15.0, 5.0], 0.0)
+            + np.select([current_ratio > 1.5, current_ratio > 1], [25.0, 15.0], 0.0)
+            + np.select([revenue_growth > 10, revenue_growth > 5,
+                         revenue_growth > 0], [25.0, 15.0, 5.0], 0.0)
+        )
+        return cls._STRENGTH_LABELS[
+            np.searchsorted(cls._STRENGTH_BINS, strength, side='right')]
+
+    @classmethod
+    def _calculate_valuation_scores(cls, metrics: np.ndarray) -> np.ndarray:
+        """Vectorized valuation scores (0-100, higher = better value)"""
+        # Strict '<' ladders index their delta tables with side='right'
+        score = (
+            50.0
+            + cls._PE_DELTAS[np.searchsorted(cls._PE_BINS,
+                                             metrics['pe_ratio'], side='right')]
+            + cls._PB_DELTAS[np.searchsorted(cls._PB_BINS,
+                                             metrics['pb_ratio'], side='right')]
+            + cls._PS_DELTAS[np.searchsorted(cls._PS_BINS,
+                                             metrics['price_to_sales'], side='right')]
+        )
+        return np.clip(score, 0, 100)
+
+    @classmethod
+    def _calculate_quality_scores(cls, metrics: np.ndarray) -> np.ndarray:
+        """Vectorized quality scores (0-100, higher = better quality)"""
+        debt_to_equity = metrics['debt_to_equity']
+        current_ratio = metrics['current_ratio']
+
+        # Strict '>' ladders use side='left'
+        score = (
+            50.0
+            + cls._ROE_DELTAS[np.searchsorted(cls._ROE_BINS,
+                                              metrics['roe'], side='left')]
+            + cls._ROA_DELTAS[np.searchsorted(cls._ROA_BINS,
+                                              metrics['roa'], side='left')]
+            + cls._MARGIN_DELTAS[np.searchsorted(cls._MARGIN_BINS,
+                                                 metrics['net_margin'], side='left')]
+            + np.select([debt_to_equity < 0.5, debt_to_equity < 1,
+                         debt_to_equity > 2], [20.0, 10.0, -15.0], 0.0)
+            + np.select([current_ratio > 2, current_ratio < 1], [10.0, -20.0], 0.0)
+        )
+        return np.clip(score, 0, 100)
+
+    @classmethod
+    def _calculate_growth_scores(cls, soa: StockDataSoA,
+                                 metrics: np.ndarray) -> np.ndarray:
+        """Vectorized growth scores (0-100, higher = faster growth)"""
+        revenue_growth = soa.revenue_growth
+        earnings_growth = soa.earnings_growth
+        peg = metrics['peg_ratio']
+
+        growing = earnings_growth > 0
+        score = (
+            50.0
+            + np.select([revenue_growth > 30, revenue_growth > 20,
+                         revenue_growth > 10, revenue_growth > 5,
+                         revenue_growth < 0],
+                        [25.0, 20.0, 15.0, 10.0, -25.0], 0.0)
+            + np.select([earnings_growth > 30, earnings_growth > 20,
+                         earnings_growth > 10, earnings_growth > 5,
+                         earnings_growth < 0],
+                        [25.0, 20.0, 15.0, 10.0, -25.0], 0.0)
+            + np.select([(peg < 1) & growing, (peg < 2) & growing],
+                        [20.0, 10.0], 0.0)
+        )
+        return np.clip(score, 0, 100)
+
+    @classmethod
+    def _calculate_momentum_scores(cls, soa: StockDataSoA) -> np.ndarray:
+        """Vectorized momentum scores (0-100)"""
+        score = (50.0
+                 + 25.0 * (soa.revenue_growth > 15)
+                 + 25.0 * (soa.earnings_growth > 15))
+        return np.clip(score, 0, 100)
+
+    @staticmethod
+    def _generate_signals(stock: StockData, metrics: Dict[str, float]) -> Signal:
+        """Generate trading signals based on metrics, as a Signal bitmask"""
+        signals = Signal(0)
+
         # Valuation signals
         if metrics['pe_ratio'] < 15:
-            signals.append("UNDERVALUED_PE")
+            signals |= Signal.UNDERVALUED_PE
         elif metrics['pe_ratio'] > 30:
-            signals.append("OVERVALUED_PE")
-        
+            signals |= Signal.OVERVALUED_PE
+
         if metrics['pb_ratio'] < 1:
-            signals.append("UNDERVALUED_BOOK")
+            signals |= Signal.UNDERVALUED_BOOK
         elif metrics['pb_ratio'] > 3:
-            signals.append("OVERVALUED_BOOK")
-        
+            signals |= Signal.OVERVALUED_BOOK
+
         # Profitability signals
         if metrics['roe'] > 15:
-            signals.append("HIGH_ROE")
+            signals |= Signal.HIGH_ROE
         if metrics['roa'] > 10:
-            signals.append("HIGH_ROA")
+            signals |= Signal.HIGH_ROA
         if metrics['net_margin'] > 20:
-            signals.append("HIGH_MARGIN")
-        
+            signals |= Signal.HIGH_MARGIN
+
         # Growth signals
         if stock.revenue_growth > 20:
-            signals.append("HIGH_REVENUE_GROWTH")
+            signals |= Signal.HIGH_REVENUE_GROWTH
         if stock.earnings_growth > 20:
-            signals.append("HIGH_EARNINGS_GROWTH")
-        
+            signals |= Signal.HIGH_EARNINGS_GROWTH
+
         # Dividend signals
         if stock.dividend_yield > 3:
-            signals.append("HIGH_DIVIDEND_YIELD")
+            signals |= Signal.HIGH_DIVIDEND_YIELD
         elif stock.dividend_yield > 0:
-            signals.append("PAYS_DIVIDEND")
-        
+            signals |= Signal.PAYS_DIVIDEND
+
         # Liquidity signals
         if metrics['current_ratio'] > 2:
-            signals.append("STRONG_LIQUIDITY")
+            signals |= Signal.STRONG_LIQUIDITY
         elif metrics['current_ratio'] < 1:
-            signals.append("WEAK_LIQUIDITY")
-        
+            signals |= Signal.WEAK_LIQUIDITY
+
         # Debt signals
         if metrics['debt_to_equity'] < 0.5:
-            signals.append("LOW_DEBT")
+            signals |= Signal.LOW_DEBT
         elif metrics['debt_to_equity'] > 2:
-            signals.append("HIGH_DEBT")
-        
+            signals |= Signal.HIGH_DEBT
+
         return signals
     
     @staticmethod
@@ -592,6 +1058,72 @@ class StockAnalyzer:
         return min(100, max(0, score))
 
 
+def _content_key(stock: StockData) -> int:
+    """
+    Cheap content fingerprint of a stock's fundamental fields.
+
+    StockData is mutable, so per-symbol caches pair each entry with
+    this hash and recompute when the underlying numbers change.
+    """
+    return hash((
+        stock.price, stock.eps, stock.revenue, stock.net_income,
+        stock.total_assets, stock.total_liabilities, stock.cash, stock.debt,
+        stock.market_cap, stock.dividend_per_share,
+        stock.book_value_per_share, stock.revenue_growth,
+        stock.earnings_growth, stock.dividend_yield))
+
+
+# Compiled kernel and the inputs it reads, one row per strategy in
+# declaration order. Plain names resolve against analysis['metrics'];
+# the *_score names resolve against the analysis dict itself. This is
+# the single source of truth the dict-facing adapters are generated
+# from.
+STRATEGY_KERNELS = (
+    (screen_value,
+     ('pe_ratio', 'pb_ratio', 'price_to_sales', 'roe', 'earnings_growth')),
+    (screen_growth,
+     ('revenue_growth', 'earnings_growth', 'peg_ratio', 'roe')),
+    (screen_dividend,
+     ('dividend_yield', 'dividend_per_share', 'roe', 'debt_to_equity',
+      'earnings_growth')),
+    (screen_momentum,
+     ('earnings_growth', 'revenue_growth', 'momentum_score')),
+    (screen_quality,
+     ('quality_score', 'roe', 'roa', 'debt_to_equity', 'current_ratio',
+      'net_margin')),
+    (screen_contrarian,
+     ('pe_ratio', 'pb_ratio', 'valuation_score', 'roe', 'revenue_growth')),
+)
+
+# Which metrics each strategy actually touches, for callers that want
+# to fetch or compute only what a screen needs
+REQUIRED_METRICS = {
+    strategy: columns
+    for strategy, (_, columns) in zip(ScreeningStrategy, STRATEGY_KERNELS)
+}
+
+_ANALYSIS_LEVEL_KEYS = frozenset(
+    ('momentum_score', 'quality_score', 'valuation_score'))
+
+
+def _make_screen_adapter(kernel: Callable, columns: Tuple[str, ...],
+                         column_index: int) -> Callable:
+    """
+    Generate the analysis-dict adapter for one strategy kernel.
+
+    The returned callable matches the historical _screen_* signature:
+    it extracts exactly the columns the kernel reads, calls it, and
+    decodes the signal bitmask back into names.
+    """
+    def adapter(stock: StockData, analysis: Dict) -> Tuple[float, List[str]]:
+        metrics = analysis['metrics']
+        score, bits = kernel(*(analysis[column]
+                               if column in _ANALYSIS_LEVEL_KEYS
+                               else metrics[column] for column in columns))
+        return score, decode_signals(bits, column_index)
+    return adapter
+
+
 class ScreeningEngine:
     """
     Multi-strategy stock screening engine.
@@ -608,290 +1140,353 @@ class ScreeningEngine:
     def __init__(self):
         """Initialize the ScreeningEngine"""
         self.analyzer = StockAnalyzer()
-        self.strategies = {
-            ScreeningStrategy.VALUE_INVESTING: self._screen_value,
-            ScreeningStrategy.GROWTH_INVESTING: self._screen_growth,
-            ScreeningStrategy.DIVIDEND_INVESTING: self._screen_dividend,
-            ScreeningStrategy.MOMENTUM_INVESTING: self._screen_momentum,
-            ScreeningStrategy.QUALITY_INVESTING: self._screen_quality,
-            ScreeningStrategy.CONTRARIAN: self._screen_contrarian
-        }
-    
+        # Indexed by ScreeningStrategy.index; generated from the
+        # STRATEGY_KERNELS table so the kernel signatures stay the one
+        # place that knows which metrics each strategy reads
+        self._strategy_fns = tuple(
+            _make_screen_adapter(kernel, columns, index)
+            for index, (kernel, columns) in enumerate(STRATEGY_KERNELS))
+        # Per-symbol caches so a fixed universe screened across several
+        # strategies is analyzed and scored once, not once per strategy
+        self._analysis_cache: Dict[str, Tuple[int, Dict]] = {}
+        self._score_cache: Dict[str, Tuple[int, Tuple[np.ndarray, np.ndarray]]] = {}
+        # Guards cache fills when screen_all fans strategies out to
+        # worker threads
+        self._cache_lock = threading.Lock()
+
+    def analyze_universe(self, stocks: List[StockData]) -> Dict[str, Dict]:
+        """
+        Analyze a stock universe once, caching results per symbol.
+
+        Entries are keyed by symbol and fingerprinted by content, so a
+        stock whose numbers changed is re-analyzed automatically;
+        refresh() drops everything at once.
+
+        Args:
+            stocks: List of StockData objects
+
+        Returns:
+            Dictionary mapping symbols to analysis dictionaries
+        """
+        keys = {stock.symbol: _content_key(stock) for stock in stocks}
+        with self._cache_lock:
+            missing = [stock for stock in stocks
+                       if self._analysis_cache.get(stock.symbol, (None,))[0]
+                       != keys[stock.symbol]]
+            if missing:
+                for stock, analysis in zip(
+                        missing, self.analyzer.analyze_batch(missing)):
+                    self._analysis_cache[stock.symbol] = (keys[stock.symbol],
+                                                          analysis)
+            return {stock.symbol: self._analysis_cache[stock.symbol][1]
+                    for stock in stocks}
+
+    def refresh(self) -> None:
+        """Invalidate the cached analyses and strategy scores"""
+        self._analysis_cache.clear()
+        self._score_cache.clear()
+
+    # Alias for long-lived servers that want an explicit cache control
+    clear_cache = refresh
+
+    def _score_universe(self, stocks: List[StockData]) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Run the fused kernel for uncached symbols; return per-stock rows"""
+        keys = {stock.symbol: _content_key(stock) for stock in stocks}
+        with self._cache_lock:
+            missing = [stock for stock in stocks
+                       if self._score_cache.get(stock.symbol, (None,))[0]
+                       != keys[stock.symbol]]
+            if missing:
+                soa = StockDataSoA.from_stocks(missing)
+                score_matrix, signal_bits = score_universe(
+                    soa.price, soa.eps, soa.revenue, soa.net_income,
+                    soa.total_assets, soa.total_liabilities, soa.cash,
+                    soa.debt, soa.market_cap, soa.dividend_per_share,
+                    soa.book_value_per_share, soa.revenue_growth,
+                    soa.earnings_growth, soa.dividend_yield)
+                for i, stock in enumerate(missing):
+                    self._score_cache[stock.symbol] = (
+                        keys[stock.symbol], (score_matrix[i], signal_bits[i]))
+            return [self._score_cache[stock.symbol][1] for stock in stocks]
+
     def screen(self, stocks: List[StockData], strategy: ScreeningStrategy,
-               threshold: float = 50.0) -> List[ScreeningResult]:
+               threshold: float = 50.0,
+               top_k: Optional[int] = None) -> List[ScreeningResult]:
         """
         Screen stocks using specified strategy.
-        
+
         Args:
             stocks: List of StockData objects
             strategy: ScreeningStrategy to use
             threshold: Minimum score to include stock (0-100)
-            
+            top_k: Optional cap on the number of results returned
+
         Returns:
             List of ScreeningResult objects, sorted by score descending
         """
         results = []
-        
-        screening_func = self.strategies.get(strategy)
-        if not screening_func:
+
+        if not isinstance(strategy, ScreeningStrategy):
             raise ValueError(f"Unknown strategy: {strategy}")
-        
-        for stock in stocks:
-            analysis = self.analyzer.analyze(stock)
-            score, signals = screening_func(stock, analysis)
-            
-            if score >= threshold:
-                result = ScreeningResult(
-                    symbol=stock.symbol,
-                    score=score,
-                    strategy=strategy,
-                    metrics=analysis['metrics'],
-                    signals=signals,
-                    timestamp=datetime.utcnow()
-                )
-                results.append(result)
-        
-        return sorted(results, key=lambda x: x.score, reverse=True)
-    
+
+        if not stocks:
+            return results
+
+        # Metrics for the whole universe are computed in one vectorized
+        # pass; scores and signal bitmasks come from the fused kernel.
+        # Both are cached per symbol, so screening the same universe
+        # under K strategies analyzes it once, not K times.
+        analyses = self.analyze_universe(stocks)
+        score_rows = self._score_universe(stocks)
+        column = strategy.index
+        # One timestamp for the whole screen; results from the same call
+        # are contemporaneous, so a clock read per result is wasted work
+        timestamp = datetime.now(timezone.utc)
+
+        # Threshold and sort on the raw score array, then materialize
+        # ScreeningResult objects only for the indices that survive
+        scores = np.fromiter((row[column] for row, _ in score_rows),
+                             dtype=np.float64, count=len(score_rows))
+        passing = np.flatnonzero(scores >= threshold)
+        order = passing[np.argsort(-scores[passing], kind='stable')]
+        if top_k is not None:
+            order = order[:top_k]
+
+        for i in order:
+            stock = stocks[i]
+            results.append(ScreeningResult(
+                symbol=stock.symbol,
+                score=float(scores[i]),
+                strategy=strategy,
+                metrics=analyses[stock.symbol]['metrics'],
+                signals=decode_signals(int(score_rows[i][1][column]), column),
+                timestamp=timestamp
+            ))
+
+        return results
+
+    def screen_fused(self, soa: StockDataSoA, strategy: ScreeningStrategy,
+                     threshold: float = 50.0,
+                     top_k: Optional[int] = None) -> List[ScreeningResult]:
+        """
+        Screen straight from SoA arrays without building analysis dicts.
+
+        The fused kernel produces every stock's score and signal bits in
+        one pass; the threshold mask is applied to the raw score column,
+        and the full 25-field metric records are then computed only for
+        the survivors. For selective screens almost all of the
+        per-stock analysis output that screen() builds and discards is
+        never materialized here.
+
+        Bypasses the per-symbol caches: each call scores the given SoA
+        directly.
+
+        Args:
+            soa: StockDataSoA for the universe
+            strategy: ScreeningStrategy to use
+            threshold: Minimum score to include stock (0-100)
+            top_k: Optional cap on the number of results returned
+
+        Returns:
+            List of ScreeningResult objects, sorted by score descending
+        """
+        if not isinstance(strategy, ScreeningStrategy):
+            raise ValueError(f"Unknown strategy: {strategy}")
+
+        if len(soa) == 0:
+            return []
+
+        score_matrix, signal_bits = score_universe(
+            *(getattr(soa, field) for field in StockDataSoA._FLOAT_FIELDS))
+        column = strategy.index
+        scores = score_matrix[:, column]
+
+        passing = np.flatnonzero(scores >= threshold)
+        order = passing[np.argsort(-scores[passing], kind='stable')]
+        if top_k is not None:
+            order = order[:top_k]
+        if order.size == 0:
+            return []
+
+        survivors = StockDataSoA(
+            symbols=[soa.symbols[i] for i in order],
+            **{field: getattr(soa, field)[order]
+               for field in StockDataSoA._FLOAT_FIELDS})
+        metrics = self.analyzer.metrics_calculator.calculate_all_metrics_batch(
+            survivors)
+        timestamp = datetime.now(timezone.utc)
+
+        return [ScreeningResult(
+            symbol=soa.symbols[i],
+            score=float(scores[i]),
+            strategy=strategy,
+            metrics=MetricsView(metrics[j]),
+            signals=decode_signals(int(signal_bits[i, column]), column),
+            timestamp=timestamp
+        ) for j, i in enumerate(order)]
+
+    def screen_all(self, stocks: List[StockData],
+                   strategies: List[ScreeningStrategy],
+                   threshold: float = 50.0) -> Dict[str, List[ScreeningResult]]:
+        """
+        Screen one universe under several strategies.
+
+        The universe is analyzed and scored once up front; the
+        per-strategy screens then only read warm caches, so they fan
+        out to a thread pool when several strategies are requested.
+
+        Args:
+            stocks: List of StockData objects
+            strategies: List of ScreeningStrategy enums
+            threshold: Minimum score to include stock (0-100)
+
+        Returns:
+            Dictionary mapping strategy names to sorted result lists
+        """
+        self.analyze_universe(stocks)
+        self._score_universe(stocks)
+        if len(strategies) <= 1:
+            return {strategy.value: self.screen(stocks, strategy, threshold)
+                    for strategy in strategies}
+
+        workers = min(len(strategies), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self.screen, stocks, strategy, threshold): strategy
+                for strategy in strategies}
+            collected = {futures[future].value: future.result()
+                         for future in as_completed(futures)}
+        # Preserve the caller's strategy order in the result dict
+        return {strategy.value: collected[strategy.value]
+                for strategy in strategies}
+
     def _screen_value(self, stock: StockData, analysis: Dict) -> Tuple[float, List[str]]:
         """Screen for value investing opportunities"""
-        score = 0
-        signals = []
-        
-        pe_ratio = analysis['metrics']['pe_ratio']
-        pb_ratio = analysis['metrics']['pb_ratio']
-        ps_ratio = analysis['metrics']['price_to_sales']
-        roe = analysis['metrics']['roe']
-        
-        # Low P/E ratio
-        if pe_ratio < 10:
-            score += 30
-            signals.append("VERY_LOW_PE")
-        elif pe_ratio < 15:
-            score += 20
-            signals.append("LOW_PE")
-        elif pe_ratio < 20:
-            score += 10
-        
-        # Low P/B ratio
-        if pb_ratio < 1:
-            score += 25
-            signals.append("LOW_PB")
-        elif pb_ratio < 1.5:
-            score += 15
-        
-        # Low P/S ratio
-        if ps_ratio < 1:
-            score += 15
-            signals.append("LOW_PS")
-        elif ps_ratio < 2:
-            score += 10
-        
-        # Decent ROE
-        if roe > 10:
-            score += 20
-            signals.append("DECENT_ROE")
-        
-        # Stable earnings
-        if stock.earnings_growth >= 0:
-            score += 10
-        
-        return min(100, score), signals
-    
+        return self._strategy_fns[0](stock, analysis)
+
     def _screen_growth(self, stock: StockData, analysis: Dict) -> Tuple[float, List[str]]:
         """Screen for growth investing opportunities"""
-        score = 0
-        signals = []
-        
-        revenue_growth = stock.revenue_growth
-        earnings_growth = stock.earnings_growth
-        peg_ratio = analysis['metrics']['peg_ratio']
-        roe = analysis['metrics']['roe']
-        
-        # High revenue growth
-        if revenue_growth > 30:
-            score += 30
-            signals.append("VERY_HIGH_REVENUE_GROWTH")
-        elif revenue_growth > 20:
-            score += 25
-            signals.append("HIGH_REVENUE_GROWTH")
-        elif revenue_growth > 10:
-            score += 15
-        
-        # High earnings growth
-        if earnings_growth > 30:
-            score += 30
-            signals.append("VERY_HIGH_EARNINGS_GROWTH")
-        elif earnings_growth > 20:
-            score += 25
-            signals.append("HIGH_EARNINGS_GROWTH")
-        elif earnings_growth > 10:
-            score += 15
-        
-        # Good PEG ratio
-        if peg_ratio < 1:
-            score += 20
-            signals.append("GOOD_PEG")
-        elif peg_ratio < 2:
-            score += 10
-        
-        # Decent ROE
-        if roe > 15:
-            score += 15
-        
-        return min(100, score), signals
-    
+        return self._strategy_fns[1](stock, analysis)
+
     def _screen_dividend(self, stock: StockData, analysis: Dict) -> Tuple[float, List[str]]:
         """Screen for dividend investing opportunities"""
-        score = 0
-        signals = []
-        
-        dividend_yield = stock.dividend_yield
-        dps = stock.dividend_per_share
-        roe = analysis['metrics']['roe']
-        debt_to_equity = analysis['metrics']['debt_to_equity']
-        
-        # Dividend yield
-        if dividend_yield >= 5:
-            score += 30
-            signals.append("VERY_HIGH_YIELD")
-        elif dividend_yield >= 3:
-            score += 25
-            signals.append("HIGH_YIELD")
-        elif dividend_yield >= 2:
-            score += 15
-            signals.append("MODERATE_YIELD")
-        elif dps > 0:
-            score += 5
-            signals.append("PAYS_DIVIDEND")
-        
-        # Sustainable dividends (decent ROE)
-        if roe > 10:
-            score += 20
-            signals.append("SUSTAINABLE_DIVIDEND")
-        
-        # Low debt
-        if debt_to_equity < 1:
-            score += 15
-        elif debt_to_equity < 2:
-            score += 10
-        
-        # Stable earnings
-        if stock.earnings_growth >= -5:
-            score += 10
-        
-        return min(100, score), signals
-    
+        return self._strategy_fns[2](stock, analysis)
+
     def _screen_momentum(self, stock: StockData, analysis: Dict) -> Tuple[float, List[str]]:
         """Screen for momentum investing opportunities"""
-        score = 0
-        signals = []
-        
-        revenue_growth = stock.revenue_growth
-        earnings_growth = stock.earnings_growth
-        momentum_score = analysis['momentum_score']
-        
-        # High growth rates indicate momentum
-        if earnings_growth > 25:
-            score += 35
-            signals.append("STRONG_MOMENTUM")
-        elif earnings_growth > 15:
-            score += 25
-            signals.append("MODERATE_MOMENTUM")
-        elif earnings_growth > 5:
-            score += 15
-        
-        # Revenue growth supports momentum
-        if revenue_growth > 20:
-            score += 20
-        
-        # Use analyzer's momentum score
-        if momentum_score > 70:
-            score += 15
-        
-        return min(100, score), signals
-    
+        return self._strategy_fns[3](stock, analysis)
+
     def _screen_quality(self, stock: StockData, analysis: Dict) -> Tuple[float, List[str]]:
         """Screen for quality investing opportunities"""
-        score = 0
-        signals = []
-        
-        quality_score = analysis['quality_score']
-        roe = analysis['metrics']['roe']
-        roa = analysis['metrics']['roa']
-        debt_to_equity = analysis['metrics']['debt_to_equity']
-        current_ratio = analysis['metrics']['current_ratio']
-        net_margin = analysis['metrics']['net_margin']
-        
-        # High quality score
-        if quality_score > 80:
-            score += 30
-            signals.append("HIGH_QUALITY")
-        elif quality_score > 70:
-            score += 20
-            signals.append("GOOD_QUALITY")
-        
-        # Strong profitability
-        if roe > 20:
-            score += 20
-            signals.append("EXCELLENT_ROE")
-        elif roe > 15:
-            score += 15
-        
-        if roa > 10:
-            score += 15
-        
-        # Low debt
-        if debt_to_equity < 0.5:
-            score += 20
-            signals.append("VERY_LOW_DEBT")
-        elif debt_to_equity < 1:
-            score += 10
-        
-        # Strong liquidity
-        if current_ratio > 2:
-            score += 10
-            signals.append("STRONG_LIQUIDITY")
-        
-        # Good margins
-        if net_margin > 15:
-            score += 10
-        
-        return min(100, score), signals
-    
+        return self._strategy_fns[4](stock, analysis)
+
     def _screen_contrarian(self, stock: StockData, analysis: Dict) -> Tuple[float, List[str]]:
         """Screen for contrarian investing opportunities"""
-        score = 0
-        signals = []
-        
-        pe_ratio = analysis['metrics']['pe_ratio']
-        pb_ratio = analysis['metrics']['pb_ratio']
-        valuation_score = analysis['valuation_score']
-        revenue_growth = stock.revenue_growth
-        roe = analysis['metrics']['roe']
-        
-        # Very low valuation (market pessimism)
-        if pe_ratio < 8:
-            score += 30
-            signals.append("EXTREMELY_UNDERVALUED")
-        elif pe_ratio < 12:
-            score += 20
-            signals.append("SIGNIFICANTLY_UNDERVALUED")
-        
-        if pb_ratio < 0.8:
-            score += 20
-        
-        # Low valuation score means market undervalues it
-        if valuation_score > 70:
-            score += 25
-            signals.append("MARKET_UNDERVALUATION")
-        
-        # But with hidden quality
-        if roe > 10 and revenue_growth >= 0:
-            score += 20
-            signals.append("HIDDEN_VALUE")
-        
-        return min(100, score), signals
+        return self._strategy_fns[5](stock, analysis)
+
+
+_ATOM_OPS = {
+    '>=': np.greater_equal,
+    '<=': np.less_equal,
+    '>': np.greater,
+    '<': np.less,
+}
+
+# score_rules opcode per operator, same order as _ATOM_OPS
+_ATOM_OPCODES = {'>=': 0, '<=': 1, '>': 2, '<': 3}
+
+
+def _compile_atom_program(atom_rules: List[Tuple['RuleAtom', ...]]) -> Tuple[np.ndarray, ...]:
+    """Flatten atom rules into the parallel arrays score_rules takes"""
+    features, ops, thresholds, rule_ids = [], [], [], []
+    for j, atoms in enumerate(atom_rules):
+        for atom in atoms:
+            features.append(METRIC_NAMES.index(atom.column))
+            ops.append(_ATOM_OPCODES[atom.op])
+            thresholds.append(float(atom.value))
+            rule_ids.append(j)
+    return (np.asarray(features, dtype=np.int64),
+            np.asarray(ops, dtype=np.int64),
+            np.asarray(thresholds, dtype=np.float64),
+            np.asarray(rule_ids, dtype=np.int64))
+
+
+@dataclass(frozen=True)
+class RuleAtom:
+    """
+    One comparison of a metric column against a constant.
+
+    Atoms are hashable, so identical comparisons shared by several
+    strategies (e.g. roe >= 10 in both the quality and dividend
+    screens) deduplicate to a single evaluation per universe.
+    """
+    column: str
+    op: str
+    value: float
+
+    def evaluate(self, frame: pd.DataFrame) -> np.ndarray:
+        """Evaluate the comparison over the metrics frame"""
+        return np.asarray(_ATOM_OPS[self.op](frame[self.column], self.value))
+
+
+def _evaluate_expression_raw(expr: str, columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Evaluate an expression string over the metric columns.
+
+    Goes through numexpr when available (vectorized C with its own
+    thread pool); otherwise falls back to evaluating the same
+    expression over the bare NumPy arrays.
+    """
+    if NUMEXPR_AVAILABLE:
+        return numexpr.evaluate(expr, local_dict=columns, global_dict={})
+    return eval(expr, {'__builtins__': {}}, columns)
+
+
+def _evaluate_expression(expr: str, columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """Evaluate a predicate expression string to a boolean array"""
+    return np.asarray(_evaluate_expression_raw(expr, columns), dtype=bool)
+
+
+# Bulk ufunc per score_rules opcode
+_OPCODE_UFUNCS = (np.greater_equal, np.less_equal, np.greater, np.less)
+
+
+def _evaluate_atom_program(matrix: np.ndarray,
+                           program: Tuple[np.ndarray, ...],
+                           n_rules: int) -> np.ndarray:
+    """
+    Evaluate a flattened atom program with bulk NumPy comparisons.
+
+    Pure-NumPy counterpart of the score_rules kernel: gathers the
+    referenced columns once, applies each comparison opcode to all of
+    its atoms in one ufunc call, then folds atom hits into rule
+    matches with a reduceat over the rule boundaries.
+
+    Returns:
+        (n_rules, N) boolean match matrix
+    """
+    features, ops, thresholds, rule_ids = program
+    gathered = matrix[:, features]
+    atom_hits = np.empty(gathered.shape, dtype=bool)
+    for code, ufunc in enumerate(_OPCODE_UFUNCS):
+        selected = ops == code
+        if selected.any():
+            atom_hits[:, selected] = ufunc(gathered[:, selected],
+                                           thresholds[selected])
+    # Atoms are emitted in ascending rule order, so each rule is one
+    # contiguous run
+    boundaries = np.flatnonzero(np.r_[True, rule_ids[1:] != rule_ids[:-1]])
+    return np.logical_and.reduceat(atom_hits, boundaries, axis=1).T
+
+
+def _atoms_to_vector_rule(atoms: Tuple[RuleAtom, ...]) -> Callable:
+    """Build the ANDed frame predicate for one atom rule"""
+    def rule(frame: pd.DataFrame) -> np.ndarray:
+        mask = atoms[0].evaluate(frame)
+        for atom in atoms[1:]:
+            mask = mask & atom.evaluate(frame)
+        return mask
+    return rule
 
 
 class StrategyBuilder:
@@ -906,76 +1501,302 @@ class StrategyBuilder:
         """Initialize the StrategyBuilder"""
         self.analyzer = StockAnalyzer()
         self.custom_strategies = {}
+        # Per-symbol analyses shared across strategies and screens,
+        # fingerprinted like ScreeningEngine's cache
+        self._analysis_cache: Dict[str, Tuple[int, Dict]] = {}
     
-    def create_strategy(self, name: str, rules: List[Callable]) -> str:
+    def create_strategy(self, name: str,
+                        rules: Optional[List[Callable]] = None,
+                        vector_rules: Optional[List[Callable]] = None,
+                        atom_rules: Optional[List[Tuple[RuleAtom, ...]]] = None) -> str:
         """
         Create a custom screening strategy.
-        
+
         Args:
             name: Name for the custom strategy
-            rules: List of rule functions that take StockData and return bool
-            
+            rules: List of rule functions that take (StockData, analysis)
+                and return bool, evaluated per stock
+            vector_rules: List of rules evaluated once for the
+                universe: either callables taking the whole metrics
+                DataFrame and returning a boolean array, or predicate
+                expression strings over metric names (evaluated with
+                numexpr when installed), e.g.
+                "(pe_ratio >= 10) & (pe_ratio <= 20)"
+            atom_rules: List of RuleAtom tuples; each tuple is one rule
+                whose atoms are ANDed. Atom rules additionally allow
+                shared-atom evaluation across strategies in
+                screen_multiple
+
         Returns:
             Strategy ID
         """
+        rules = rules or []
+        vector_rules = vector_rules or []
+        atom_rules = atom_rules or []
+        if not rules and not vector_rules and not atom_rules:
+            raise ValueError("Strategy needs at least one rule")
         strategy_id = f"custom_{name}_{len(self.custom_strategies)}"
+        # All-string strategies additionally get one fused match-count
+        # expression, built once here
+        compiled_expr = None
+        if vector_rules and not rules and not atom_rules and all(
+                isinstance(rule, str) for rule in vector_rules):
+            compiled_expr = ' + '.join(f'(({rule}) * 1)'
+                                       for rule in vector_rules)
         self.custom_strategies[strategy_id] = {
             'name': name,
             'rules': rules,
-            'created_at': datetime.utcnow()
+            # Atom rules also screen through the generic vector path
+            'vector_rules': vector_rules + [_atoms_to_vector_rule(atoms)
+                                            for atoms in atom_rules],
+            'atom_rules': atom_rules,
+            # Flattened once here so every screen reuses the compiled
+            # program arrays
+            'atom_program': (_compile_atom_program(atom_rules)
+                            if atom_rules else None),
+            'compiled_expr': compiled_expr,
+            'created_at': datetime.now(timezone.utc)
         }
         return strategy_id
-    
+
+    def _build_metrics_frame(self, stocks: List[StockData]) -> pd.DataFrame:
+        """
+        Build the metrics DataFrame vector rules evaluate against.
+
+        One column per metric (METRIC_NAMES), one row per stock indexed
+        by symbol, backed by the structured batch array.
+        """
+        soa = StockDataSoA.from_stocks(stocks)
+        records = self.analyzer.metrics_calculator.calculate_all_metrics_batch(
+            soa)
+        return pd.DataFrame(records, index=soa.symbols)
+
     def screen_with_custom_strategy(self, stocks: List[StockData],
                                    strategy_id: str,
-                                   threshold: float = 50.0) -> List[ScreeningResult]:
+                                   threshold: float = 50.0,
+                                   top_k: Optional[int] = None) -> List[ScreeningResult]:
         """
         Screen stocks using a custom strategy.
-        
+
+        Vector rules each run once over the contiguous metric columns;
+        per-stock rules fall back to a Python loop over the batch
+        analyses. Rule j (vector rules first) reports as signal RULE_j.
+
         Args:
             stocks: List of StockData objects
             strategy_id: ID of custom strategy
             threshold: Minimum score to include stock
-            
+            top_k: Optional cap on the number of results returned
+
         Returns:
             List of ScreeningResult objects
         """
         if strategy_id not in self.custom_strategies:
             raise ValueError(f"Unknown strategy ID: {strategy_id}")
-        
+
         strategy = self.custom_strategies[strategy_id]
-        results = []
-        
-        for stock in stocks:
-            analysis = self.analyzer.analyze(stock)
-            
-            # Apply all rules
-            match_count = 0
-            matching_signals = []
-            
-            for i, rule in enumerate(strategy['rules']):
+        vector_rules = strategy['vector_rules']
+        row_rules = strategy['rules']
+        n_rules = len(vector_rules) + len(row_rules)
+        if not stocks:
+            return []
+
+        frame = self._build_metrics_frame(stocks)
+
+        # Sanitize the rule-evaluation inputs once instead of guarding
+        # every comparison: NaNs become 0 and the inf sentinels become
+        # huge finite values, which order the same under every rule
+        # operator. Reported metrics keep the raw values.
+        values = frame.to_numpy()
+        nonfinite = int(np.count_nonzero(~np.isfinite(values)))
+        if nonfinite:
+            # Routine, not exceptional: inf sentinels (e.g. pe_ratio
+            # when eps <= 0) show up on ordinary data every screen
+            logger.debug("Sanitized %d non-finite metric values", nonfinite)
+        # float32 is plenty for threshold comparisons and halves the
+        # bandwidth every rule pass pulls; reported metrics stay float64
+        clean = np.ascontiguousarray(
+            np.nan_to_num(values, nan=0.0, posinf=1e18, neginf=-1e18),
+            dtype=np.float32)
+
+        # Pure atom strategies never call Python per rule: the fused
+        # kernel handles them when numba is present, and the bulk
+        # gather-compare path otherwise
+        atom_rules = strategy['atom_rules']
+        if (not row_rules and atom_rules
+                and len(vector_rules) == len(atom_rules) and n_rules <= 63):
+            if NUMBA_AVAILABLE:
+                _, rule_bits = score_rules(clean, *strategy['atom_program'],
+                                           len(atom_rules))
+                matches = (rule_bits[None, :]
+                           >> np.arange(n_rules, dtype=np.int64)[:, None]
+                           & 1).astype(bool)
+            else:
+                matches = _evaluate_atom_program(
+                    clean, strategy['atom_program'], len(atom_rules))
+            return self._materialize_results(stocks, frame, matches,
+                                             threshold, top_k)
+
+        # All-string strategies score through one fused expression:
+        # the match counts for every rule come out of a single pass
+        # over the columns, and the per-rule signal breakdown is then
+        # evaluated only for the survivors
+        if strategy['compiled_expr'] is not None:
+            columns = {name: clean[:, k]
+                       for k, name in enumerate(frame.columns)}
+            counts = np.asarray(
+                _evaluate_expression_raw(strategy['compiled_expr'], columns))
+            scores = counts / n_rules * 100
+            passing = np.flatnonzero(scores >= threshold)
+            if top_k is not None and top_k < passing.size:
+                passing = passing[
+                    np.argpartition(-scores[passing], top_k - 1)[:top_k]]
+            order = passing[np.argsort(-scores[passing], kind='stable')]
+            if order.size == 0:
+                return []
+            survivor_columns = {name: column[order]
+                                for name, column in columns.items()}
+            matches = np.vstack([
+                _evaluate_expression(rule, survivor_columns)
+                for rule in vector_rules])
+            records = frame.to_records(index=False)
+            timestamp = datetime.now(timezone.utc)
+            return [ScreeningResult(
+                symbol=stocks[i].symbol,
+                score=float(scores[i]),
+                strategy=ScreeningStrategy.VALUE_INVESTING,  # Generic strategy
+                metrics=MetricsView(records[i]),
+                signals=[f"RULE_{j}" for j in range(n_rules)
+                         if matches[j, k]],
+                timestamp=timestamp
+            ) for k, i in enumerate(order)]
+
+        matches = np.zeros((n_rules, len(stocks)), dtype=bool)
+
+        clean_frame = pd.DataFrame(clean, index=frame.index,
+                                   columns=frame.columns)
+        columns = ({name: clean[:, k]
+                    for k, name in enumerate(frame.columns)}
+                   if any(isinstance(rule, str) for rule in vector_rules)
+                   else None)
+        for j, rule in enumerate(vector_rules):
+            try:
+                if isinstance(rule, str):
+                    matches[j] = _evaluate_expression(rule, columns)
+                else:
+                    matches[j] = np.asarray(rule(clean_frame), dtype=bool)
+            except Exception as e:
+                print(f"Error evaluating rule {j}: {e}")
+
+        if row_rules:
+            # One exception frame per rule instead of per (stock, rule);
+            # a rule that raises abandons its remaining stocks
+            analyses = self._analyze_cached(stocks)
+            offset = len(vector_rules)
+            for j, rule in enumerate(row_rules):
+                row = matches[offset + j]
                 try:
-                    if rule(stock, analysis):
-                        match_count += 1
-                        matching_signals.append(f"RULE_{i}")
+                    for i, (stock, analysis) in enumerate(zip(stocks,
+                                                              analyses)):
+                        if rule(stock, analysis):
+                            row[i] = True
                 except Exception as e:
-                    print(f"Error evaluating rule {i}: {e}")
-            
-            # Score based on how many rules matched
-            score = (match_count / len(strategy['rules'])) * 100
-            
-            if score >= threshold:
-                result = ScreeningResult(
-                    symbol=stock.symbol,
-                    score=score,
-                    strategy=ScreeningStrategy.VALUE_INVESTING,  # Generic strategy
-                    metrics=analysis['metrics'],
-                    signals=matching_signals,
-                    timestamp=datetime.utcnow()
-                )
-                results.append(result)
-        
-        return sorted(results, key=lambda x: x.score, reverse=True)
+                    print(f"Error evaluating rule {offset + j}: {e}")
+
+        return self._materialize_results(stocks, frame, matches, threshold,
+                                         top_k)
+
+    def _materialize_results(self, stocks: List[StockData],
+                             frame: pd.DataFrame, matches: np.ndarray,
+                             threshold: float,
+                             top_k: Optional[int] = None) -> List[ScreeningResult]:
+        """
+        Turn a (rules, N) match matrix into sorted ScreeningResults.
+
+        Score is the fraction of rules matched; threshold and ordering
+        happen on the raw arrays and only survivors are materialized.
+        """
+        n_rules = matches.shape[0]
+        scores = matches.mean(axis=0) * 100
+        passing = np.flatnonzero(scores >= threshold)
+        if top_k is not None and top_k < passing.size:
+            # O(N) partition down to the k best before the small sort
+            passing = passing[
+                np.argpartition(-scores[passing], top_k - 1)[:top_k]]
+        order = passing[np.argsort(-scores[passing], kind='stable')]
+        if order.size == 0:
+            return []
+        # The record copy backing the survivors' metric views is only
+        # made once something actually passed
+        records = frame.to_records(index=False)
+        timestamp = datetime.now(timezone.utc)
+
+        return [ScreeningResult(
+            symbol=stocks[i].symbol,
+            score=float(scores[i]),
+            strategy=ScreeningStrategy.VALUE_INVESTING,  # Generic strategy
+            metrics=MetricsView(records[i]),
+            signals=[f"RULE_{j}" for j in range(n_rules) if matches[j, i]],
+            timestamp=timestamp
+        ) for i in order]
+
+    def screen_multiple(self, stocks: List[StockData],
+                        strategy_ids: List[str],
+                        threshold: float = 50.0) -> Dict[str, List[ScreeningResult]]:
+        """
+        Screen one universe under several custom strategies at once.
+
+        Atom rules are deduplicated across the requested strategies:
+        each distinct comparison is evaluated exactly once over the
+        metrics frame and stored as a packbits-compressed row (1 bit
+        per stock), so a rule shared by several strategies costs one
+        pass, and combining a rule's atoms is a bitwise AND over the
+        packed bytes. Strategies with callable rules fall back to
+        screen_with_custom_strategy.
+
+        Args:
+            stocks: List of StockData objects
+            strategy_ids: IDs of custom strategies to apply
+            threshold: Minimum score to include stock
+
+        Returns:
+            Dictionary mapping strategy IDs to sorted result lists
+        """
+        for strategy_id in strategy_ids:
+            if strategy_id not in self.custom_strategies:
+                raise ValueError(f"Unknown strategy ID: {strategy_id}")
+        if not stocks:
+            return {strategy_id: [] for strategy_id in strategy_ids}
+
+        frame = self._build_metrics_frame(stocks)
+        n = len(stocks)
+
+        # Evaluate each distinct atom once, packed to 1 bit per stock
+        packed: Dict[RuleAtom, np.ndarray] = {}
+        for strategy_id in strategy_ids:
+            for atoms in self.custom_strategies[strategy_id]['atom_rules']:
+                for atom in atoms:
+                    if atom not in packed:
+                        packed[atom] = np.packbits(atom.evaluate(frame))
+
+        results = {}
+        for strategy_id in strategy_ids:
+            strategy = self.custom_strategies[strategy_id]
+            atom_rules = strategy['atom_rules']
+            if strategy['rules'] or len(strategy['vector_rules']) > len(atom_rules):
+                # Callable rules can't share atoms; use the general path
+                results[strategy_id] = self.screen_with_custom_strategy(
+                    stocks, strategy_id, threshold)
+                continue
+            matches = np.empty((len(atom_rules), n), dtype=bool)
+            for j, atoms in enumerate(atom_rules):
+                row = packed[atoms[0]]
+                for atom in atoms[1:]:
+                    row = np.bitwise_and(row, packed[atom])
+                matches[j] = np.unpackbits(row, count=n)
+            results[strategy_id] = self._materialize_results(
+                stocks, frame, matches, threshold)
+        return results
     
     def create_pe_based_strategy(self, pe_min: float = 10, pe_max: float = 20) -> str:
         """
@@ -988,11 +1809,10 @@ class StrategyBuilder:
         Returns:
             Strategy ID
         """
-        def pe_rule(stock: StockData, analysis: Dict) -> bool:
-            pe = analysis['metrics']['pe_ratio']
-            return pe_min <= pe <= pe_max
-        
-        return self.create_strategy(f"pe_{pe_min}_{pe_max}", [pe_rule])
+        return self.create_strategy(f"pe_{pe_min}_{pe_max}", atom_rules=[
+            (RuleAtom('pe_ratio', '>=', pe_min),
+             RuleAtom('pe_ratio', '<=', pe_max)),
+        ])
     
     def create_quality_screen_strategy(self, min_roe: float = 15,
                                       max_debt_to_equity: float = 1.0) -> str:
@@ -1006,16 +1826,11 @@ class StrategyBuilder:
         Returns:
             Strategy ID
         """
-        def roe_rule(stock: StockData, analysis: Dict) -> bool:
-            return analysis['metrics']['roe'] >= min_roe
-        
-        def debt_rule(stock: StockData, analysis: Dict) -> bool:
-            return analysis['metrics']['debt_to_equity'] <= max_debt_to_equity
-        
-        def liquidity_rule(stock: StockData, analysis: Dict) -> bool:
-            return analysis['metrics']['current_ratio'] >= 1.5
-        
-        return self.create_strategy("quality_screen", [roe_rule, debt_rule, liquidity_rule])
+        return self.create_strategy("quality_screen", atom_rules=[
+            (RuleAtom('roe', '>=', min_roe),),
+            (RuleAtom('debt_to_equity', '<=', max_debt_to_equity),),
+            (RuleAtom('current_ratio', '>=', 1.5),),
+        ])
     
     def create_growth_screen_strategy(self, min_revenue_growth: float = 15,
                                      min_earnings_growth: float = 15) -> str:
@@ -1029,17 +1844,12 @@ class StrategyBuilder:
         Returns:
             Strategy ID
         """
-        def revenue_rule(stock: StockData, analysis: Dict) -> bool:
-            return stock.revenue_growth >= min_revenue_growth
-        
-        def earnings_rule(stock: StockData, analysis: Dict) -> bool:
-            return stock.earnings_growth >= min_earnings_growth
-        
-        def peg_rule(stock: StockData, analysis: Dict) -> bool:
-            peg = analysis['metrics']['peg_ratio']
-            return peg < 2 and peg != float('inf')
-        
-        return self.create_strategy("growth_screen", [revenue_rule, earnings_rule, peg_rule])
+        # peg < 2 already excludes the inf sentinel
+        return self.create_strategy("growth_screen", atom_rules=[
+            (RuleAtom('revenue_growth', '>=', min_revenue_growth),),
+            (RuleAtom('earnings_growth', '>=', min_earnings_growth),),
+            (RuleAtom('peg_ratio', '<', 2),),
+        ])
     
     def create_dividend_screen_strategy(self, min_yield: float = 3.0) -> str:
         """
@@ -1051,14 +1861,30 @@ class StrategyBuilder:
         Returns:
             Strategy ID
         """
-        def yield_rule(stock: StockData, analysis: Dict) -> bool:
-            return stock.dividend_yield >= min_yield
-        
-        def sustainability_rule(stock: StockData, analysis: Dict) -> bool:
-            return analysis['metrics']['roe'] >= 10 and analysis['metrics']['debt_to_equity'] < 1
-        
-        return self.create_strategy("dividend_screen", [yield_rule, sustainability_rule])
+        return self.create_strategy("dividend_screen", atom_rules=[
+            (RuleAtom('dividend_yield', '>=', min_yield),),
+            (RuleAtom('roe', '>=', 10),
+             RuleAtom('debt_to_equity', '<', 1)),
+        ])
     
+    def _analyze_cached(self, stocks: List[StockData]) -> List[Dict]:
+        """Batch-analyze only the stocks whose cache entry is missing
+        or whose content fingerprint changed"""
+        keys = {stock.symbol: _content_key(stock) for stock in stocks}
+        missing = [stock for stock in stocks
+                   if self._analysis_cache.get(stock.symbol, (None,))[0]
+                   != keys[stock.symbol]]
+        if missing:
+            for stock, analysis in zip(missing,
+                                       self.analyzer.analyze_batch(missing)):
+                self._analysis_cache[stock.symbol] = (keys[stock.symbol],
+                                                      analysis)
+        return [self._analysis_cache[stock.symbol][1] for stock in stocks]
+
+    def clear_cache(self) -> None:
+        """Drop the cached per-symbol analyses"""
+        self._analysis_cache.clear()
+
     def get_strategy_info(self, strategy_id: str) -> Dict:
         """Get information about a custom strategy"""
         if strategy_id not in self.custom_strategies:
@@ -1070,25 +1896,45 @@ class StrategyBuilder:
         return list(self.custom_strategies.keys())
 
 
+# Process-wide engine shared by repeated batch_screen calls, created
+# lazily under double-checked locking so servers and notebooks keep its
+# warmed per-symbol caches between invocations
+_DEFAULT_ENGINE: Optional[ScreeningEngine] = None
+_DEFAULT_ENGINE_LOCK = threading.Lock()
+
+
+def _get_default_engine() -> ScreeningEngine:
+    """Return the shared module-level ScreeningEngine, creating it once"""
+    global _DEFAULT_ENGINE
+    if _DEFAULT_ENGINE is None:
+        with _DEFAULT_ENGINE_LOCK:
+            if _DEFAULT_ENGINE is None:
+                _DEFAULT_ENGINE = ScreeningEngine()
+    return _DEFAULT_ENGINE
+
+
 # Helper function for batch screening
 def batch_screen(stocks: List[StockData],
                 strategies: List[ScreeningStrategy],
-                threshold: float = 50.0) -> Dict[str, List[ScreeningResult]]:
+                threshold: float = 50.0,
+                engine: Optional[ScreeningEngine] = None) -> Dict[str, List[ScreeningResult]]:
     """
     Screen stocks using multiple strategies simultaneously.
-    
+
+    By default this reuses a shared module-level engine, so repeated
+    calls keep its memoized analyses and scores (entries refresh
+    automatically when a stock's numbers change). Pass an explicit
+    engine for isolated state.
+
     Args:
         stocks: List of StockData objects
         strategies: List of ScreeningStrategy enums
         threshold: Minimum score to include stock
-        
+        engine: Optional ScreeningEngine to use instead of the shared one
+
     Returns:
         Dictionary mapping strategy names to lists of ScreeningResult objects
     """
-    engine = ScreeningEngine()
-    results = {}
-    
-    for strategy in strategies:
-        results[strategy.value] = engine.screen(stocks, strategy, threshold)
-    
-    return results
+    if engine is None:
+        engine = _get_default_engine()
+    return engine.screen_all(stocks, strategies, threshold)
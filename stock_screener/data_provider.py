@@ -6,18 +6,370 @@ to StockData objects for use with the screening engine.
 """
 
 import yfinance as yf
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter, Retry
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from dataclasses import asdict
+from types import MappingProxyType
+import asyncio
+import bisect
+import logging
+import logging.handlers
+import math
+import queue
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 
 from .core import (
     StockData,
     StockAnalyzer,
     ScreeningEngine,
     ScreeningStrategy,
-    ScreeningResult
+    ScreeningResult,
+    Signal
 )
+from .batch_metrics import compute_price_metrics
+from .schema import apply_schema
+
+try:
+    # Optional: fuses multi-criteria masks into one SIMD-threaded pass
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+try:
+    # Route plain json.loads calls through orjson so the 30-80 KB Yahoo
+    # payloads yfinance decodes per symbol parse several times faster.
+    # Calls passing hooks or kwargs, and any payload orjson rejects,
+    # fall back to the stdlib parser so semantics are unchanged.
+    import json as _json
+    import orjson
+
+    _stdlib_loads = _json.loads
+
+    def _fast_loads(s, *args, **kwargs):
+        if args or kwargs:
+            return _stdlib_loads(s, *args, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return _stdlib_loads(s)
+
+    _json.loads = _fast_loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+from .symbols import SymbolNotFoundError
+from ._scoring import (
+    NUMBA_AVAILABLE,
+    filter_bounds,
+    rules_of_thumb_scores,
+    rules_of_thumb_scores_batch,
+    N_RULE_METRICS,
+    PE, DE, CR, REV_GROWTH, EPS_GROWTH, ROE, PAYOUT, PB, FCF
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def enable_queue_logging() -> logging.handlers.QueueListener:
+    """
+    Move this module's log I/O off the worker threads.
+
+    Replaces the module logger's handlers with a QueueHandler feeding a
+    background QueueListener, so when a fan-out produces hundreds of
+    warnings the worker threads only pay a queue put instead of
+    serializing on the stream lock. Call once at application startup;
+    the returned listener is already started and exposes stop().
+
+    Returns:
+        The running QueueListener draining the log queue
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    logger.propagate = False
+    return listener
+
+
+# Benchmark used for beta in batch price metrics
+BENCHMARK_SYMBOL = 'SPY'
+
+# Maps criteria names used by callers to internal metric names; the
+# proxy makes the shared constant read-only
+METRIC_MAP = MappingProxyType({
+    'pe_ratio': 'pe_ratio',
+    'pb_ratio': 'pb_ratio',
+    'roe': 'roe',
+    'roa': 'roa',
+    'debt_to_equity': 'debt_to_equity',
+    'current_ratio': 'current_ratio',
+    'dividend_yield': 'dividend_yield',
+    'revenue_growth': 'revenue_growth',
+    'earnings_growth': 'earnings_growth',
+    'payout_ratio': 'payout_ratio',
+    'interest_coverage': 'interest_coverage',
+    'debt_to_assets': 'debt_to_assets',
+    'free_cash_flow': 'free_cash_flow',
+    'years_of_dividends': 'years_of_dividends'
+})
+
+
+# Field extraction tables for stock_data_from_info: StockData attr,
+# info key and unit scale (yfinance reports growth/yield/returns as
+# decimals, StockData carries percentages). Optional fields pass
+# through as-is so a missing ratio stays None.
+_NUMERIC_FIELDS = (
+    ('eps', 'trailingEps', 1.0),
+    ('revenue', 'totalRevenue', 1.0),
+    ('net_income', 'netIncomeToCommon', 1.0),
+    ('total_assets', 'totalAssets', 1.0),
+    ('cash', 'totalCash', 1.0),
+    ('debt', 'totalDebt', 1.0),
+    ('market_cap', 'marketCap', 1.0),
+    ('dividend_per_share', 'dividendRate', 1.0),
+    ('book_value_per_share', 'bookValue', 1.0),
+    ('revenue_growth', 'revenueGrowth', 100.0),
+    ('earnings_growth', 'earningsGrowth', 100.0),
+    ('dividend_yield', 'dividendYield', 100.0),
+    ('roe', 'returnOnEquity', 100.0),
+    ('roa', 'returnOnAssets', 100.0),
+)
+_OPTIONAL_FIELDS = (
+    ('pe_ratio', 'trailingPE'),
+    ('pb_ratio', 'priceToBook'),
+    ('peg_ratio', 'pegRatio'),
+    ('current_ratio', 'currentRatio'),
+    ('quick_ratio', 'quickRatio'),
+)
+
+
+# Rules-of-thumb evaluation table: one row per rule as
+# (metric label, rule text, score slot or None, value fn, status fn, tip).
+# The value/status callables read a small context dict of scalars pulled
+# from the analysis once, so the evaluation loop is data-driven instead
+# of twelve hand-rolled dict literals.
+_THUMB_RULES = (
+    ('P/E Ratio', '15-20 is reasonable', PE,
+     lambda c: f"{c['pe']:.2f}" if c['pe'] != math.inf else 'N/A',
+     lambda c: 'GOOD' if 15 <= c['pe'] <= 20 else (
+         'UNDERVALUED' if c['pe'] < 15 else 'OVERVALUED'),
+     'Compare to peers and the industry average.'),
+    ('Debt-to-Equity', '<1 is safer', DE,
+     lambda c: f"{c['de']:.2f}" if c['de'] is not None else 'N/A',
+     lambda c: 'HEALTHY' if c['de'] and c['de'] < 1 else 'HIGH',
+     "Ensure company's cash flow can service debt."),
+    ('Current Ratio', '2:1 is healthy', CR,
+     lambda c: f"{c['cr']:.2f}" if c['cr'] else 'N/A',
+     lambda c: 'HEALTHY' if 1.5 <= c['cr'] <= 3 else (
+         'LOW' if c['cr'] < 1.5 else 'INEFFICIENT'),
+     'Too high might suggest inefficient asset use.'),
+    ('Revenue Growth (YoY)', 'Look for consistent growth', REV_GROWTH,
+     lambda c: f"{c['rev_growth']:.1f}%",
+     lambda c: 'STABLE' if c['rev_growth'] > 5 else 'VOLATILE',
+     'Sudden jumps or declines may suggest market disruption.'),
+    ('EPS Growth (YoY)', 'Steady or rising', EPS_GROWTH,
+     lambda c: f"{c['eps_growth']:.1f}%",
+     lambda c: 'GROWING' if c['eps_growth'] > 0 else 'DECLINING',
+     'EPS should grow in tandem with revenue.'),
+    ('ROE', '15%+ is good', ROE,
+     lambda c: f"{c['roe']:.1f}%",
+     lambda c: 'EXCELLENT' if c['roe'] >= 15 else 'POOR',
+     'Compare ROE to peers in the same industry.'),
+    ('Payout Ratio', '<60% is sustainable', PAYOUT,
+     lambda c: f"{c['payout']:.1f}%" if c['payout'] else 'N/A',
+     lambda c: 'SUSTAINABLE' if c['payout'] < 60 else 'HIGH',
+     'Very high payout limit growth and reinvestment.'),
+    ('P/B Ratio', '<1 suggests undervaluation', PB,
+     lambda c: f"{c['pb']:.2f}" if c['pb'] else 'N/A',
+     lambda c: 'UNDERVALUED' if c['pb'] and c['pb'] < 1 else 'FAIR/OVER',
+     'Better for asset-heavy industries.'),
+    ('Free Cash Flow', 'Should be positive and growing', FCF,
+     lambda c: f"${c['fcf']/1e9:.2f}B" if c['fcf'] else 'N/A',
+     lambda c: 'POSITIVE' if c['fcf'] and c['fcf'] > 0 else 'NEGATIVE',
+     'FCF is essential for dividends and debt repayment.'),
+    ('Category', 'Growth (High P/E) vs Value (Low P/E)', None,
+     lambda c: 'Growth' if c['pe'] > 25 or c['eps_growth'] > 15 else 'Value',
+     lambda c: 'ANALYZED',
+     'Value offers safety; Growth offers high reward.'),
+    ('Diversification Advice', 'Max 5% per stock', None,
+     lambda c: 'Review Weight',
+     lambda c: 'ADVICE',
+     "Don't put more than 5% of your portfolio into a single stock."),
+    ('Industry Context', 'Compare within the same industry', None,
+     lambda c: c['sector'],
+     lambda c: 'CONTEXT',
+     'Always compare metrics within the same industry.'),
+)
+
+# Recommendation ladder: score percentage bucketed by bisect
+_RECOMMENDATION_CUTS = (40.0, 60.0, 80.0)
+_RECOMMENDATIONS = ('SELL', 'HOLD', 'BUY', 'STRONG_BUY')
+
+
+def _thumb_context(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Pull the scalar context _THUMB_RULES reads out of an analysis"""
+    return {
+        'pe': analysis.get('pe_ratio', math.inf),
+        'de': analysis.get('debt_to_equity', 0),
+        'cr': analysis.get('current_ratio', 0),
+        'rev_growth': analysis.get('revenue_growth', 0) * 100,
+        'eps_growth': analysis.get('earnings_growth', 0) * 100,
+        'roe': analysis.get('roe', 0) * 100,
+        'payout': analysis.get('payout_ratio', 0) * 100,
+        'pb': analysis.get('pb_ratio', 0),
+        'fcf': analysis.get('free_cash_flow', 0),
+        'sector': analysis.get('sector', 'Unknown'),
+    }
+
+
+def _thumb_metric_vec(ctx: Dict[str, Any]) -> np.ndarray:
+    """Pack a thumb context into the kernel fixed-order metric vector"""
+    metric_vec = np.empty(N_RULE_METRICS)
+    metric_vec[PE] = ctx['pe']
+    metric_vec[DE] = ctx['de'] or 0
+    metric_vec[CR] = ctx['cr'] or 0
+    metric_vec[REV_GROWTH] = ctx['rev_growth']
+    metric_vec[EPS_GROWTH] = ctx['eps_growth']
+    metric_vec[ROE] = ctx['roe']
+    metric_vec[PAYOUT] = ctx['payout']
+    metric_vec[PB] = ctx['pb'] or 0
+    metric_vec[FCF] = ctx['fcf'] or 0
+    return metric_vec
+
+
+def _thumb_report(symbol: str, ctx: Dict[str, Any],
+                  scores: np.ndarray) -> Dict[str, Any]:
+    """Render the per-rule evaluations and summary for one symbol"""
+    # One table-driven pass over the twelve rules; the three advisory
+    # rules (slot None) carry a fixed score of 10
+    evaluations = [
+        {
+            'metric': metric,
+            'value': value_fn(ctx),
+            'rule': rule,
+            'status': status_fn(ctx),
+            'score': int(scores[slot]) if slot is not None else 10,
+            'tip': tip
+        }
+        for metric, rule, slot, value_fn, status_fn, tip in _THUMB_RULES
+    ]
+
+    overall_score = sum(e['score'] for e in evaluations)
+    max_score = len(evaluations) * 10
+    percentage = (overall_score / max_score) * 100
+
+    return {
+        'symbol': symbol,
+        'evaluations': evaluations,
+        'overall_score': overall_score,
+        'max_score': max_score,
+        'percentage': percentage,
+        'recommendation': _RECOMMENDATIONS[
+            bisect.bisect_right(_RECOMMENDATION_CUTS, percentage)
+        ]
+    }
+
+
+@lru_cache(maxsize=128)
+def _compile_predicate(bounds_key: tuple):
+    """
+    Compile a criteria tuple into a single vectorized predicate.
+
+    Args:
+        bounds_key: Tuple of (metric, min_or_None, max_or_None) entries
+
+    Returns:
+        Callable taking (columns dict, n_rows) and returning a bool mask
+    """
+    terms = []
+    ne_terms = []
+    for metric, lo, hi in bounds_key:
+        if lo is not None:
+            terms.append(f"(cols[{metric!r}] >= {lo!r})")
+            ne_terms.append(f"({metric} >= {lo!r})")
+        if hi is not None:
+            terms.append(f"(cols[{metric!r}] <= {hi!r})")
+            ne_terms.append(f"({metric} <= {hi!r})")
+
+    if not terms:
+        return lambda cols, n: np.ones(n, dtype=bool)
+
+    if NUMEXPR_AVAILABLE and len(ne_terms) >= 2:
+        # numexpr fuses the chained comparisons into a single pass over
+        # memory instead of allocating one intermediate mask per term
+        expr = " & ".join(ne_terms)
+        return lambda cols, n: numexpr.evaluate(expr, local_dict=cols)
+
+    # Thresholds are baked into the generated source, so evaluating the
+    # predicate is one compiled expression with no per-call dict parsing
+    return eval("lambda cols, n: " + " & ".join(terms))
+
+
+def top_k(df: pd.DataFrame, column: str, k: int, largest: bool = True) -> pd.DataFrame:
+    """
+    Select the top-k rows of a DataFrame by one column.
+
+    Uses np.argpartition (O(N)) to isolate the k candidates and only
+    sorts those, instead of the full O(N log N) sort that
+    nsmallest/nlargest perform.
+
+    Args:
+        df: DataFrame to select from
+        column: Column to rank by
+        k: Number of rows to return
+        largest: Rank descending if True, ascending if False
+
+    Returns:
+        DataFrame of at most k rows, sorted by the column
+    """
+    values = df[column].to_numpy(dtype=float)
+    if k >= len(values):
+        order = np.argsort(-values if largest else values)
+        return df.iloc[order]
+
+    keys = -values if largest else values
+    idx = np.argpartition(keys, k)[:k]
+    idx = idx[np.argsort(keys[idx])]
+    return df.iloc[idx]
+
+
+def create_session(pool_connections: int = 32, pool_maxsize: int = 64) -> requests.Session:
+    """
+    Create a requests.Session with HTTPS connection pooling and retries.
+
+    Reusing one session across yfinance calls keeps connections alive, so
+    repeated fetches skip the TCP+TLS handshake (~100-300 ms per call).
+
+    Args:
+        pool_connections: Number of connection pools to cache
+        pool_maxsize: Maximum connections to keep per pool
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
 
 class DataProvider:
@@ -34,134 +386,319 @@ class DataProvider:
     - Free Cash Flow: Should be positive and growing
     """
     
-    def __init__(self):
-        """Initialize the DataProvider"""
+    def __init__(self, session: Optional[requests.Session] = None,
+                 disk_cache_dir: Optional[str] = '~/.cache/stockscreener',
+                 disk_cache_ttl: int = 86400):
+        """
+        Initialize the DataProvider.
+
+        Args:
+            session: Optional shared requests.Session; a pooled one is
+                created if not provided
+            disk_cache_dir: Directory for the on-disk info cache, or
+                None to disable the disk tier
+            disk_cache_ttl: Seconds an on-disk entry stays valid
+                (fundamentals move quarterly, so a day is conservative)
+        """
         self.cache = {}
         self.cache_timeout = 300  # 5 minutes
-    
+        self.session = session or create_session()
+        self.disk_cache_ttl = disk_cache_ttl
+        self.disk_cache_dir = None
+        if disk_cache_dir:
+            try:
+                path = os.path.expanduser(disk_cache_dir)
+                os.makedirs(path, exist_ok=True)
+                self.disk_cache_dir = path
+            except OSError:
+                # No writable cache dir: run with the memory tier only
+                pass
+
+    def _disk_cache_path(self, symbol: str) -> str:
+        """Return the on-disk cache file for a symbol's info payload"""
+        safe = ''.join(c if c.isalnum() or c in '.-_' else '_'
+                       for c in symbol.upper())
+        return os.path.join(self.disk_cache_dir, f'info-{safe}.pkl')
+
+    def _disk_cache_get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Load a symbol's info payload from disk if still within TTL"""
+        if self.disk_cache_dir is None:
+            return None
+        path = self._disk_cache_path(symbol)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.disk_cache_ttl:
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+
+    def _disk_cache_put(self, symbol: str, info: Dict[str, Any]) -> None:
+        """Persist a symbol's info payload; write-then-rename for atomicity"""
+        if self.disk_cache_dir is None:
+            return
+        path = self._disk_cache_path(symbol)
+        try:
+            tmp = f'{path}.{os.getpid()}.tmp'
+            with open(tmp, 'wb') as f:
+                pickle.dump(info, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except (OSError, pickle.PickleError):
+            # Caching is best-effort; the fetch already succeeded
+            pass
+
+    def _cache_get(self, key):
+        """Return a cached value if present and younger than cache_timeout"""
+        entry = self.cache.get(key)
+        if entry is not None and time.time() - entry[0] < self.cache_timeout:
+            return entry[1]
+        return None
+
+    def _cache_put(self, key, value) -> None:
+        """Store a value in the cache with the current timestamp"""
+        self.cache[key] = (time.time(), value)
+
     def get_stock_data(self, symbol: str) -> Optional[StockData]:
         """
         Fetch stock data for a single symbol.
-        
+
+        Results are cached in-process for cache_timeout seconds, so
+        repeated lookups of the same symbol (e.g. a ticker appearing in
+        several screens) hit a dict instead of the network.
+
         Args:
             symbol: Stock ticker symbol (e.g., 'AAPL')
-            
+
         Returns:
             StockData object or None if fetch fails
         """
+        cache_key = ('data', symbol.upper())
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            
-            # Get financial statements for more detailed data
-            try:
-                balance_sheet = ticker.balance_sheet
-                income_stmt = ticker.income_stmt
-                cash_flow = ticker.cashflow
-            except Exception:
-                balance_sheet = pd.DataFrame()
-                income_stmt = pd.DataFrame()
-                cash_flow = pd.DataFrame()
-            
-            # Extract key metrics with safe defaults
+            ticker = yf.Ticker(symbol, session=self.session)
+            return self.stock_data_from_info(symbol, ticker.info)
+        except Exception as e:
+            logger.warning("Error fetching data for %s: %s", symbol, e)
+            return None
+
+    def stock_data_from_info(self, symbol: str,
+                             info: Dict[str, Any]) -> Optional[StockData]:
+        """
+        Build a StockData from an already-fetched info dict.
+
+        Everything StockData needs lives in the info payload, so callers
+        that already hold one (e.g. analyze_stock after get_stock_info)
+        can derive the StockData without a second set of round trips.
+        The result lands in the same cache slot get_stock_data uses.
+
+        Args:
+            symbol: Stock ticker symbol
+            info: yfinance info dict for that symbol
+
+        Returns:
+            StockData object or None if the payload is unusable
+        """
+        cache_key = ('data', symbol.upper())
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            # Bulk of the fields come straight off the tables; the few
+            # with fallback chains or unit quirks stay explicit below
+            values = {}
+            for attr, key, scale in _NUMERIC_FIELDS:
+                value = info.get(key) or 0
+                values[attr] = value * scale if scale != 1.0 else value
+            for attr, key in _OPTIONAL_FIELDS:
+                values[attr] = info.get(key)
+
             price = info.get('currentPrice') or info.get('regularMarketPrice', 0)
-            eps = info.get('trailingEps', 0) or 0
-            market_cap = info.get('marketCap', 0) or 0
-            shares_outstanding = info.get('sharesOutstanding', 1) or 1
-            
-            # Revenue and income
-            revenue = info.get('totalRevenue', 0) or 0
-            net_income = info.get('netIncomeToCommon', 0) or 0
-            
-            # Balance sheet items
-            total_assets = info.get('totalAssets', 0) or 0
             total_liabilities = info.get('totalLiab', 0) or info.get('totalDebt', 0) or 0
-            cash = info.get('totalCash', 0) or 0
-            debt = info.get('totalDebt', 0) or 0
-            
-            # Book value
-            book_value = info.get('bookValue', 0) or 0
-            
-            # Growth metrics
-            revenue_growth = (info.get('revenueGrowth', 0) or 0) * 100  # Convert to percentage
-            earnings_growth = (info.get('earningsGrowth', 0) or 0) * 100
-            
-            # Dividend info
-            dividend_rate = info.get('dividendRate', 0) or 0
-            dividend_yield = (info.get('dividendYield', 0) or 0) * 100  # Convert to percentage
-            
-            # Pre-calculated ratios from yfinance
-            pe_ratio = info.get('trailingPE')
-            pb_ratio = info.get('priceToBook')
-            peg_ratio = info.get('pegRatio')
-            roe = (info.get('returnOnEquity', 0) or 0) * 100
-            roa = (info.get('returnOnAssets', 0) or 0) * 100
-            debt_to_equity = info.get('debtToEquity', 0) or 0
-            current_ratio = info.get('currentRatio')
-            quick_ratio = info.get('quickRatio')
-            
+            shares_outstanding = info.get('sharesOutstanding', 1) or 1
+
+            # yfinance reports debtToEquity in percent; StockData's
+            # contract is a plain ratio. Flag payloads outside the sane
+            # ratio range so an upstream format change surfaces early
+            # instead of silently skewing screens.
+            debt_to_equity = (info.get('debtToEquity', 0) or 0) / 100
+            if not 0 <= debt_to_equity < 50:
+                logger.warning(
+                    "Suspicious debt_to_equity %.2f for %s: yfinance "
+                    "payload format may have changed", debt_to_equity, symbol)
+
             stock_data = StockData(
                 symbol=symbol.upper(),
                 price=price,
-                eps=eps,
-                revenue=revenue,
-                net_income=net_income,
-                total_assets=total_assets,
                 total_liabilities=total_liabilities,
-                cash=cash,
-                debt=debt,
                 shares_outstanding=shares_outstanding,
-                market_cap=market_cap,
-                dividend_per_share=dividend_rate,
-                book_value_per_share=book_value,
-                revenue_growth=revenue_growth,
-                earnings_growth=earnings_growth,
-                dividend_yield=dividend_yield,
-                pe_ratio=pe_ratio,
-                pb_ratio=pb_ratio,
-                peg_ratio=peg_ratio,
-                roe=roe,
-                roa=roa,
-                debt_to_equity=debt_to_equity / 100 if debt_to_equity else None,  # yfinance returns as percentage
-                current_ratio=current_ratio,
-                quick_ratio=quick_ratio
+                debt_to_equity=debt_to_equity or None,
+                **values
             )
-            
+
+            self._cache_put(cache_key, stock_data)
             return stock_data
-            
+
         except Exception as e:
-            print(f"Error fetching data for {symbol}: {e}")
+            logger.warning("Error building stock data for %s: %s", symbol, e)
             return None
     
-    def get_multiple_stocks(self, symbols: List[str]) -> List[StockData]:
+    def get_multiple_stocks(self, symbols: List[str],
+                            max_workers: int = 16) -> List[StockData]:
         """
         Fetch data for multiple stock symbols.
-        
+
+        The per-symbol fetches are blocking network I/O, so they run
+        concurrently on a bounded thread pool (requests releases the GIL
+        while waiting on the socket). executor.map keeps the results in
+        input order.
+
         Args:
             symbols: List of stock ticker symbols
-            
+            max_workers: Maximum number of concurrent fetches
+
         Returns:
             List of StockData objects (excludes failed fetches)
         """
-        stocks = []
-        for symbol in symbols:
-            stock = self.get_stock_data(symbol)
-            if stock:
-                stocks.append(stock)
-        return stocks
+        if not symbols:
+            return []
+
+        with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(symbols))) as executor:
+            fetched = executor.map(self.get_stock_data, symbols)
+
+        return [stock for stock in fetched if stock]
     
+    async def get_multiple_stocks_async(self, symbols: List[str],
+                                        max_workers: int = 16) -> List[StockData]:
+        """
+        Async counterpart of get_multiple_stocks.
+
+        Lets event-loop callers (an async web handler, a notebook) fan
+        out a large watchlist without blocking the loop: each fetch is
+        awaited off-loop via run_in_executor and the results are
+        gathered in input order. The fetches themselves stay on
+        yfinance so Yahoo's cookie/crumb handshake keeps working.
+
+        Args:
+            symbols: List of stock ticker symbols
+            max_workers: Maximum number of concurrent fetches
+
+        Returns:
+            List of StockData objects (excludes failed fetches)
+        """
+        if not symbols:
+            return []
+
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(symbols))) as executor:
+            fetched = await asyncio.gather(
+                *(loop.run_in_executor(executor, self.get_stock_data, symbol)
+                  for symbol in symbols)
+            )
+
+        return [stock for stock in fetched if stock]
+
+    def download_price_matrix(self, symbols: List[str],
+                              period: str = '1y') -> pd.DataFrame:
+        """
+        Download daily closes for many symbols in one HTTP request.
+
+        yf.download batches all tickers into a single call, so the
+        price-history portion of a batch costs one round-trip instead of
+        one per symbol.
+
+        Args:
+            symbols: List of stock ticker symbols
+            period: History window to request
+
+        Returns:
+            DataFrame of close prices, one column per symbol (empty on
+            failure)
+        """
+        try:
+            data = yf.download(
+                tickers=' '.join(symbols),
+                period=period,
+                group_by='ticker',
+                threads=True,
+                session=self.session,
+                progress=False
+            )
+        except Exception as e:
+            logger.warning("Error downloading price history: %s", e)
+            return pd.DataFrame()
+
+        if data is None or data.empty:
+            return pd.DataFrame()
+
+        if isinstance(data.columns, pd.MultiIndex):
+            tickers = data.columns.get_level_values(0)
+            closes = {symbol: data[symbol]['Close']
+                      for symbol in symbols if symbol in tickers}
+            return pd.DataFrame(closes)
+
+        # Single symbol: yfinance returns a flat frame
+        return data[['Close']].rename(columns={'Close': symbols[0]})
+
+    def get_multiple_infos(self, symbols: List[str],
+                           max_workers: int = 16) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch info dicts for many symbols concurrently.
+
+        One bounded thread pool overlaps the blocking .info round trips,
+        and every dict lands in the TTL cache, so downstream per-symbol
+        lookups (analyze_stock, stock_data_from_info) become dict hits.
+
+        Args:
+            symbols: List of stock ticker symbols
+            max_workers: Maximum number of concurrent fetches
+
+        Returns:
+            Dict mapping upper-cased symbol to its info dict (symbols
+            whose fetch failed are omitted)
+        """
+        if not symbols:
+            return {}
+
+        with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(symbols))) as executor:
+            infos = executor.map(self.get_stock_info, symbols)
+
+        return {symbol.upper(): info
+                for symbol, info in zip(symbols, infos) if info}
+
     def get_stock_info(self, symbol: str) -> Dict[str, Any]:
         """
         Get raw stock info dictionary for detailed analysis.
-        
+
+        Cached in-process alongside get_stock_data under the same
+        cache_timeout.
+
         Args:
             symbol: Stock ticker symbol
-            
+
         Returns:
             Dictionary with all available stock information
         """
+        cache_key = ('info', symbol.upper())
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Second tier: fundamentals move quarterly, so a day-old disk
+        # entry beats a 300 ms network round trip
+        disk_info = self._disk_cache_get(symbol)
+        if disk_info is not None:
+            self._cache_put(cache_key, disk_info)
+            return disk_info
+
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self.session)
             info = ticker.info
             
             # Add computed metrics
@@ -183,11 +720,13 @@ class DataProvider:
             
             # Payout ratio
             info['payout_ratio'] = info.get('payoutRatio', 0)
-            
+
+            self._cache_put(cache_key, info)
+            self._disk_cache_put(symbol, info)
             return info
-            
+
         except Exception as e:
-            print(f"Error fetching info for {symbol}: {e}")
+            logger.warning("Error fetching info for %s: %s", symbol, e)
             return {}
 
 
@@ -208,31 +747,85 @@ class StockScreener:
     - Free Cash Flow: Should be positive and growing
     """
     
-    def __init__(self):
-        """Initialize the StockScreener"""
-        self.data_provider = DataProvider()
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize the StockScreener.
+
+        Args:
+            session: Optional shared requests.Session threaded through to
+                the DataProvider for connection reuse
+        """
+        self.data_provider = DataProvider(session=session)
         self.analyzer = StockAnalyzer()
         self.engine = ScreeningEngine()
-    
+        # Singleflight state: concurrent requests for the same symbol share
+        # one in-flight analysis instead of each hitting the network
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
     def analyze_stock(self, symbol: str) -> Dict[str, Any]:
         """
         Perform comprehensive analysis on a single stock.
-        
+
+        Concurrent calls for the same symbol are coalesced: the first
+        caller performs the fetch and every overlapping caller waits on
+        the same result, so a burst of identical requests costs one
+        network round-trip.
+
         Args:
             symbol: Stock ticker symbol
-            
+
         Returns:
             Dictionary with all analysis results and metrics
         """
-        # Get raw info for additional data points
+        key = symbol.upper()
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                leader = False
+            else:
+                future = Future()
+                self._inflight[key] = future
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = self._analyze_stock_impl(symbol)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _analyze_stock_impl(self, symbol: str) -> Dict[str, Any]:
+        """Run the actual fetch and analysis for analyze_stock"""
+        # Get raw info once and derive the StockData from it, instead of
+        # paying a second fetch for the same payload
         info = self.data_provider.get_stock_info(symbol)
-        stock_data = self.data_provider.get_stock_data(symbol)
-        
+        stock_data = None
+        if info:
+            stock_data = self.data_provider.stock_data_from_info(symbol, info)
+
         if not stock_data:
+            if info:
+                # The fetch itself succeeded but the payload carries no
+                # usable fundamentals: the symbol does not exist
+                # upstream, so callers may negative-cache it
+                raise SymbolNotFoundError(f"Could not fetch data for {symbol}")
+            # Empty info means the lookup errored (timeout, rate limit,
+            # DNS); deliberately not a SymbolNotFoundError so a
+            # transient failure is never remembered as a bad ticker
             raise ValueError(f"Could not fetch data for {symbol}")
         
-        # Get analysis from the engine
-        analysis = self.analyzer.analyze(stock_data)
+        # Get analysis from the engine's fingerprint-cached universe
+        # path, so repeat calls for unchanged numbers skip the compute
+        analysis = self.engine.analyze_universe([stock_data])[stock_data.symbol]
         
         # Combine all data
         result = {
@@ -272,12 +865,14 @@ class StockScreener:
             'beta': info.get('beta', 1),
             'volatility': info.get('volatility', 0),
             'sharpe_ratio': 0,  # Requires historical price data
+            'sector': info.get('sector', 'Unknown'),
             'debt_rating': 'N/A',
             'quality_score': analysis.get('quality_score', 0) / 10,
             'ev_ebitda': info.get('enterpriseToEbitda', 0) or 0,
             
             # Signals and scores from our analysis
-            'signals': analysis.get('signals', []),
+            # Signals are a bitmask internally; decode to names at the edge
+            'signals': Signal.decode(analysis.get('signals', 0)),
             'risk_score': analysis.get('risk_score', 0),
             'fundamental_strength': analysis.get('fundamental_strength', 'N/A'),
             'valuation_score': analysis.get('valuation_score', 0),
@@ -287,36 +882,79 @@ class StockScreener:
         
         return result
     
-    def batch_analyze(self, symbols: List[str], metrics: List[str] = None) -> pd.DataFrame:
+    def batch_analyze(self, symbols: List[str], metrics: List[str] = None,
+                      max_workers: int = 16) -> pd.DataFrame:
         """
         Analyze multiple stocks and return results as a DataFrame.
-        
+
+        Fetches run concurrently in a bounded thread pool since the work is
+        dominated by blocking network I/O, so N symbols take roughly
+        ceil(N / max_workers) round-trips instead of N.
+
         Args:
             symbols: List of stock ticker symbols
             metrics: Optional list of metrics to include (includes all if None)
-            
+            max_workers: Maximum number of concurrent fetches
+
         Returns:
             DataFrame with analysis results for all stocks
         """
-        results = []
-        for symbol in symbols:
-            try:
-                analysis = self.analyze_stock(symbol)
-                results.append(analysis)
-            except Exception as e:
-                print(f"Error analyzing {symbol}: {e}")
-        
+        # Warm the info cache in one batched phase so the per-symbol
+        # analyses below run against dict lookups instead of the network
+        self.data_provider.get_multiple_infos(symbols, max_workers=max_workers)
+
+        analyses = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.analyze_stock, symbol): symbol
+                       for symbol in symbols}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    analyses[symbol] = future.result()
+                except Exception as e:
+                    logger.warning("Error analyzing %s: %s", symbol, e)
+
+        # Preserve the caller's symbol ordering in the output
+        results = [analyses[symbol] for symbol in symbols if symbol in analyses]
+
         if not results:
             return pd.DataFrame()
-        
-        df = pd.DataFrame(results)
-        
+
+        # Refresh the price-history columns from one bulk download
+        # instead of trusting the per-symbol info snapshots
+        price_cols = ('52week_high', '52week_low', '52week_change',
+                      'volatility', 'beta', 'sharpe_ratio')
+        if metrics is None or any(c in metrics for c in price_cols):
+            batch_symbols = [record['symbol'] for record in results]
+            closes = self.data_provider.download_price_matrix(
+                batch_symbols + [BENCHMARK_SYMBOL]
+            )
+            present = [s for s in batch_symbols if s in closes.columns]
+            if present:
+                benchmark = None
+                if BENCHMARK_SYMBOL in closes.columns:
+                    benchmark = closes[BENCHMARK_SYMBOL].to_numpy()
+                price_metrics = compute_price_metrics(
+                    closes[present].to_numpy(), benchmark
+                )
+                position = {symbol: i for i, symbol in enumerate(present)}
+                for record in results:
+                    i = position.get(record['symbol'])
+                    if i is None:
+                        continue
+                    for col, values in price_metrics.items():
+                        if np.isfinite(values[i]):
+                            record[col] = float(values[i])
+
         if metrics:
-            # Always include symbol
-            cols = ['symbol'] + [m for m in metrics if m in df.columns and m != 'symbol']
-            df = df[cols]
-        
-        return df
+            # Always include symbol, and pre-project so pandas never
+            # allocates columns the caller is going to drop anyway
+            available = results[0].keys()
+            cols = ['symbol'] + [m for m in metrics
+                                 if m in available and m != 'symbol']
+            return apply_schema(pd.DataFrame.from_records(results, columns=cols))
+
+        return apply_schema(pd.DataFrame.from_records(results))
     
     def screen_stocks(self, symbols: List[str], strategy=None, criteria: Dict = None) -> pd.DataFrame:
         """
@@ -348,259 +986,201 @@ class StockScreener:
         else:
             filtered_stocks = stocks
         
-        # Convert to DataFrame
-        results = []
-        for stock in filtered_stocks:
-            analysis = self.analyzer.analyze(stock)
-            result = {
-                'symbol': stock.symbol,
-                'current_price': stock.price,
-                'pe_ratio': analysis['metrics'].get('pe_ratio', 0),
-                'pb_ratio': analysis['metrics'].get('pb_ratio', 0),
-                'roe': analysis['metrics'].get('roe', 0) / 100,
-                'roa': analysis['metrics'].get('roa', 0) / 100,
-                'dividend_yield': stock.dividend_yield / 100,
-                'debt_to_equity': analysis['metrics'].get('debt_to_equity', 0),
-                'current_ratio': analysis['metrics'].get('current_ratio', 0),
-                'revenue_growth': stock.revenue_growth / 100,
-                'earnings_growth': stock.earnings_growth / 100,
-                'payout_ratio': 0,  # Would need additional data
-                'fundamental_strength': analysis.get('fundamental_strength', 'N/A'),
-                'quality_score': analysis.get('quality_score', 0),
-                'valuation_score': analysis.get('valuation_score', 0)
-            }
-            results.append(result)
-        
-        return pd.DataFrame(results)
+        # Build the frame column-at-a-time from preallocated arrays; the
+        # analyses were already computed (and cached) by the filtering
+        # pass, so the fills are dict lookups and pandas never runs its
+        # row-wise dtype inference over a list of dicts
+        analysis_map = self.engine.analyze_universe(filtered_stocks)
+        n = len(filtered_stocks)
+        numeric_cols = ('current_price', 'pe_ratio', 'pb_ratio', 'roe',
+                        'roa', 'dividend_yield', 'debt_to_equity',
+                        'current_ratio', 'revenue_growth',
+                        'earnings_growth', 'quality_score',
+                        'valuation_score')
+        cols: Dict[str, np.ndarray] = {
+            name: np.empty(n) for name in numeric_cols
+        }
+        symbols = np.empty(n, dtype=object)
+        strengths = np.empty(n, dtype=object)
+
+        for i, stock in enumerate(filtered_stocks):
+            analysis = analysis_map[stock.symbol]
+            metrics = analysis['metrics']
+            symbols[i] = stock.symbol
+            cols['current_price'][i] = stock.price
+            cols['pe_ratio'][i] = metrics.get('pe_ratio', 0)
+            cols['pb_ratio'][i] = metrics.get('pb_ratio', 0)
+            cols['roe'][i] = metrics.get('roe', 0) / 100
+            cols['roa'][i] = metrics.get('roa', 0) / 100
+            cols['dividend_yield'][i] = stock.dividend_yield / 100
+            cols['debt_to_equity'][i] = metrics.get('debt_to_equity', 0)
+            cols['current_ratio'][i] = metrics.get('current_ratio', 0)
+            cols['revenue_growth'][i] = stock.revenue_growth / 100
+            cols['earnings_growth'][i] = stock.earnings_growth / 100
+            strengths[i] = analysis.get('fundamental_strength', 'N/A')
+            cols['quality_score'][i] = analysis.get('quality_score', 0)
+            cols['valuation_score'][i] = analysis.get('valuation_score', 0)
+
+        return pd.DataFrame({
+            'symbol': symbols,
+            'current_price': cols['current_price'],
+            'pe_ratio': cols['pe_ratio'],
+            'pb_ratio': cols['pb_ratio'],
+            'roe': cols['roe'],
+            'roa': cols['roa'],
+            'dividend_yield': cols['dividend_yield'],
+            'debt_to_equity': cols['debt_to_equity'],
+            'current_ratio': cols['current_ratio'],
+            'revenue_growth': cols['revenue_growth'],
+            'earnings_growth': cols['earnings_growth'],
+            'payout_ratio': np.zeros(n),  # Would need additional data
+            'fundamental_strength': strengths,
+            'quality_score': cols['quality_score'],
+            'valuation_score': cols['valuation_score']
+        }, copy=False)
     
     def _apply_criteria(self, stocks: List[StockData], criteria: Dict) -> List[StockData]:
         """
         Filter stocks based on criteria dictionary.
-        
+
         Criteria format:
         {
             'pe_ratio': {'min': 5, 'max': 20},
             'roe': {'min': 0.15},
             'debt_to_equity': {'max': 1.0}
         }
+
+        The criteria dict is compiled once into a single vectorized
+        predicate (cached per criteria shape, so repeated screens with
+        the same strategy reuse the compiled bytecode) and evaluated
+        over numpy metric columns in one shot.
         """
-        filtered = []
-        
-        for stock in stocks:
-            analysis = self.analyzer.analyze(stock)
-            metrics = analysis['metrics']
-            
-            passes = True
-            for metric, bounds in criteria.items():
-                # Map criteria names to metric names
-                metric_map = {
-                    'pe_ratio': 'pe_ratio',
-                    'pb_ratio': 'pb_ratio',
-                    'roe': 'roe',
-                    'roa': 'roa',
-                    'debt_to_equity': 'debt_to_equity',
-                    'current_ratio': 'current_ratio',
-                    'dividend_yield': 'dividend_yield',
-                    'revenue_growth': 'revenue_growth',
-                    'earnings_growth': 'earnings_growth',
-                    'payout_ratio': 'payout_ratio',
-                    'interest_coverage': 'interest_coverage',
-                    'debt_to_assets': 'debt_to_assets',
-                    'free_cash_flow': 'free_cash_flow',
-                    'years_of_dividends': 'years_of_dividends'
-                }
-                
-                actual_metric = metric_map.get(metric, metric)
-                
-                # Get the value (check metrics dict first, then stock attributes)
-                if actual_metric in metrics:
-                    value = metrics[actual_metric]
-                elif hasattr(stock, actual_metric):
-                    value = getattr(stock, actual_metric)
-                else:
-                    continue  # Skip unknown metrics
-                
-                # Check bounds
-                if 'min' in bounds and value < bounds['min']:
-                    passes = False
-                    break
-                if 'max' in bounds and value > bounds['max']:
-                    passes = False
-                    break
-            
-            if passes:
-                filtered.append(stock)
-        
-        return filtered
+        if not stocks:
+            return []
+
+        # One cached batch analysis; screen_stocks reuses these entries
+        # when it builds the output frame
+        analysis_map = self.engine.analyze_universe(stocks)
+        analyses = [analysis_map[stock.symbol] for stock in stocks]
+        first_metrics = analyses[0]['metrics']
+
+        columns = {}
+        bounds_key = []
+        for metric, bounds in criteria.items():
+            actual_metric = METRIC_MAP.get(metric, metric)
+
+            # Build the metric column (check metrics dict first, then
+            # stock attributes); skip unknown metrics entirely
+            if actual_metric in first_metrics:
+                values = np.array(
+                    [a['metrics'][actual_metric] for a in analyses],
+                    dtype=float
+                )
+            elif hasattr(stocks[0], actual_metric):
+                values = np.array(
+                    [getattr(stock, actual_metric) for stock in stocks],
+                    dtype=float
+                )
+            else:
+                continue
+
+            columns[actual_metric] = values
+            bounds_key.append(
+                (actual_metric, bounds.get('min'), bounds.get('max'))
+            )
+
+        if len(bounds_key) > 1:
+            # Order criteria most-selective first, estimated on a small
+            # sample, so the kernel's per-row early exit (and the
+            # generated predicate's mask chain) fails fast. AND is
+            # commutative, so the surviving set is unchanged.
+            sample = min(50, len(stocks))
+            failures = []
+            for metric, lo, hi in bounds_key:
+                head = columns[metric][:sample]
+                keep = np.ones(sample, dtype=bool)
+                if lo is not None:
+                    keep &= head >= lo
+                if hi is not None:
+                    keep &= head <= hi
+                failures.append(sample - int(keep.sum()))
+            bounds_key = [bounds_key[i] for i in
+                          sorted(range(len(bounds_key)),
+                                 key=failures.__getitem__, reverse=True)]
+
+        if NUMBA_AVAILABLE and bounds_key:
+            # One compiled pass over an (N, M) table with per-row early
+            # exit; NaN marks an unbounded side
+            values = np.column_stack(
+                [columns[metric] for metric, _, _ in bounds_key]
+            )
+            mins = np.array([np.nan if lo is None else float(lo)
+                             for _, lo, _ in bounds_key])
+            maxs = np.array([np.nan if hi is None else float(hi)
+                             for _, _, hi in bounds_key])
+            mask = filter_bounds(values, mins, maxs)
+        else:
+            predicate = _compile_predicate(tuple(bounds_key))
+            mask = predicate(columns, len(stocks))
+
+        return [stock for stock, keep in zip(stocks, mask) if keep]
     
     def get_rules_of_thumb_evaluation(self, symbol: str) -> Dict[str, Any]:
         """
         Evaluate a stock against all 12 standard rules of thumb.
         """
         analysis = self.analyze_stock(symbol)
-        ticker = yf.Ticker(symbol)
-        
-        evaluations = []
-        overall_score = 0
-        max_score = 0
-        
-        # 1. P/E Ratio (15-20 reasonable)
-        pe = analysis.get('pe_ratio', float('inf'))
-        pe_eval = {
-            'metric': 'P/E Ratio',
-            'value': f"{pe:.2f}" if pe != float('inf') else 'N/A',
-            'rule': '15-20 is reasonable',
-            'status': 'GOOD' if 15 <= pe <= 20 else ('UNDERVALUED' if pe < 15 else 'OVERVALUED'),
-            'score': 10 if 15 <= pe <= 20 else (8 if 10 <= pe < 15 else (5 if pe < 30 else 0)),
-            'tip': 'Compare to peers and the industry average.'
-        }
-        evaluations.append(pe_eval)
-        
-        # 2. Debt-to-Equity (<1 safer)
-        de = analysis.get('debt_to_equity', 0)
-        de_eval = {
-            'metric': 'Debt-to-Equity',
-            'value': f"{de:.2f}" if de is not None else 'N/A',
-            'rule': '<1 is safer',
-            'status': 'HEALTHY' if de and de < 1 else 'HIGH',
-            'score': 10 if de and de < 1 else (5 if de and de < 2 else 0),
-            'tip': "Ensure company's cash flow can service debt."
-        }
-        evaluations.append(de_eval)
-        
-        # 3. Current Ratio (2:1 healthy)
-        cr = analysis.get('current_ratio', 0)
-        cr_eval = {
-            'metric': 'Current Ratio',
-            'value': f"{cr:.2f}" if cr else 'N/A',
-            'rule': '2:1 is healthy',
-            'status': 'HEALTHY' if 1.5 <= cr <= 3 else ('LOW' if cr < 1.5 else 'INEFFICIENT'),
-            'score': 10 if 1.8 <= cr <= 2.5 else (7 if 1.5 <= cr <= 3 else 0),
-            'tip': 'Too high might suggest inefficient asset use.'
-        }
-        evaluations.append(cr_eval)
-        
-        # 4. Revenue Growth (Consistent)
-        rev_growth = analysis.get('revenue_growth', 0) * 100
-        rev_eval = {
-            'metric': 'Revenue Growth (YoY)',
-            'value': f"{rev_growth:.1f}%",
-            'rule': 'Look for consistent growth',
-            'status': 'STABLE' if rev_growth > 5 else 'VOLATILE',
-            'score': 10 if rev_growth > 10 else (5 if rev_growth > 0 else 0),
-            'tip': 'Sudden jumps or declines may suggest market disruption.'
-        }
-        evaluations.append(rev_eval)
-        
-        # 5. EPS Growth
-        eps_growth = analysis.get('earnings_growth', 0) * 100
-        eps_eval = {
-            'metric': 'EPS Growth (YoY)',
-            'value': f"{eps_growth:.1f}%",
-            'rule': 'Steady or rising',
-            'status': 'GROWING' if eps_growth > 0 else 'DECLINING',
-            'score': 10 if eps_growth > 10 else (5 if eps_growth > 0 else 0),
-            'tip': 'EPS should grow in tandem with revenue.'
-        }
-        evaluations.append(eps_eval)
-        
-        # 6. ROE (15%+)
-        roe = analysis.get('roe', 0) * 100
-        roe_eval = {
-            'metric': 'ROE',
-            'value': f"{roe:.1f}%",
-            'rule': '15%+ is good',
-            'status': 'EXCELLENT' if roe >= 15 else 'POOR',
-            'score': 10 if roe >= 15 else (5 if roe >= 10 else 0),
-            'tip': 'Compare ROE to peers in the same industry.'
-        }
-        evaluations.append(roe_eval)
-        
-        # 7. Dividend Payout Ratio (<60%)
-        payout = analysis.get('payout_ratio', 0) * 100
-        payout_eval = {
-            'metric': 'Payout Ratio',
-            'value': f"{payout:.1f}%" if payout else 'N/A',
-            'rule': '<60% is sustainable',
-            'status': 'SUSTAINABLE' if payout < 60 else 'HIGH',
-            'score': 10 if 0 < payout < 60 else (5 if 60 <= payout < 80 else 0),
-            'tip': 'Very high payout limit growth and reinvestment.'
-        }
-        evaluations.append(payout_eval)
-        
-        # 8. P/B Ratio (<1)
-        pb = analysis.get('pb_ratio', 0)
-        pb_eval = {
-            'metric': 'P/B Ratio',
-            'value': f"{pb:.2f}" if pb else 'N/A',
-            'rule': '<1 suggests undervaluation',
-            'status': 'UNDERVALUED' if pb and pb < 1 else 'FAIR/OVER',
-            'score': 10 if pb and pb < 1 else (7 if pb and pb < 2 else 3),
-            'tip': 'Better for asset-heavy industries.'
-        }
-        evaluations.append(pb_eval)
-        
-        # 9. Free Cash Flow
-        fcf = analysis.get('free_cash_flow', 0)
-        fcf_eval = {
-            'metric': 'Free Cash Flow',
-            'value': f"${fcf/1e9:.2f}B" if fcf else 'N/A',
-            'rule': 'Should be positive and growing',
-            'status': 'POSITIVE' if fcf and fcf > 0 else 'NEGATIVE',
-            'score': 10 if fcf and fcf > 0 else 0,
-            'tip': 'FCF is essential for dividends and debt repayment.'
-        }
-        evaluations.append(fcf_eval)
-        
-        # 10. Growth vs Value
-        is_growth = pe > 25 or eps_growth > 15
-        gv_eval = {
-            'metric': 'Category',
-            'value': 'Growth' if is_growth else 'Value',
-            'rule': 'Growth (High P/E) vs Value (Low P/E)',
-            'status': 'ANALYZED',
-            'score': 10,
-            'tip': 'Value offers safety; Growth offers high reward.'
-        }
-        evaluations.append(gv_eval)
-        
-        # 11. Diversification (Portfolio Rule)
-        div_eval = {
-            'metric': 'Diversification Advice',
-            'value': 'Review Weight',
-            'rule': 'Max 5% per stock',
-            'status': 'ADVICE',
-            'score': 10,
-            'tip': "Don't put more than 5% of your portfolio into a single stock."
-        }
-        evaluations.append(div_eval)
-        
-        # 12. Industry Comparison
-        sector = ticker.info.get('sector', 'Unknown')
-        ind_eval = {
-            'metric': 'Industry Context',
-            'value': sector,
-            'rule': 'Compare within the same industry',
-            'status': 'CONTEXT',
-            'score': 10,
-            'tip': 'Always compare metrics within the same industry.'
-        }
-        evaluations.append(ind_eval)
-        
-        # Summary calculations
-        overall_score = sum(e['score'] for e in evaluations)
-        max_score = len(evaluations) * 10
-        percentage = (overall_score / max_score) * 100
-        
+        ctx = _thumb_context(analysis)
+
+        # Score all numeric rules in one pass through the compiled kernel
+        scores = rules_of_thumb_scores(_thumb_metric_vec(ctx))
+
+        return _thumb_report(symbol, ctx, scores)
+
+    def get_rules_of_thumb_evaluation_batch(
+            self, symbols: List[str],
+            max_workers: int = 16) -> Dict[str, Dict[str, Any]]:
+        """
+        Evaluate many stocks against the rules of thumb in one pass.
+
+        Fetches the info payloads in one batched phase, then grades the
+        whole portfolio through the parallel batch kernel: the metric
+        vectors are stacked into an (N, 9) table and scored together,
+        so a 100-symbol review costs one kernel call instead of 100
+        interpreted grading ladders. Per-symbol output is identical to
+        get_rules_of_thumb_evaluation.
+
+        Args:
+            symbols: List of stock ticker symbols
+            max_workers: Maximum number of concurrent fetches
+
+        Returns:
+            Dict mapping upper-cased symbol to its evaluation (symbols
+            whose fetch failed are omitted)
+        """
+        if not symbols:
+            return {}
+
+        # One batched network phase; the analyses below are cache hits
+        self.data_provider.get_multiple_infos(symbols, max_workers=max_workers)
+
+        graded = []
+        for symbol in symbols:
+            try:
+                analysis = self.analyze_stock(symbol)
+            except ValueError:
+                continue
+            graded.append((symbol, _thumb_context(analysis)))
+
+        if not graded:
+            return {}
+
+        metric_table = np.stack(
+            [_thumb_metric_vec(ctx) for _, ctx in graded]
+        )
+        score_rows = rules_of_thumb_scores_batch(metric_table)
+
         return {
-            'symbol': symbol,
-            'evaluations': evaluations,
-            'overall_score': overall_score,
-            'max_score': max_score,
-            'percentage': percentage,
-            'recommendation': 'STRONG_BUY' if percentage >= 80 else (
-                'BUY' if percentage >= 60 else (
-                    'HOLD' if percentage >= 40 else 'SELL'
-                )
-            )
+            symbol.upper(): _thumb_report(symbol, ctx, score_rows[i])
+            for i, (symbol, ctx) in enumerate(graded)
         }
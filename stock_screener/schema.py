@@ -0,0 +1,76 @@
+"""
+Batch DataFrame Schema
+
+Explicit column dtypes for the analysis DataFrames. Declaring dtypes up
+front avoids pandas' two-pass object inference over list-of-dict input,
+and the narrower float32/category columns halve memory and double the
+SIMD lanes available to the vectorized screening masks.
+
+Ratios and scores fit comfortably in float32; absolute dollar amounts
+(market cap, cash flows) keep float64 for range.
+"""
+
+BATCH_SCHEMA = {
+    'symbol': 'category',
+    'current_price': 'float32',
+    'market_cap': 'float64',
+    'pe_ratio': 'float32',
+    'pb_ratio': 'float32',
+    'ps_ratio': 'float32',
+    'peg_ratio': 'float32',
+    'roe': 'float32',
+    'roa': 'float32',
+    'roic': 'float32',
+    'net_margin': 'float32',
+    'gross_margin': 'float32',
+    'operating_margin': 'float32',
+    'revenue_growth': 'float32',
+    'earnings_growth': 'float32',
+    'book_value_growth': 'float32',
+    'fcf_growth': 'float32',
+    'current_ratio': 'float32',
+    'quick_ratio': 'float32',
+    'debt_to_equity': 'float32',
+    'debt_to_assets': 'float32',
+    'interest_coverage': 'float32',
+    'debt_to_ebitda': 'float32',
+    'dividend_yield': 'float32',
+    'payout_ratio': 'float32',
+    'annual_dividend': 'float32',
+    'years_of_dividends': 'int16',
+    'free_cash_flow': 'float64',
+    'operating_cash_flow': 'float64',
+    'cash_conversion_ratio': 'float32',
+    '52week_high': 'float32',
+    '52week_low': 'float32',
+    '52week_change': 'float32',
+    'beta': 'float32',
+    'volatility': 'float32',
+    'sharpe_ratio': 'float32',
+    'quality_score': 'float32',
+    'ev_ebitda': 'float32',
+    'risk_score': 'float32',
+    'fundamental_strength': 'category',
+    'valuation_score': 'float32',
+    'growth_score': 'float32',
+    'momentum_score': 'float32',
+    'debt_rating': 'category'
+}
+
+
+def apply_schema(df):
+    """
+    Cast a DataFrame's known columns to their declared dtypes.
+
+    Columns absent from the frame (e.g. when the caller requested a
+    metrics subset) are skipped rather than raised on.
+
+    Args:
+        df: DataFrame whose columns should be narrowed
+
+    Returns:
+        The cast DataFrame
+    """
+    dtypes = {col: dtype for col, dtype in BATCH_SCHEMA.items()
+              if col in df.columns}
+    return df.astype(dtypes, copy=False) if dtypes else df
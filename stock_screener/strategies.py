@@ -5,38 +5,526 @@ Provides strategy classes for different investment styles.
 Each strategy encapsulates specific screening criteria based on investment philosophy.
 """
 
-from typing import Dict, Any, List
-from dataclasses import dataclass
-
-
-@dataclass
-class ScreeningCriteria:
-    """Base criteria for stock screening"""
-    pe_ratio: Dict[str, float] = None
-    pb_ratio: Dict[str, float] = None
-    roe: Dict[str, float] = None
-    roa: Dict[str, float] = None
-    debt_to_equity: Dict[str, float] = None
-    current_ratio: Dict[str, float] = None
-    dividend_yield: Dict[str, float] = None
-    revenue_growth: Dict[str, float] = None
-    earnings_growth: Dict[str, float] = None
-    payout_ratio: Dict[str, float] = None
-    free_cash_flow: Dict[str, float] = None
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+from functools import lru_cache, reduce
+from types import MappingProxyType
+import math
+
+import numpy as np
+import pandas as pd
+
+from ._scoring import NUMBA_AVAILABLE, screen_bounds, screen_many_bounds
+
+# Optional GPU backend: only worth importing when installed
+try:
+    import cupy
+    CUPY_AVAILABLE = True
+except ImportError:
+    cupy = None
+    CUPY_AVAILABLE = False
+
+
+class ScreeningCriteria(NamedTuple):
+    """
+    Base criteria for stock screening.
+
+    Each metric holds a (lo, hi) float pair, open sides widened to
+    ±inf, so checking a value is the branchless lo <= v <= hi with no
+    per-lookup dict hashing. As a NamedTuple the instance is a plain
+    tuple underneath -- C-level field access, no per-instance __dict__,
+    immutable and hashable -- and iterating yields the bound pairs in
+    canonical field order, ready for the compile step. to_criteria()
+    bridges to the {'min'/'max'} dict format the strategy classes and
+    screen_stocks consume.
+    """
+
+    pe_ratio: Tuple[float, float] = (-math.inf, math.inf)
+    pb_ratio: Tuple[float, float] = (-math.inf, math.inf)
+    roe: Tuple[float, float] = (-math.inf, math.inf)
+    roa: Tuple[float, float] = (-math.inf, math.inf)
+    debt_to_equity: Tuple[float, float] = (-math.inf, math.inf)
+    current_ratio: Tuple[float, float] = (-math.inf, math.inf)
+    dividend_yield: Tuple[float, float] = (-math.inf, math.inf)
+    revenue_growth: Tuple[float, float] = (-math.inf, math.inf)
+    earnings_growth: Tuple[float, float] = (-math.inf, math.inf)
+    payout_ratio: Tuple[float, float] = (-math.inf, math.inf)
+    free_cash_flow: Tuple[float, float] = (-math.inf, math.inf)
+
+    def to_criteria(self) -> Dict[str, Dict[str, float]]:
+        """Return the bounded metrics in {'min'/'max'} dict form"""
+        criteria: Dict[str, Dict[str, float]] = {}
+        for name, (lo, hi) in zip(self._fields, self):
+            bound = {}
+            if lo != -math.inf:
+                bound['min'] = float(lo)
+            if hi != math.inf:
+                bound['max'] = float(hi)
+            if bound:
+                criteria[name] = bound
+        return criteria
+
+    def __repr__(self):
+        bounded = ', '.join(
+            f'{name}={pair}' for name, pair in zip(self._fields, self)
+            if tuple(pair) != (-math.inf, math.inf)
+        )
+        return f'{self.__class__.__name__}({bounded})'
+
+
+# Interned bound dicts: the same (min, max) pair is one shared
+# read-only mapping no matter how many strategies or profiles use it,
+# so identical bounds compare by identity and import allocates each
+# shape once
+_BOUND_POOL: Dict[tuple, MappingProxyType] = {}
+
+
+def _bound(lo: Optional[float] = None,
+           hi: Optional[float] = None) -> MappingProxyType:
+    """Return the shared {'min'/'max'} mapping for one bound pair"""
+    cached = _BOUND_POOL.get((lo, hi))
+    if cached is None:
+        bound = {}
+        if lo is not None:
+            bound['min'] = lo
+        if hi is not None:
+            bound['max'] = hi
+        cached = _BOUND_POOL[(lo, hi)] = MappingProxyType(bound)
+    return cached
+
+
+@lru_cache(maxsize=None)
+def _compile_bounds(bounds_key: tuple, column_order: tuple):
+    """
+    Build the flat bound arrays for one criteria shape and column order.
+
+    Cached without bound: a strategy evaluated against many universes
+    sharing a schema compiles once, and same-shape strategy instances
+    share the arrays. Callers treat the returned arrays as read-only.
+
+    Args:
+        bounds_key: Tuple of (metric, lo, hi) entries with +/-inf for
+            open sides, as produced by BaseStrategy._bounds_key()
+        column_order: Metric name per matrix column
+
+    Returns:
+        (col_idx int64, lo float64, hi float64) parallel arrays
+    """
+    position = {name: i for i, name in enumerate(column_order)}
+    col_idx, lo, hi = [], [], []
+    for metric, lo_value, hi_value in bounds_key:
+        if metric not in position:
+            continue
+        col_idx.append(position[metric])
+        lo.append(lo_value)
+        hi.append(hi_value)
+
+    return (np.asarray(col_idx, dtype=np.int64),
+            np.asarray(lo), np.asarray(hi))
+
+
+@lru_cache(maxsize=128)
+def _compile_frame_predicate(bounds_key: tuple):
+    """
+    Generate a specialized mask function for one criteria shape.
+
+    The thresholds are inlined as constants into the generated source,
+    so evaluating a strategy is one compiled expression of chained
+    comparisons — no dict walk, no branches on which bound exists.
+    Cached per criteria shape, so every instance of a strategy with the
+    same bounds shares one code object.
+
+    Args:
+        bounds_key: Tuple of (metric, lo, hi) entries with +/-inf for
+            open sides
+
+    Returns:
+        Callable taking (columns dict, n_rows) and returning a bool mask
+    """
+    terms = []
+    for metric, lo, hi in bounds_key:
+        if lo != -math.inf:
+            terms.append(f"(cols[{metric!r}] >= {lo!r})")
+        if hi != math.inf:
+            terms.append(f"(cols[{metric!r}] <= {hi!r})")
+
+    if not terms:
+        return lambda cols, n: np.ones(n, dtype=bool)
+    return eval("lambda cols, n: " + " & ".join(terms))
+
+
+class ScreeningPlan:
+    """
+    Logical description of a screen: what to filter, not how.
+
+    An immutable, hashable tuple of (metric, lo, hi) triples with
+    +/-inf for open sides -- the canonical form every screening
+    front-end (criteria dicts, ScreeningCriteria, profiles) lowers to.
+    Plans are cheap to build, compare by value, serialize to plain
+    JSON, and are the cache key for compiled executors: the same plan
+    against the same schema compiles exactly once per process.
+    """
+
+    __slots__ = ('bounds',)
+
+    def __init__(self, bounds):
+        object.__setattr__(self, 'bounds', tuple(bounds))
+
+    def __setattr__(self, attr, value):
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def __hash__(self):
+        return hash(self.bounds)
+
+    def __eq__(self, other):
+        if not isinstance(other, ScreeningPlan):
+            return NotImplemented
+        return self.bounds == other.bounds
+
+    def __repr__(self):
+        return f'ScreeningPlan({list(self.bounds)!r})'
+
+    @classmethod
+    def from_criteria(cls, criteria: Dict) -> 'ScreeningPlan':
+        """Build a plan from a {'min'/'max'} criteria dict"""
+        return cls(
+            (metric, float(b['min']) if 'min' in b else -math.inf,
+             float(b['max']) if 'max' in b else math.inf)
+            for metric, b in criteria.items()
+        )
+
+    def to_criteria(self) -> Dict[str, Dict[str, float]]:
+        """Return the plan in the JSON-friendly {'min'/'max'} dict form"""
+        criteria: Dict[str, Dict[str, float]] = {}
+        for metric, lo, hi in self.bounds:
+            bound = {}
+            if lo != -math.inf:
+                bound['min'] = lo
+            if hi != math.inf:
+                bound['max'] = hi
+            criteria[metric] = bound
+        return criteria
+
+    def compile(self, schema: Tuple[str, ...]) -> 'ScreeningExecutor':
+        """
+        Lower the plan against a column schema into an executor.
+
+        Args:
+            schema: Metric name per matrix column; plan metrics absent
+                from the schema are skipped, as in apply()
+
+        Returns:
+            The process-wide ScreeningExecutor for (plan, schema)
+        """
+        return _executor_for(self.bounds, tuple(schema))
+
+
+class ScreeningExecutor:
+    """
+    Compiled physical form of one ScreeningPlan against one schema.
+
+    Holds the flat (col_idx, lo, hi) bound arrays and owns the hot
+    path: run(X) dispatches to the fused Numba kernel (with
+    selectivity-ordered bounds and native float32 support) or the
+    vectorized NumPy fallback. Executors are built only via
+    ScreeningPlan.compile() and shared process-wide, so Numba's
+    dispatcher sees one stable call site per plan/schema pair.
+    """
+
+    __slots__ = ('schema', '_col_idx', '_lo', '_hi', '_device_bounds')
+
+    def __init__(self, schema, col_idx, lo, hi):
+        self.schema = schema
+        self._col_idx = col_idx
+        self._lo = lo
+        self._hi = hi
+        self._device_bounds = None
+
+    def run(self, X: np.ndarray) -> np.ndarray:
+        """
+        Screen a metrics matrix laid out per this executor's schema.
+
+        Args:
+            X: Array of shape (n_stocks, n_columns); float32 is
+                screened natively, other dtypes convert to float64
+
+        Returns:
+            Boolean mask of rows inside every bound
+        """
+        if self._col_idx.size == 0:
+            return np.ones(X.shape[0], dtype=bool)
+
+        if NUMBA_AVAILABLE:
+            col_idx, lo, hi = self._col_idx, self._lo, self._hi
+            if col_idx.size > 1 and X.shape[0] > 1:
+                # Check the most selective bound first, estimated on a
+                # small sample, so the kernel's per-row early exit
+                # usually trips on the first comparison. The cached
+                # arrays are shared, so permute copies.
+                head = X[:min(50, X.shape[0]), :][:, col_idx]
+                failures = ((head < lo) | (head > hi)).sum(axis=0)
+                order = np.argsort(-failures, kind='stable')
+                col_idx, lo, hi = col_idx[order], lo[order], hi[order]
+
+            # Fused kernel: one scan, no per-criterion intermediates.
+            # float32 input screens in float32 (half the bandwidth);
+            # anything else lands in the float64 specialization
+            if X.dtype != np.float32:
+                X = np.ascontiguousarray(X, dtype=np.float64)
+            else:
+                X = np.ascontiguousarray(X)
+            return screen_bounds(X, col_idx, lo, hi)
+
+        vals = X[:, self._col_idx]
+        return ((vals >= self._lo) & (vals <= self._hi)).all(axis=1)
+
+    def run_cupy(self, X_cp) -> 'cupy.ndarray':
+        """
+        Screen a feature matrix that already lives on the GPU.
+
+        For universes in the millions of rows even the SIMD CPU path is
+        memory-bound; the same comparisons on HBM run at 10-50x the
+        bandwidth. The bound arrays are uploaded once per executor and
+        reused across calls, so steady-state traffic is just the matrix
+        read. The mask stays on device -- callers chain further GPU
+        work or cupy.asnumpy() it at the end of the pipeline.
+
+        Args:
+            X_cp: cupy array of shape (n_stocks, n_columns) laid out
+                per this executor's schema
+
+        Returns:
+            Boolean cupy mask of rows inside every bound; NaN fails
+            every bounded column, matching run()
+        """
+        if not CUPY_AVAILABLE:
+            raise RuntimeError("cupy is not installed")
+        if self._col_idx.size == 0:
+            return cupy.ones(X_cp.shape[0], dtype=bool)
+        if self._device_bounds is None:
+            self._device_bounds = (cupy.asarray(self._col_idx),
+                                   cupy.asarray(self._lo),
+                                   cupy.asarray(self._hi))
+        col_idx, lo, hi = self._device_bounds
+        vals = X_cp[:, col_idx]
+        return ((vals >= lo) & (vals <= hi)).all(axis=1)
+
+
+@lru_cache(maxsize=None)
+def _executor_for(bounds: tuple, schema: tuple) -> ScreeningExecutor:
+    """Return the shared executor for one (plan bounds, schema) pair"""
+    col_idx, lo, hi = _compile_bounds(bounds, schema)
+    return ScreeningExecutor(schema, col_idx, lo, hi)
+
+
+# Attributes compile() may rebind after construction: derived caches
+# that never enter a strategy's hash or equality
+_COMPILE_SLOTS = frozenset({'_col_idx', '_lo', '_hi', '_columns',
+                            '_executor'})
 
 
 class BaseStrategy:
-    """Base class for all investment strategies"""
-    
+    """
+    Base class for all investment strategies.
+
+    Strategies are frozen after construction: name, criteria and the
+    normalized bounds cannot be rebound, and instances hash and compare
+    by (class, name, bounds). That makes a strategy a usable cache key
+    -- compiled-kernel and screening-result caches no longer have to
+    fall back to id() or repr, and equal strategies dedupe. Only the
+    compile() caches stay writable, since they are derived state.
+    """
+    __slots__ = ('name', 'criteria', 'description', '_bounds',
+                 '_col_idx', '_lo', '_hi', '_columns', '_executor',
+                 '__weakref__')
+
     def __init__(self, name: str = "Custom", criteria: Dict = None, description: str = ""):
-        self.name = name
-        self.criteria = criteria or {}
-        self.description = description
+        setattr_ = object.__setattr__
+        setattr_(self, 'name', name)
+        setattr_(self, 'criteria', criteria or {})
+        setattr_(self, 'description', description)
+        # Bounds normalized once at construction: every criterion is a
+        # (lo, hi) float pair with +/-inf for a missing side, so hot
+        # paths run two unconditional comparisons per criterion instead
+        # of re-checking which keys each bound dict carries
+        setattr_(self, '_bounds', {
+            metric: (float(b['min']) if 'min' in b else -math.inf,
+                     float(b['max']) if 'max' in b else math.inf)
+            for metric, b in self.criteria.items()
+        })
+        # Filled by compile(): flat bound arrays for matrix screening
+        setattr_(self, '_col_idx', None)
+        setattr_(self, '_lo', None)
+        setattr_(self, '_hi', None)
+        setattr_(self, '_columns', None)
+        setattr_(self, '_executor', None)
+
+    def __setattr__(self, attr, value):
+        if attr not in _COMPILE_SLOTS:
+            raise AttributeError(
+                f"{type(self).__name__} is frozen; cannot set {attr!r}"
+            )
+        object.__setattr__(self, attr, value)
+
+    def __hash__(self):
+        # Sorted so insertion order of the criteria dict cannot split
+        # equal strategies across hash buckets; __eq__ compares the
+        # bounds dict order-insensitively and must agree
+        return hash((type(self).__name__, self.name,
+                     tuple(sorted(self._bounds.items()))))
+
+    def __eq__(self, other):
+        if not isinstance(other, BaseStrategy):
+            return NotImplemented
+        return (type(self) is type(other)
+                and self.name == other.name
+                and self._bounds == other._bounds)
     
+    def compile(self, column_order: List[str]) -> None:
+        """
+        Precompile the criteria dict into flat bound arrays.
+
+        Resolves through a process-wide cache keyed on (criteria
+        shape, column order), so re-compiling the same strategy against
+        a familiar schema is a dict hit. Stores three parallel arrays — column
+        index, lower bound and upper bound (open sides become ±inf) —
+        so apply_matrix never touches the dict again: the hot path is
+        one column gather plus branchless comparisons against
+        contiguous float64 buffers. Criteria naming columns absent from
+        column_order are skipped, as in apply().
+
+        Args:
+            column_order: Metric name per column of the matrices that
+                will be passed to apply_matrix
+        """
+        self._executor = _executor_for(self._bounds_key(),
+                                       tuple(column_order))
+        self._col_idx = self._executor._col_idx
+        self._lo = self._executor._lo
+        self._hi = self._executor._hi
+        self._columns = self._executor.schema
+
+    def _bounds_key(self) -> tuple:
+        """Flatten the normalized bounds into a hashable tuple"""
+        return tuple(
+            (metric, lo, hi) for metric, (lo, hi) in self._bounds.items()
+        )
+
+    def plan(self) -> ScreeningPlan:
+        """Return the strategy's logical plan: its canonical bounds"""
+        return ScreeningPlan(self._bounds_key())
+
+    def apply_matrix(self, X: np.ndarray) -> np.ndarray:
+        """
+        Screen a float64 metrics matrix with the precompiled bounds.
+
+        Thin wrapper over the strategy's compiled ScreeningExecutor.
+
+        Args:
+            X: Array of shape (n_stocks, n_columns) laid out per the
+                column_order given to compile(); float32 is screened
+                natively, other dtypes are converted to float64
+
+        Returns:
+            Boolean mask of rows inside every bound
+        """
+        if self._executor is None:
+            raise ValueError("compile() must be called before apply_matrix()")
+        return self._executor.run(X)
+
+    def apply_cupy(self, X_cp) -> 'cupy.ndarray':
+        """
+        Screen an on-device feature matrix with the compiled bounds.
+
+        Requires cupy; see ScreeningExecutor.run_cupy for the contract.
+
+        Args:
+            X_cp: cupy array laid out per the column_order given to
+                compile()
+
+        Returns:
+            Boolean cupy mask of rows inside every bound
+        """
+        if self._executor is None:
+            raise ValueError("compile() must be called before apply_cupy()")
+        return self._executor.run_cupy(X_cp)
+
+    def apply_columnar(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Evaluate the strategy's criteria over raw column arrays.
+
+        The columnar-first entry point: callers that already hold
+        contiguous float64 arrays (a SoA pipeline stage, a cached
+        matrix) feed them straight to the specialized predicate with
+        zero conversion — no DataFrame indexing, no row
+        materialization. Columns of other dtypes are converted once at
+        the boundary. Criteria whose metric has no column are skipped.
+
+        Args:
+            columns: Mapping of metric name to a 1-D value array; all
+                arrays must share one length
+
+        Returns:
+            Boolean mask of rows passing every applicable criterion
+        """
+        bounds_key = tuple(
+            (metric, lo, hi)
+            for metric, (lo, hi) in self._bounds.items()
+            if metric in columns
+        )
+        cols = {}
+        for metric, _, _ in bounds_key:
+            values = np.asarray(columns[metric])
+            # float32 stays float32: half the bandwidth, and the
+            # thresholds keep full float64 precision either way
+            if values.dtype not in (np.float64, np.float32):
+                values = values.astype(np.float64)
+            cols[metric] = values
+
+        if cols:
+            n = len(next(iter(cols.values())))
+        elif columns:
+            n = len(next(iter(columns.values())))
+        else:
+            n = 0
+        return _compile_frame_predicate(bounds_key)(cols, n)
+
+    def apply(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Evaluate the strategy's criteria over a metrics DataFrame.
+
+        Thin wrapper over apply_columnar: pulls each criteria column
+        out of the frame once as a float64 array, so screening N
+        tickers costs a handful of ufunc calls instead of N per-row
+        dict walks. Criteria whose metric is not a column of df are
+        skipped, mirroring how screen_stocks treats unknown metrics.
+
+        Args:
+            df: DataFrame with one row per stock and metric columns in
+                the same decimal units as the criteria (e.g. roe 0.15)
+
+        Returns:
+            Boolean mask of rows passing every applicable criterion
+        """
+        columns = {metric: df[metric].to_numpy(dtype=np.float64, copy=False)
+                   for metric in self.criteria if metric in df.columns}
+        if not columns:
+            return np.ones(len(df), dtype=bool)
+        return self.apply_columnar(columns)
+
     def __repr__(self):
         return f"{self.__class__.__name__}(name='{self.name}')"
 
 
+# Frozen defaults, shared by reference when no overrides are given
+_VALUE_DEFAULTS = MappingProxyType({
+    'pe_ratio': _bound(hi=15),
+    'pb_ratio': _bound(hi=1.5),
+    'roe': _bound(lo=0.10),
+    'debt_to_equity': _bound(hi=1.0),
+    'current_ratio': _bound(lo=1.5)
+})
+
+
 class ValueStrategy(BaseStrategy):
     """
     Value Investing Strategy
@@ -51,24 +539,26 @@ class ValueStrategy(BaseStrategy):
     Rule of Thumb: Look for stocks trading below intrinsic value
     """
     
+    __slots__ = ()
+
     def __init__(self, criteria: Dict = None):
-        default_criteria = {
-            'pe_ratio': {'max': 15},
-            'pb_ratio': {'max': 1.5},
-            'roe': {'min': 0.10},
-            'debt_to_equity': {'max': 1.0},
-            'current_ratio': {'min': 1.5}
-        }
-        if criteria:
-            default_criteria.update(criteria)
-        
         super().__init__(
             name="Value Investing",
-            criteria=default_criteria,
+            criteria=(_VALUE_DEFAULTS if not criteria
+                      else {**_VALUE_DEFAULTS, **criteria}),
             description="Find undervalued stocks with strong fundamentals"
         )
 
 
+# Frozen defaults, shared by reference when no overrides are given
+_GROWTH_DEFAULTS = MappingProxyType({
+    'revenue_growth': _bound(lo=0.15),
+    'earnings_growth': _bound(lo=0.15),
+    'pe_ratio': _bound(lo=15, hi=50),
+    'roe': _bound(lo=0.15)
+})
+
+
 class GrowthStrategy(BaseStrategy):
     """
     Growth Investing Strategy
@@ -82,23 +572,26 @@ class GrowthStrategy(BaseStrategy):
     Rule of Thumb: Growth stocks are riskier but may offer higher rewards
     """
     
+    __slots__ = ()
+
     def __init__(self, criteria: Dict = None):
-        default_criteria = {
-            'revenue_growth': {'min': 0.15},
-            'earnings_growth': {'min': 0.15},
-            'pe_ratio': {'min': 15, 'max': 50},
-            'roe': {'min': 0.15}
-        }
-        if criteria:
-            default_criteria.update(criteria)
-        
         super().__init__(
             name="Growth Investing",
-            criteria=default_criteria,
+            criteria=(_GROWTH_DEFAULTS if not criteria
+                      else {**_GROWTH_DEFAULTS, **criteria}),
             description="Find companies with high growth potential"
         )
 
 
+# Frozen defaults, shared by reference when no overrides are given
+_DIVIDEND_DEFAULTS = MappingProxyType({
+    'dividend_yield': _bound(lo=0.03),
+    'payout_ratio': _bound(hi=0.70),
+    'debt_to_equity': _bound(hi=1.0),
+    'current_ratio': _bound(lo=1.0)
+})
+
+
 class DividendStrategy(BaseStrategy):
     """
     Dividend Investing Strategy
@@ -112,23 +605,27 @@ class DividendStrategy(BaseStrategy):
     Rule of Thumb: Dividend payout <60% is sustainable
     """
     
+    __slots__ = ()
+
     def __init__(self, criteria: Dict = None):
-        default_criteria = {
-            'dividend_yield': {'min': 0.03},
-            'payout_ratio': {'max': 0.70},
-            'debt_to_equity': {'max': 1.0},
-            'current_ratio': {'min': 1.0}
-        }
-        if criteria:
-            default_criteria.update(criteria)
-        
         super().__init__(
             name="Dividend Investing",
-            criteria=default_criteria,
+            criteria=(_DIVIDEND_DEFAULTS if not criteria
+                      else {**_DIVIDEND_DEFAULTS, **criteria}),
             description="Find stocks with attractive and sustainable dividends"
         )
 
 
+# Frozen defaults, shared by reference when no overrides are given
+_QUALITY_DEFAULTS = MappingProxyType({
+    'roe': _bound(lo=0.15),
+    'roa': _bound(lo=0.10),
+    'debt_to_equity': _bound(hi=1.0),
+    'current_ratio': _bound(lo=2.0),
+    'interest_coverage': _bound(lo=5.0)
+})
+
+
 class QualityStrategy(BaseStrategy):
     """
     Quality Investing Strategy
@@ -143,24 +640,24 @@ class QualityStrategy(BaseStrategy):
     Rule of Thumb: Quality companies withstand market downturns better
     """
     
+    __slots__ = ()
+
     def __init__(self, criteria: Dict = None):
-        default_criteria = {
-            'roe': {'min': 0.15},
-            'roa': {'min': 0.10},
-            'debt_to_equity': {'max': 1.0},
-            'current_ratio': {'min': 2.0},
-            'interest_coverage': {'min': 5.0}
-        }
-        if criteria:
-            default_criteria.update(criteria)
-        
         super().__init__(
             name="Quality Investing",
-            criteria=default_criteria,
+            criteria=(_QUALITY_DEFAULTS if not criteria
+                      else {**_QUALITY_DEFAULTS, **criteria}),
             description="Find high-quality companies with strong fundamentals"
         )
 
 
+# Frozen defaults, shared by reference when no overrides are given
+_MOMENTUM_DEFAULTS = MappingProxyType({
+    'earnings_growth': _bound(lo=0.20),
+    'revenue_growth': _bound(lo=0.15)
+})
+
+
 class MomentumStrategy(BaseStrategy):
     """
     Momentum Investing Strategy
@@ -173,21 +670,27 @@ class MomentumStrategy(BaseStrategy):
     Rule of Thumb: Momentum strategies work in trending markets
     """
     
+    __slots__ = ()
+
     def __init__(self, criteria: Dict = None):
-        default_criteria = {
-            'earnings_growth': {'min': 0.20},
-            'revenue_growth': {'min': 0.15}
-        }
-        if criteria:
-            default_criteria.update(criteria)
-        
         super().__init__(
             name="Momentum Investing",
-            criteria=default_criteria,
+            criteria=(_MOMENTUM_DEFAULTS if not criteria
+                      else {**_MOMENTUM_DEFAULTS, **criteria}),
             description="Find stocks with strong price and earnings momentum"
         )
 
 
+# Frozen defaults, shared by reference when no overrides are given
+_GARP_DEFAULTS = MappingProxyType({
+    'pe_ratio': _bound(lo=10, hi=25),
+    'earnings_growth': _bound(lo=0.10),
+    'revenue_growth': _bound(lo=0.10),
+    'roe': _bound(lo=0.12),
+    'debt_to_equity': _bound(hi=1.5)
+})
+
+
 class GARPStrategy(BaseStrategy):
     """
     Growth At a Reasonable Price (GARP) Strategy
@@ -201,24 +704,127 @@ class GARPStrategy(BaseStrategy):
     Rule of Thumb: Balance growth potential with reasonable valuation
     """
     
+    __slots__ = ()
+
     def __init__(self, criteria: Dict = None):
-        default_criteria = {
-            'pe_ratio': {'min': 10, 'max': 25},
-            'earnings_growth': {'min': 0.10},
-            'revenue_growth': {'min': 0.10},
-            'roe': {'min': 0.12},
-            'debt_to_equity': {'max': 1.5}
-        }
-        if criteria:
-            default_criteria.update(criteria)
-        
         super().__init__(
             name="GARP",
-            criteria=default_criteria,
+            criteria=(_GARP_DEFAULTS if not criteria
+                      else {**_GARP_DEFAULTS, **criteria}),
             description="Find growth stocks at reasonable prices"
         )
 
 
+def screen_many(strategies: List[BaseStrategy], X: np.ndarray,
+                column_order: List[str]) -> np.ndarray:
+    """
+    Run several strategies over one metrics matrix in a single pass.
+
+    Comparing strategies the obvious way (one apply per strategy)
+    re-reads the whole matrix for each of them; here every strategy's
+    compiled bounds are packed end to end and a fused kernel sweeps X
+    once, setting bit s of each row's output word iff strategy s
+    accepts the row. Without Numba the strategies fall back to
+    per-strategy apply_matrix with the bits packed afterwards, so the
+    masks are identical either way.
+
+    Args:
+        strategies: Up to 64 strategies (one bit each in the result)
+        X: Array of shape (n_stocks, n_columns); converted to
+            contiguous float64 if needed
+        column_order: Column layout of X, passed to each strategy's
+            compile()
+
+    Returns:
+        uint64 array of length n_stocks; bit s set iff strategies[s]
+        accepts the row
+    """
+    if len(strategies) > 64:
+        raise ValueError("screen_many supports at most 64 strategies")
+    for strategy in strategies:
+        strategy.compile(column_order)
+
+    if not NUMBA_AVAILABLE:
+        out = np.zeros(X.shape[0], dtype=np.uint64)
+        for s, strategy in enumerate(strategies):
+            out |= strategy.apply_matrix(X).astype(np.uint64) << np.uint64(s)
+        return out
+
+    counts = [s._col_idx.size for s in strategies]
+    off = np.zeros(len(strategies) + 1, dtype=np.int64)
+    np.cumsum(counts, out=off[1:])
+    all_col = np.concatenate([s._col_idx for s in strategies]) \
+        if off[-1] else np.zeros(0, dtype=np.int64)
+    all_lo = np.concatenate([s._lo for s in strategies]) \
+        if off[-1] else np.zeros(0)
+    all_hi = np.concatenate([s._hi for s in strategies]) \
+        if off[-1] else np.zeros(0)
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    return screen_many_bounds(X, all_col, all_lo, all_hi, off)
+
+
+class BitmapUniverse:
+    """
+    Bit-packed screening over one fixed universe of stocks.
+
+    For very wide universes, even fused float comparisons are
+    memory-bound and every strategy re-reads the metric columns. This
+    evaluates each (metric, lo, hi) criterion once into a packed
+    bitmap -- one bit per stock -- and answers each strategy with a
+    bitwise AND over its criteria's bitmaps: 64 stocks per word at
+    roughly 1/32 the bandwidth of float masks. Criteria shared between
+    strategies (a common universe filter under several overlays) reuse
+    their cached bitmap, so only new bounds ever touch the floats.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        """
+        Args:
+            columns: Metric name -> float array; all the same length
+        """
+        self._columns = {k: np.asarray(v, dtype=np.float64)
+                         for k, v in columns.items()}
+        self.n = len(next(iter(self._columns.values()))) if columns else 0
+        # (metric, lo, hi) -> packed uint8 bitmap; padding bits are 0
+        self._bitmaps: Dict[tuple, np.ndarray] = {}
+        self._all_ones = np.packbits(np.ones(self.n, dtype=bool))
+
+    def _bitmap(self, metric: str, lo: float, hi: float) -> np.ndarray:
+        """
+        Return the packed pass-bitmap for one bound, computing it once.
+        NaN values fail every bound, matching the kernel semantics.
+        """
+        key = (metric, lo, hi)
+        packed = self._bitmaps.get(key)
+        if packed is None:
+            v = self._columns[metric]
+            packed = np.packbits((v >= lo) & (v <= hi))
+            self._bitmaps[key] = packed
+        return packed
+
+    def mask(self, strategy: 'BaseStrategy') -> np.ndarray:
+        """
+        Screen the universe with a strategy via its cached bitmaps.
+
+        Args:
+            strategy: Any BaseStrategy; criteria whose metric has no
+                column are skipped, as in apply_columnar()
+
+        Returns:
+            Boolean keep-mask of length n, identical to the float paths
+        """
+        bitmaps = []
+        for metric, (lo, hi) in strategy._bounds.items():
+            if metric not in self._columns:
+                continue
+            bitmaps.append(self._bitmap(metric, lo, hi))
+        if not bitmaps:
+            packed = self._all_ones
+        else:
+            packed = reduce(np.bitwise_and, bitmaps)
+        return np.unpackbits(packed, count=self.n).view(bool)
+
+
 # Utility function to create custom strategy
 def create_custom_strategy(name: str, criteria: Dict, description: str = "") -> BaseStrategy:
     """
@@ -235,29 +841,74 @@ def create_custom_strategy(name: str, criteria: Dict, description: str = "") ->
     return BaseStrategy(name=name, criteria=criteria, description=description)
 
 
-# Pre-defined screening profiles based on rules of thumb
+# Pre-defined screening profiles based on rules of thumb, declared once
+# as compact (metric, lo, hi) rows. Both public views derive from these
+# at import: SCREENING_PROFILES keeps the plain {'min'/'max'} dict shape
+# the API serializes, PROFILE_TABLES packs each profile into a 12-byte-
+# per-criterion record array ready for the screening kernels.
+_PROFILE_ROWS = {
+    'conservative': (
+        ('pe_ratio', None, 15),
+        ('debt_to_equity', None, 0.5),
+        ('current_ratio', 2.0, None),
+        ('roe', 0.12, None),
+        ('dividend_yield', 0.02, None),
+    ),
+    'aggressive': (
+        ('revenue_growth', 0.25, None),
+        ('earnings_growth', 0.25, None),
+        ('roe', 0.15, None),
+    ),
+    'income': (
+        ('dividend_yield', 0.04, None),
+        ('payout_ratio', None, 0.60),
+        ('debt_to_equity', None, 1.0),
+    ),
+    'balanced': (
+        ('pe_ratio', 10, 25),
+        ('debt_to_equity', None, 1.0),
+        ('current_ratio', 1.5, None),
+        ('roe', 0.10, None),
+    ),
+}
+
+# Canonical criterion numbering shared by the profile tables
+_CRITERION_IDS = {name: i for i, name in
+                  enumerate(ScreeningCriteria._fields)}
+
 SCREENING_PROFILES = {
-    'conservative': {
-        'pe_ratio': {'max': 15},
-        'debt_to_equity': {'max': 0.5},
-        'current_ratio': {'min': 2.0},
-        'roe': {'min': 0.12},
-        'dividend_yield': {'min': 0.02}
-    },
-    'aggressive': {
-        'revenue_growth': {'min': 0.25},
-        'earnings_growth': {'min': 0.25},
-        'roe': {'min': 0.15}
-    },
-    'income': {
-        'dividend_yield': {'min': 0.04},
-        'payout_ratio': {'max': 0.60},
-        'debt_to_equity': {'max': 1.0}
-    },
-    'balanced': {
-        'pe_ratio': {'min': 10, 'max': 25},
-        'debt_to_equity': {'max': 1.0},
-        'current_ratio': {'min': 1.5},
-        'roe': {'min': 0.10}
-    }
+    name: {metric: dict(_bound(lo, hi)) for metric, lo, hi in rows}
+    for name, rows in _PROFILE_ROWS.items()
+}
+
+PROFILE_TABLES = {
+    name: np.rec.array(
+        [(_CRITERION_IDS[metric],
+          -math.inf if lo is None else lo,
+          math.inf if hi is None else hi)
+         for metric, lo, hi in rows],
+        dtype=[('col', 'i4'), ('lo', 'f4'), ('hi', 'f4')]
+    )
+    for name, rows in _PROFILE_ROWS.items()
 }
+
+
+@lru_cache(maxsize=None)
+def profile_strategy(name: str) -> BaseStrategy:
+    """
+    Return the shared BaseStrategy for a screening profile.
+
+    Built once per profile name, so repeat lookups skip re-parsing the
+    criteria and reuse the strategy's compiled bound arrays.
+
+    Args:
+        name: Key into SCREENING_PROFILES
+
+    Returns:
+        The memoized BaseStrategy for that profile
+    """
+    return BaseStrategy(
+        name=name,
+        criteria=SCREENING_PROFILES[name],
+        description=f"Pre-defined '{name}' screening profile"
+    )
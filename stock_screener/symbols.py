@@ -0,0 +1,128 @@
+"""
+Symbol Validation Module
+
+Cheap O(1) guards that keep garbage ticker input away from the network
+layer. Every invalid symbol reaching yfinance costs a full HTTPS
+round-trip before failing, so the API rejects implausible symbols by
+format and remembers definitively failed lookups in a small Bloom
+filter. The filter can block a never-marked symbol at its small
+false-positive rate, and callers may mark in error, so the whole
+negative cache expires and restarts empty on a fixed interval -- no
+block outlives one filter generation.
+"""
+
+import hashlib
+import re
+import time
+from typing import Optional
+
+
+class SymbolNotFoundError(ValueError):
+    """The upstream lookup succeeded but knows no such symbol.
+
+    Raised instead of a bare ValueError when a failure is definitive,
+    so callers can negative-cache the symbol without also caching
+    transient network errors.
+    """
+
+# Ticker shapes accepted by Yahoo Finance: 1-6 letters with an optional
+# class/exchange suffix (BRK.B, RDS-A, VOD.L)
+_SYMBOL_RE = re.compile(r'^[A-Z]{1,6}([.-][A-Z0-9]{1,4})?$')
+
+
+class BloomFilter:
+    """
+    Minimal Bloom filter over strings.
+
+    False negatives are impossible -- a marked symbol is always
+    blocked -- but false positives are not: at the configured rate
+    (~1%) a symbol that was never marked can be blocked too. That is
+    acceptable for a negative cache only because the cache is rebuilt
+    on an interval, so a false positive never outlives one generation.
+    """
+
+    def __init__(self, capacity: int = 20000, num_hashes: int = 4):
+        """
+        Initialize the BloomFilter.
+
+        Args:
+            capacity: Expected number of entries
+            num_hashes: Number of hash probes per entry
+        """
+        # ~10 bits per entry keeps the false-positive rate around 1%
+        self.num_bits = capacity * 10
+        self.num_hashes = num_hashes
+        self._bits = bytearray(self.num_bits // 8 + 1)
+
+    def _positions(self, item: str):
+        digest = hashlib.md5(item.encode()).digest()
+        for i in range(self.num_hashes):
+            chunk = digest[i * 4:(i + 1) * 4]
+            yield int.from_bytes(chunk, 'little') % self.num_bits
+
+    def add(self, item: str) -> None:
+        """Mark an item as present"""
+        for pos in self._positions(item):
+            self._bits[pos // 8] |= 1 << (pos % 8)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos // 8] & (1 << (pos % 8))
+            for pos in self._positions(item)
+        )
+
+
+# Negative cache of symbols whose lookup definitively failed. Bloom
+# filters cannot delete, so the cache expires wholesale: after
+# _RESET_INTERVAL seconds the filter is replaced with an empty one,
+# bounding how long a mistaken mark or a false positive can block a
+# valid ticker.
+_RESET_INTERVAL = 3600.0
+_failed_symbols = BloomFilter()
+_filter_created = time.monotonic()
+
+
+def _current_filter() -> BloomFilter:
+    """Return the live filter, starting a fresh generation if expired"""
+    global _failed_symbols, _filter_created
+    if time.monotonic() - _filter_created > _RESET_INTERVAL:
+        _failed_symbols = BloomFilter()
+        _filter_created = time.monotonic()
+    return _failed_symbols
+
+
+def reset_failed_symbols() -> None:
+    """Drop every remembered failure immediately"""
+    global _failed_symbols, _filter_created
+    _failed_symbols = BloomFilter()
+    _filter_created = time.monotonic()
+
+
+def validate_symbol(symbol: str) -> Optional[str]:
+    """
+    Check a ticker symbol before any network call.
+
+    Args:
+        symbol: Raw symbol from the request path
+
+    Returns:
+        None if the symbol is worth looking up, otherwise a short
+        rejection reason
+    """
+    symbol = symbol.upper()
+    if not _SYMBOL_RE.match(symbol):
+        return 'invalid symbol format'
+    if symbol in _current_filter():
+        return 'unknown symbol'
+    return None
+
+
+def mark_symbol_invalid(symbol: str) -> None:
+    """
+    Record a symbol whose lookup definitively failed.
+
+    Only call this for a definitive not-found -- never for timeouts,
+    rate limits or other transient errors, which would block a valid
+    ticker for the rest of the filter generation.
+    """
+    _current_filter().add(symbol.upper())